@@ -1,5 +1,7 @@
 """应用初始化模块"""
 
+import sys
+
 from PySide6.QtWidgets import QApplication
 
 from meet_conclusion.config import get_config
@@ -30,5 +32,15 @@ def run_app() -> int:
     window = MainWindow()
     window.show()
 
+    # 退出时关闭复用的网络连接；会议管理器在首次使用时才创建，启动阶段不加载录制和处理模块
+    app.aboutToQuit.connect(_close_meeting_manager)
+
     logger.info("应用启动完成")
     return app.exec()
+
+
+def _close_meeting_manager() -> None:
+    """退出时关闭会议管理器（仅在已加载时）"""
+    module = sys.modules.get("meet_conclusion.core.meeting_manager")
+    if module is not None:
+        module.close_meeting_manager()
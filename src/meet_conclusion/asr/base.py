@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """转写片段"""
 
@@ -17,7 +17,7 @@ class TranscriptSegment:
     confidence: Optional[float] = None  # 置信度
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptResult:
     """转写结果"""
 
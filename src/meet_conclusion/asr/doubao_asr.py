@@ -3,24 +3,41 @@
 基于豆包大模型语音识别 API 的实现
 """
 
-import json
+import asyncio
+import hashlib
+import sys
 import time
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import httpx
+import orjson
 
 from meet_conclusion.asr.base import ASRProvider, TranscriptResult, TranscriptSegment
 from meet_conclusion.config import get_config
+from meet_conclusion.utils.async_runner import run_async
 from meet_conclusion.utils.logger import get_logger
+from meet_conclusion.utils.result_cache import ResultCache
 
 logger = get_logger(__name__)
 
+# 查询接口的请求体
+_EMPTY_BODY = b"{}"
+
+# 说话人编号 -> 说话人ID 的缓存（编号数量很少，无需淘汰）
+_speaker_tags: dict = {}
+
 
 class DoubaoASRProvider(ASRProvider):
     """豆包 ASR 提供者"""
 
+    _LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+    _TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+    # 轮询退避：首次间隔（秒），之后翻倍直到 poll_interval
+    _INITIAL_POLL_INTERVAL = 0.2
+
     def __init__(
         self,
         app_id: Optional[str] = None,
@@ -38,8 +55,42 @@ class DoubaoASRProvider(ASRProvider):
         self.resource_id = config.doubao_asr.resource_id
         self.submit_url = config.doubao_asr.submit_url
         self.query_url = config.doubao_asr.query_url
+        self.max_concurrency = config.doubao_asr.max_concurrency
+
+        # 请求头和请求体中固定不变的部分
+        self._base_headers = {
+            "X-Api-App-Key": self.app_id,
+            "X-Api-Access-Key": self.access_token,
+            "X-Api-Resource-Id": self.resource_id,
+            "X-Api-Sequence": "-1",
+            "Content-Type": "application/json",
+        }
+        self._body_template = {
+            "user": {
+                "uid": "meet_conclusion_user"
+            },
+            "request": {
+                "model_name": "bigmodel",
+                "enable_channel_split": True,
+                "enable_ddc": True,
+                "enable_speaker_info": True,
+                "enable_punc": True,
+                "enable_itn": True,
+            }
+        }
 
-        self._client = httpx.Client(timeout=60.0)
+        # 复用连接（HTTP/2 + keep-alive），避免每次轮询重新握手；
+        # 客户端在后台事件循环中首次使用时创建
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 识别结果缓存（避免重复提交相同音频）
+        self._cache: Optional[ResultCache] = None
+        if config.doubao_asr.cache_enabled:
+            self._cache = ResultCache(
+                config.cache_dir / "asr_cache.sqlite",
+                max_entries=config.doubao_asr.cache_max_entries,
+            )
 
     @property
     def name(self) -> str:
@@ -51,16 +102,22 @@ class DoubaoASRProvider(ASRProvider):
 
     def _build_headers(self, task_id: str, sequence: str = "-1") -> dict:
         """构建请求头"""
-        return {
-            "X-Api-App-Key": self.app_id,
-            "X-Api-Access-Key": self.access_token,
-            "X-Api-Resource-Id": self.resource_id,
-            "X-Api-Request-Id": task_id,
-            "X-Api-Sequence": sequence,
-            "Content-Type": "application/json",
-        }
+        headers = self._base_headers.copy()
+        headers["X-Api-Request-Id"] = task_id
+        if sequence != "-1":
+            headers["X-Api-Sequence"] = sequence
+        return headers
 
-    def _submit_task(self, audio_url: str) -> tuple[str, str]:
+    def _build_request_body(self, audio_url: str) -> dict:
+        """构建提交任务的请求体
+
+        只有音频地址随请求变化，其余部分共用模板（序列化时只读，不会被修改）
+        """
+        body = self._body_template.copy()
+        body["audio"] = {"url": audio_url}
+        return body
+
+    async def _submit_task_async(self, audio_url: str) -> tuple[str, str]:
         """提交转写任务
 
         Args:
@@ -72,30 +129,20 @@ class DoubaoASRProvider(ASRProvider):
         task_id = str(uuid.uuid4())
         headers = self._build_headers(task_id)
 
-        request_body = {
-            "user": {
-                "uid": "meet_conclusion_user"
-            },
-            "audio": {
-                "url": audio_url,
-            },
-            "request": {
-                "model_name": "bigmodel",
-                "enable_channel_split": True,
-                "enable_ddc": True,
-                "enable_speaker_info": True,
-                "enable_punc": True,
-                "enable_itn": True,
-            }
-        }
-
         logger.info(f"提交 ASR 任务: {task_id}")
-        response = self._client.post(
+        response = await self._get_async_client().post(
             self.submit_url,
             headers=headers,
-            content=json.dumps(request_body),
+            content=orjson.dumps(self._build_request_body(audio_url)),
         )
+        return self._handle_submit_response(response, task_id)
+
+    def _handle_submit_response(self, response: httpx.Response, task_id: str) -> tuple[str, str]:
+        """解析提交响应
 
+        Returns:
+            (task_id, x_tt_logid)
+        """
         status_code = response.headers.get("X-Api-Status-Code", "")
         x_tt_logid = response.headers.get("X-Tt-Logid", "")
 
@@ -107,7 +154,9 @@ class DoubaoASRProvider(ASRProvider):
             logger.error(f"ASR 任务提交失败: {message}")
             raise RuntimeError(f"提交 ASR 任务失败: {message}")
 
-    def _query_task(self, task_id: str, x_tt_logid: str) -> tuple[str, Optional[dict]]:
+    async def _query_task_async(
+        self, task_id: str, x_tt_logid: str
+    ) -> tuple[str, Optional[dict]]:
         """查询任务状态
 
         Args:
@@ -120,18 +169,23 @@ class DoubaoASRProvider(ASRProvider):
         headers = self._build_headers(task_id)
         headers["X-Tt-Logid"] = x_tt_logid
 
-        response = self._client.post(
-            self.query_url,
-            headers=headers,
-            content=json.dumps({}),
+        response = await self._get_async_client().post(
+            self.query_url, headers=headers, content=_EMPTY_BODY
         )
+        return self._handle_query_response(response)
 
+    def _handle_query_response(self, response: httpx.Response) -> tuple[str, Optional[dict]]:
+        """解析查询响应
+
+        Returns:
+            (status_code, result_data)
+        """
         status_code = response.headers.get("X-Api-Status-Code", "")
         message = response.headers.get("X-Api-Message", "")
 
         if status_code == "20000000":
             # 任务完成
-            return status_code, response.json()
+            return status_code, orjson.loads(response.content)
         elif status_code in ("20000001", "20000002"):
             # 任务进行中
             logger.debug(f"ASR 任务进行中: {message}")
@@ -140,7 +194,7 @@ class DoubaoASRProvider(ASRProvider):
             logger.error(f"ASR 任务查询失败: {message}")
             raise RuntimeError(f"查询 ASR 任务失败: {message}")
 
-    def _wait_for_result(
+    async def _wait_for_result_async(
         self,
         task_id: str,
         x_tt_logid: str,
@@ -149,28 +203,65 @@ class DoubaoASRProvider(ASRProvider):
     ) -> dict:
         """等待任务完成
 
+        轮询间隔从 0.2 秒开始翻倍，最长为 poll_interval；
+        多个任务可以在同一个事件循环中并发轮询
+
         Args:
             task_id: 任务ID
             x_tt_logid: 日志ID
             timeout: 超时时间（秒）
-            poll_interval: 轮询间隔（秒）
+            poll_interval: 最大轮询间隔（秒）
 
         Returns:
             识别结果
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        interval = self._INITIAL_POLL_INTERVAL
 
         while True:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > timeout:
                 raise TimeoutError(f"ASR 任务超时: {task_id}")
 
-            status_code, result = self._query_task(task_id, x_tt_logid)
+            status_code, result = await self._query_task_async(task_id, x_tt_logid)
 
             if status_code == "20000000" and result:
                 return result
 
-            time.sleep(poll_interval)
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, poll_interval)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """获取异步客户端
+
+        连接池绑定在创建它的事件循环上，换了事件循环时重新创建
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                limits=self._LIMITS,
+                timeout=self._TIMEOUT,
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """关闭异步客户端"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    @staticmethod
+    def _speaker_tag(speaker_id) -> Optional[str]:
+        """将 API 返回的说话人编号转换为说话人ID"""
+        if speaker_id is None:
+            return None
+        tag = _speaker_tags.get(speaker_id)
+        if tag is None:
+            tag = _speaker_tags[speaker_id] = sys.intern(f"S{speaker_id}")
+        return tag
 
     def _parse_result(self, result: dict, t_start: float) -> TranscriptResult:
         """解析识别结果
@@ -182,31 +273,24 @@ class DoubaoASRProvider(ASRProvider):
         Returns:
             转写结果
         """
-        segments = []
-        full_text_parts = []
-
         # 解析 utterances
         utterances = result.get("result", {}).get("utterances", [])
-
-        for utt in utterances:
-            text = utt.get("text", "")
-            if not text.strip():
-                continue
-
-            start_time = utt.get("start_time", 0) / 1000.0 + t_start  # 转换为秒
-            end_time = utt.get("end_time", 0) / 1000.0 + t_start
-            speaker_id = utt.get("speaker_info", {}).get("speaker_id", None)
-            confidence = utt.get("confidence", None)
-
-            segment = TranscriptSegment(
-                start_time=start_time,
-                end_time=end_time,
-                text=text,
-                speaker_id=f"S{speaker_id}" if speaker_id is not None else None,
-                confidence=confidence,
+        speaker_tag = self._speaker_tag
+        segment_cls = TranscriptSegment
+        no_speaker = {}
+
+        # 毫秒转换为秒并叠加偏移
+        segments = [
+            segment_cls(
+                utt.get("start_time", 0) / 1000.0 + t_start,
+                utt.get("end_time", 0) / 1000.0 + t_start,
+                text,
+                speaker_tag(utt.get("speaker_info", no_speaker).get("speaker_id")),
+                utt.get("confidence"),
             )
-            segments.append(segment)
-            full_text_parts.append(text)
+            for utt in utterances
+            if (text := utt.get("text", "")).strip()
+        ]
 
         # 计算总时长
         duration = 0.0
@@ -215,7 +299,7 @@ class DoubaoASRProvider(ASRProvider):
 
         return TranscriptResult(
             segments=segments,
-            full_text="".join(full_text_parts),
+            full_text="".join([seg.text for seg in segments]),
             duration=duration,
             language="zh-CN",
         )
@@ -224,25 +308,99 @@ class DoubaoASRProvider(ASRProvider):
         self,
         audio_url: str,
         t_start: float = 0.0,
+        cache_key: Optional[str] = None,
     ) -> TranscriptResult:
         """转写音频URL
 
+        在后台事件循环中执行，调用线程阻塞等待结果
+
         Args:
             audio_url: 音频URL
             t_start: 起始时间偏移（秒）
+            cache_key: 缓存键（如音频数据的 SHA-256），默认使用 URL 的摘要
 
         Returns:
             转写结果
         """
-        # 提交任务
-        task_id, x_tt_logid = self._submit_task(audio_url)
+        return run_async(self.transcribe_url_async(audio_url, t_start, cache_key))
 
-        # 等待结果
-        result = self._wait_for_result(task_id, x_tt_logid)
+    async def transcribe_url_async(
+        self,
+        audio_url: str,
+        t_start: float = 0.0,
+        cache_key: Optional[str] = None,
+    ) -> TranscriptResult:
+        """转写音频URL（异步）
+
+        Args:
+            audio_url: 音频URL
+            t_start: 起始时间偏移（秒）
+            cache_key: 缓存键，默认使用 URL 的摘要
+
+        Returns:
+            转写结果
+        """
+        if cache_key is None:
+            cache_key = hashlib.sha256(audio_url.encode("utf-8")).hexdigest()
+
+        # 缓存的是 API 原始结果，时间偏移在解析时再叠加
+        result = self._cache.get(cache_key) if self._cache else None
+        if result is not None:
+            logger.info(f"ASR 结果命中缓存: {cache_key[:12]}")
+            return self._parse_result(result, t_start)
+
+        task_id, x_tt_logid = await self._submit_task_async(audio_url)
+        result = await self._wait_for_result_async(task_id, x_tt_logid)
+
+        if self._cache:
+            self._cache.put(cache_key, result)
 
-        # 解析结果
         return self._parse_result(result, t_start)
 
+    async def transcribe_urls(
+        self,
+        audio_urls: list[str],
+        t_starts: Optional[list[float]] = None,
+        max_concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[int, TranscriptResult], None]] = None,
+    ) -> list[TranscriptResult]:
+        """并发转写多个音频URL
+
+        所有任务先行提交，服务端并行处理，客户端在同一事件循环中并发轮询
+
+        Args:
+            audio_urls: 音频URL列表
+            t_starts: 各音频的起始时间偏移（秒），默认均为 0
+            max_concurrency: 最大并发任务数，默认从配置读取
+            on_result: 单个音频转写完成时的回调 (index, result)，按完成顺序调用
+
+        Returns:
+            转写结果列表，顺序与 audio_urls 一致
+        """
+        if t_starts is None:
+            t_starts = [0.0] * len(audio_urls)
+        if len(t_starts) != len(audio_urls):
+            raise ValueError("t_starts 与 audio_urls 长度不一致")
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def transcribe_one(index: int, url: str, t_start: float) -> TranscriptResult:
+            async with semaphore:
+                result = await self.transcribe_url_async(url, t_start)
+            if on_result:
+                try:
+                    on_result(index, result)
+                except Exception as e:
+                    logger.error(f"转写结果回调执行失败: {e}")
+            return result
+
+        return await asyncio.gather(
+            *(
+                transcribe_one(i, url, t)
+                for i, (url, t) in enumerate(zip(audio_urls, t_starts))
+            )
+        )
+
     def transcribe(
         self,
         audio_path: Path,
@@ -268,7 +426,10 @@ class DoubaoASRProvider(ASRProvider):
 
     def close(self):
         """关闭客户端"""
-        self._client.close()
+        if self._async_client is not None:
+            run_async(self.aclose())
+        if self._cache:
+            self._cache.close()
 
     def __enter__(self):
         return self
@@ -3,13 +3,23 @@
 将多个切片的转写结果合并为完整的会议转写
 """
 
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
 from typing import Optional
 
+from rapidfuzz import fuzz
+
 from meet_conclusion.asr.base import TranscriptResult, TranscriptSegment
+from meet_conclusion.utils import logger as logger_module
 from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_start_time = attrgetter("start_time")
+
+# 判定为重复片段的文本相似度阈值
+_DUPLICATE_SIMILARITY = 0.7
+
 
 class TranscriptMerger:
     """转写结果合并器"""
@@ -21,7 +31,15 @@ class TranscriptMerger:
             overlap_threshold: 重叠检测阈值（秒），用于去重
         """
         self.overlap_threshold = overlap_threshold
+        # 按开始时间有序保存的片段
         self._segments: list[TranscriptSegment] = []
+        # 与 _segments 一一对应的开始时间和去除空白后的文本，避免重复计算
+        self._starts: list[float] = []
+        self._norms: list[str] = []
+        # 按说话人分组的片段，组内同样按开始时间有序
+        self._by_speaker: dict[str, list[TranscriptSegment]] = {}
+        # 已保存片段的最大时长，用于确定时间重叠的查找范围
+        self._max_duration = 0.0
 
     def add_result(self, result: TranscriptResult) -> None:
         """添加转写结果
@@ -38,32 +56,59 @@ class TranscriptMerger:
         Args:
             new_segment: 新片段
         """
-        if not self._segments:
-            self._segments.append(new_segment)
-            return
+        new_norm = self._normalize(new_segment.text)
 
-        # 检查是否与最后几个片段重叠
+        # 与新片段的时间重叠超过阈值的片段，其开始时间一定落在
+        # [new.start + threshold - max_duration, new.end - threshold) 范围内
+        threshold = self.overlap_threshold
+        lo = bisect_left(self._starts, new_segment.start_time + threshold - self._max_duration)
+        hi = bisect_left(self._starts, new_segment.end_time - threshold)
+
+        # 检查是否与时间相邻的片段重叠（空文本不可能判定为重复）
         is_duplicate = False
-        for i in range(min(5, len(self._segments))):
-            existing = self._segments[-(i + 1)]
+        for i in range(lo, hi if new_norm else lo):
+            existing = self._segments[i]
 
             # 检查时间重叠
             time_overlap = self._calculate_time_overlap(existing, new_segment)
-            if time_overlap > self.overlap_threshold:
+            if time_overlap > threshold:
                 # 检查文本相似度
-                text_similarity = self._calculate_text_similarity(
-                    existing.text, new_segment.text
+                text_similarity = self._overlap_similarity(
+                    self._norms[i], new_norm, cutoff=_DUPLICATE_SIMILARITY
                 )
-                if text_similarity > 0.7:
+                if text_similarity > _DUPLICATE_SIMILARITY:
                     is_duplicate = True
-                    logger.debug(
-                        f"检测到重复片段: '{new_segment.text[:30]}...' "
-                        f"(时间重叠: {time_overlap:.2f}s, 相似度: {text_similarity:.2f})"
-                    )
+                    if logger_module.DEBUG:
+                        logger.debug(
+                            f"检测到重复片段: '{new_segment.text[:30]}...' "
+                            f"(时间重叠: {time_overlap:.2f}s, 相似度: {text_similarity:.2f})"
+                        )
                     break
 
         if not is_duplicate:
-            self._segments.append(new_segment)
+            self._insert(new_segment, new_norm)
+
+    def _insert(self, segment: TranscriptSegment, norm: str) -> None:
+        """按开始时间有序插入片段"""
+        # 开始时间相同的片段保持添加顺序
+        index = bisect_right(self._starts, segment.start_time)
+        self._segments.insert(index, segment)
+        self._starts.insert(index, segment.start_time)
+        self._norms.insert(index, norm)
+
+        speaker = segment.speaker_id or "Unknown"
+        speaker_segments = self._by_speaker.get(speaker)
+        if speaker_segments is None:
+            self._by_speaker[speaker] = [segment]
+        elif speaker_segments[-1].start_time <= segment.start_time:
+            # 通常按时间顺序到达，直接追加
+            speaker_segments.append(segment)
+        else:
+            insort(speaker_segments, segment, key=_start_time)
+
+        duration = segment.end_time - segment.start_time
+        if duration > self._max_duration:
+            self._max_duration = duration
 
     def _calculate_time_overlap(
         self,
@@ -79,35 +124,46 @@ class TranscriptMerger:
         overlap_end = min(seg1.end_time, seg2.end_time)
         return max(0, overlap_end - overlap_start)
 
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """计算两段文本的相似度
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """去除文本中的空白字符"""
+        if not text:
+            return ""
+        return text.replace(" ", "").replace("\n", "")
 
-        使用简单的字符级别 Jaccard 相似度
+    @staticmethod
+    def _overlap_similarity(text1: str, text2: str, cutoff: float = 0.0) -> float:
+        """计算重叠区域的文本相似度
+
+        使用 partial_ratio，较短文本被较长文本包含时也能判定为重复
+
+        Args:
+            text1: 已去除空白的文本
+            text2: 已去除空白的文本
+            cutoff: 相似度下限，确定低于该值时提前结束计算并返回 0
 
         Returns:
             相似度 (0-1)
         """
         if not text1 or not text2:
             return 0.0
+        return fuzz.partial_ratio(text1, text2, score_cutoff=cutoff * 100) / 100.0
 
-        # 移除空白字符
-        text1 = text1.replace(" ", "").replace("\n", "")
-        text2 = text2.replace(" ", "").replace("\n", "")
-
-        if not text1 or not text2:
-            return 0.0
+    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
+        """计算两段文本的相似度
 
-        # 使用字符集合计算 Jaccard 相似度
-        set1 = set(text1)
-        set2 = set(text2)
+        使用基于编辑距离的归一化相似度
 
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        Returns:
+            相似度 (0-1)
+        """
+        text1 = self._normalize(text1)
+        text2 = self._normalize(text2)
 
-        if union == 0:
+        if not text1 or not text2:
             return 0.0
 
-        return intersection / union
+        return fuzz.ratio(text1, text2) / 100.0
 
     def get_merged_result(self) -> TranscriptResult:
         """获取合并后的结果
@@ -115,8 +171,8 @@ class TranscriptMerger:
         Returns:
             合并后的转写结果
         """
-        # 按时间排序
-        sorted_segments = sorted(self._segments, key=lambda s: s.start_time)
+        # 片段已按时间排序
+        sorted_segments = list(self._segments)
 
         # 构建完整文本
         full_text_parts = [seg.text for seg in sorted_segments]
@@ -135,31 +191,29 @@ class TranscriptMerger:
         )
 
     def get_segments(self) -> list[TranscriptSegment]:
-        """获取所有片段"""
-        return sorted(self._segments, key=lambda s: s.start_time)
+        """获取所有片段
+
+        返回按时间排序的内部列表，调用方不应修改
+        """
+        return self._segments
 
     def get_segments_by_speaker(self) -> dict[str, list[TranscriptSegment]]:
         """按说话人分组获取片段
 
+        返回内部维护的分组，各组已按时间排序，调用方不应修改
+
         Returns:
             {speaker_id: [segments]}
         """
-        result: dict[str, list[TranscriptSegment]] = {}
-        for segment in self._segments:
-            speaker = segment.speaker_id or "Unknown"
-            if speaker not in result:
-                result[speaker] = []
-            result[speaker].append(segment)
-
-        # 每个说话人的片段按时间排序
-        for speaker in result:
-            result[speaker].sort(key=lambda s: s.start_time)
-
-        return result
+        return self._by_speaker
 
     def clear(self) -> None:
         """清空所有片段"""
         self._segments.clear()
+        self._starts.clear()
+        self._norms.clear()
+        self._by_speaker.clear()
+        self._max_duration = 0.0
 
     def segment_count(self) -> int:
         """获取片段数量"""
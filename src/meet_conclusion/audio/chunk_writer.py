@@ -1,24 +1,46 @@
 """音频切片写入模块
 
-将音频数据按固定时长切片并保存为 WAV 文件
+将音频数据按固定时长切片并保存为 WAV（或 FLAC）文件
 """
 
-import wave
+import os
+import queue
+import struct
 import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
 
-from meet_conclusion.audio.audio_buffer import AudioBuffer
+import numpy as np
+import soundfile as sf
+
 from meet_conclusion.config import get_config
 from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 44 字节 PCM WAV 文件头
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_HEADER_SIZE = _WAV_HEADER.size
+
+# 以二进制方式打开（Windows 下需要 O_BINARY）
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Windows 不支持 writev，退化为逐段写入
+_HAS_WRITEV = hasattr(os, "writev")
+
+# 写入线程的停止标记
+_STOP = object()
+
 
 class ChunkInfo:
     """切片信息"""
 
+    __slots__ = (
+        "index", "file_path", "start_time", "end_time",
+        "start_datetime", "duration", "is_silent",
+    )
+
     def __init__(
         self,
         index: int,
@@ -26,6 +48,7 @@ class ChunkInfo:
         start_time: float,
         end_time: float,
         start_datetime: datetime,
+        is_silent: bool = False,
     ):
         self.index = index
         self.file_path = file_path
@@ -33,10 +56,16 @@ class ChunkInfo:
         self.end_time = end_time
         self.start_datetime = start_datetime  # 绝对时间
         self.duration = end_time - start_time
+        self.is_silent = is_silent  # 是否为静音切片（无需送 ASR）
 
 
 class ChunkWriter:
-    """音频切片写入器"""
+    """音频切片写入器
+
+    音频数据在写入时直接追加到当前切片的 WAV 文件中，达到切片时长后
+    关闭文件并开始下一个切片，内存中只保留下一个切片所需的重叠数据。
+    磁盘写入和切片就绪回调都在独立的写入线程中执行，不阻塞音频采集线程
+    """
 
     def __init__(
         self,
@@ -63,6 +92,8 @@ class ChunkWriter:
         self.channels = channels or config.audio.channels
         self.chunk_duration = chunk_duration or config.audio.chunk_duration
         self.overlap_duration = overlap_duration or config.audio.overlap_duration
+        self.silence_rms_threshold = config.audio.silence_rms_threshold
+        self.chunk_format = config.audio.chunk_format
 
         self.on_chunk_ready = on_chunk_ready
 
@@ -70,24 +101,40 @@ class ChunkWriter:
         self.output_dir = config.chunks_dir / str(meeting_id)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 缓冲区
-        self._buffer = AudioBuffer(
-            max_seconds=self.chunk_duration * 2,
-            sample_rate=self.sample_rate,
-            channels=self.channels,
-        )
-
         # 状态
         self._chunk_index = 0
         self._start_datetime: Optional[datetime] = None
         self._is_running = False
         self._lock = threading.Lock()
 
+        # 字节相关计算（按帧对齐，避免切断采样点）
+        frame_bytes = self.channels * 2  # 16-bit
+        self.bytes_per_second = self.sample_rate * frame_bytes
+        self._chunk_bytes = int(self.chunk_duration * self.bytes_per_second)
+        self._chunk_bytes -= self._chunk_bytes % frame_bytes
+        self._overlap_bytes = int(self.overlap_duration * self.bytes_per_second)
+        self._overlap_bytes -= self._overlap_bytes % frame_bytes
+        # 重叠区间在切片内的起始位置
+        self._overlap_start = self._chunk_bytes - self._overlap_bytes
+
+        # 当前切片
+        self._chunk_open = False
+        self._fd: Optional[int] = None  # WAV 文件描述符
+        self._sf: Optional[sf.SoundFile] = None  # FLAC 编码器
+        self._file_path: Optional[Path] = None
+        self._bytes_in_chunk = 0  # 当前切片中的新数据字节数（不含重叠部分）
+        self._chunk_file_bytes = 0  # 当前切片文件中的总字节数
+        self._sum_squares = 0  # 当前切片采样值的平方和，用于计算 RMS
+
         # 重叠缓冲（保存上一个切片末尾的数据）
-        self._overlap_data: bytes = b""
+        self._overlap_data = bytearray()
 
-        # 字节相关计算
-        self.bytes_per_second = self.sample_rate * self.channels * 2  # 16-bit
+        # 累计接收的总字节数
+        self._total_received_bytes = 0
+
+        # 写入队列和写入线程
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
 
     def start(self) -> None:
         """开始切片"""
@@ -95,99 +142,266 @@ class ChunkWriter:
             self._is_running = True
             self._start_datetime = datetime.now()
             self._chunk_index = 0
-            self._overlap_data = b""
-            self._buffer.reset()
+            self._overlap_data = bytearray()
+            self._total_received_bytes = 0
+            self._queue = queue.SimpleQueue()
+
+            self._thread = threading.Thread(
+                target=self._write_loop,
+                name=f"ChunkWriter-{self.meeting_id}",
+                daemon=True,
+            )
+            self._thread.start()
             logger.info(f"切片写入器已启动，会议ID: {self.meeting_id}")
 
     def write(self, data: bytes) -> None:
         """写入音频数据
 
+        数据只放入写入队列，由写入线程写盘
+
         Args:
             data: 音频数据
         """
         if not self._is_running:
             return
 
-        self._buffer.write(data)
-
-        # 检查是否达到切片时长
-        if self._buffer.available_seconds() >= self.chunk_duration:
-            self._save_chunk()
-
-    def _save_chunk(self) -> None:
-        """保存当前切片"""
         with self._lock:
             if not self._is_running:
                 return
 
-            # 读取一个切片时长的数据
-            chunk_bytes = int(self.chunk_duration * self.bytes_per_second)
-            data = self._buffer.read(chunk_bytes)
+            self._total_received_bytes += len(data)
+            self._queue.put(data)
 
-            if not data:
-                return
+    def _write_loop(self) -> None:
+        """写入线程主循环"""
+        get = self._queue.get
+        consume = self._consume
+        while True:
+            data = get()
+            if data is _STOP:
+                break
 
-            # 在数据前加上重叠部分
-            if self._overlap_data:
-                data = self._overlap_data + data
+            try:
+                consume(data)
+            except Exception as e:
+                # 出错时丢弃当前切片，后续数据写入新的切片
+                logger.error(f"切片写入失败: {e}")
+                self._discard_chunk()
 
-            # 保存重叠数据
-            overlap_bytes = int(self.overlap_duration * self.bytes_per_second)
-            if len(data) > overlap_bytes:
-                self._overlap_data = data[-overlap_bytes:]
-            else:
-                self._overlap_data = data
+    def _consume(self, data: bytes) -> None:
+        """将数据写入切片文件，切片写满时关闭并触发回调
 
-            # 计算时间
-            start_time = self._chunk_index * self.chunk_duration
-            if self._chunk_index > 0:
-                start_time -= self.overlap_duration  # 考虑重叠
-
-            end_time = start_time + len(data) / self.bytes_per_second
+        Args:
+            data: 音频数据
+        """
+        view = memoryview(data)
+
+        chunk_bytes = self._chunk_bytes
+
+        while view:
+            if not self._chunk_open:
+                self._open_chunk()
+
+            # 写入不超过当前切片剩余容量的数据
+            space = chunk_bytes - self._bytes_in_chunk
+            part, view = view[:space], view[space:]
+            self._append(part)
+
+            if self._bytes_in_chunk >= chunk_bytes:
+                self._notify_chunk_ready(self._close_chunk())
+
+    def _discard_chunk(self) -> None:
+        """关闭当前切片文件而不生成切片信息"""
+        if self._chunk_open:
+            try:
+                if self._sf is not None:
+                    self._sf.close()
+                else:
+                    os.close(self._fd)
+            except (OSError, RuntimeError):
+                pass
+            self._fd = None
+            self._sf = None
+            self._chunk_open = False
+        self._overlap_data = bytearray()
+
+    def _build_header(self, data_bytes: int) -> bytes:
+        """构建 WAV 文件头
 
-            # 生成文件名
-            file_path = self.output_dir / f"chunk_{self._chunk_index:04d}.wav"
+        Args:
+            data_bytes: 音频数据字节数
 
-            # 保存 WAV 文件
-            self._save_wav(file_path, data)
+        Returns:
+            44 字节的文件头
+        """
+        block_align = self.channels * 2  # 16-bit
+        return _WAV_HEADER.pack(
+            b"RIFF", 36 + data_bytes, b"WAVE",
+            b"fmt ", 16, 1, self.channels, self.sample_rate,
+            self.sample_rate * block_align, block_align, 16,
+            b"data", data_bytes,
+        )
 
-            # 创建切片信息
-            chunk_info = ChunkInfo(
-                index=self._chunk_index,
-                file_path=file_path,
-                start_time=max(0, start_time),
-                end_time=end_time,
-                start_datetime=self._start_datetime,
-            )
+    def _open_chunk(self) -> None:
+        """打开新的切片文件，并写入文件头和上一切片的重叠数据"""
+        self._file_path = self.output_dir / f"chunk_{self._chunk_index:04d}.{self.chunk_format}"
+        try:
+            if self.chunk_format == "flac":
+                # FLAC 边写边编码，文件头由 libsndfile 维护
+                self._sf = sf.SoundFile(
+                    str(self._file_path), "w",
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    subtype="PCM_16",
+                    format="FLAC",
+                )
+            else:
+                self._fd = os.open(self._file_path, _OPEN_FLAGS, 0o644)
+        except (OSError, RuntimeError) as e:
+            logger.error(f"创建音频文件失败: {e}")
+            raise
+        self._chunk_open = True
+
+        self._bytes_in_chunk = 0
+        self._chunk_file_bytes = 0
+        self._sum_squares = 0
+
+        # WAV 文件头中的长度先写 0，关闭时再修正；重叠数据与文件头一次写入
+        overlap = self._overlap_data
+        self._overlap_data = bytearray()
+        if self._sf is not None:
+            self._write_buffers([overlap])
+        else:
+            self._write_buffers([self._build_header(0), overlap])
+        if overlap:
+            self._accumulate_energy(overlap)
+            self._chunk_file_bytes += len(overlap)
+
+    def _append(self, data: memoryview) -> None:
+        """追加新数据到当前切片
 
-            logger.info(f"保存切片 {self._chunk_index}: {file_path.name}, "
-                       f"时长: {chunk_info.duration:.1f}s")
+        Args:
+            data: 音频数据
+        """
+        # 保存落在切片末尾重叠区间内的数据，作为下一个切片的开头
+        start = self._bytes_in_chunk
+        end = start + len(data)
+        window_start = self._overlap_start
+        if end > window_start and self._overlap_bytes:
+            self._overlap_data += data[window_start - start if start < window_start else 0:]
+
+        self._write_frames(data)
+        self._bytes_in_chunk = end
+
+    def _write_frames(self, data) -> None:
+        """写入帧数据（文件头在关闭时统一修正）"""
+        self._write_buffers([data])
+        self._accumulate_energy(data)
+        self._chunk_file_bytes += len(data)
+
+    def _accumulate_energy(self, data) -> None:
+        """累加采样值的平方和"""
+        samples = np.frombuffer(data, dtype=np.int16, count=len(data) // 2).astype(np.int64)
+        self._sum_squares += int(np.dot(samples, samples))
+
+    def _is_silent(self) -> bool:
+        """根据 RMS 能量判断当前切片是否为静音"""
+        if self.silence_rms_threshold <= 0:
+            return False
+        num_samples = self._chunk_file_bytes // 2
+        if not num_samples:
+            return True
+        rms = (self._sum_squares / num_samples) ** 0.5
+        return rms < self.silence_rms_threshold
+
+    def _write_buffers(self, buffers: list) -> None:
+        """将多个缓冲区依次写入当前切片文件
+
+        支持 writev 的平台上合并为一次系统调用
 
-            self._chunk_index += 1
+        Args:
+            buffers: 缓冲区列表
+        """
+        if self._sf is not None:
+            try:
+                for buf in buffers:
+                    if len(buf):
+                        self._sf.buffer_write(buf, dtype="int16")
+            except RuntimeError as e:
+                logger.error(f"写入 FLAC 文件失败: {e}")
+                raise
+            return
 
-            # 触发回调
-            if self.on_chunk_ready:
-                try:
-                    self.on_chunk_ready(chunk_info)
-                except Exception as e:
-                    logger.error(f"切片回调执行失败: {e}")
+        try:
+            if _HAS_WRITEV:
+                total = sum(len(b) for b in buffers)
+                written = os.writev(self._fd, buffers)
+                if written == total:
+                    return
+                # 部分写入时，剩余部分逐段写
+                buffers = [memoryview(b"".join(buffers))[written:]]
+
+            for buf in buffers:
+                data = memoryview(buf)
+                while data:
+                    data = data[os.write(self._fd, data):]
+        except OSError as e:
+            logger.error(f"写入 WAV 文件失败: {e}")
+            raise
 
-    def _save_wav(self, file_path: Path, data: bytes) -> None:
-        """保存 WAV 文件
+    def _close_chunk(self) -> ChunkInfo:
+        """关闭当前切片文件
 
-        Args:
-            file_path: 文件路径
-            data: 音频数据
+        Returns:
+            切片信息
         """
         try:
-            with wave.open(str(file_path), "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(self.sample_rate)
-                wf.writeframes(data)
-        except Exception as e:
-            logger.error(f"保存 WAV 文件失败: {e}")
+            if self._sf is not None:
+                self._sf.close()
+            else:
+                # 修正文件头中的长度字段
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, self._build_header(self._chunk_file_bytes))
+        except (OSError, RuntimeError) as e:
+            logger.error(f"保存音频文件失败: {e}")
             raise
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+            self._fd = None
+            self._sf = None
+            self._chunk_open = False
+
+        # 计算时间
+        start_time = self._chunk_index * self.chunk_duration
+        if self._chunk_index > 0:
+            start_time -= self.overlap_duration  # 考虑重叠
+
+        end_time = start_time + self._chunk_file_bytes / self.bytes_per_second
+
+        chunk_info = ChunkInfo(
+            index=self._chunk_index,
+            file_path=self._file_path,
+            start_time=max(0, start_time),
+            end_time=end_time,
+            start_datetime=self._start_datetime,
+            is_silent=self._is_silent(),
+        )
+
+        logger.info(f"保存切片 {self._chunk_index}: {self._file_path.name}, "
+                   f"时长: {chunk_info.duration:.1f}s"
+                   f"{'（静音）' if chunk_info.is_silent else ''}")
+
+        self._chunk_index += 1
+        return chunk_info
+
+    def _notify_chunk_ready(self, chunk_info: ChunkInfo) -> None:
+        """触发切片就绪回调"""
+        if self.on_chunk_ready:
+            try:
+                self.on_chunk_ready(chunk_info)
+            except Exception as e:
+                logger.error(f"切片回调执行失败: {e}")
 
     def stop(self) -> Optional[ChunkInfo]:
         """停止切片并保存剩余数据
@@ -200,44 +414,26 @@ class ChunkWriter:
                 return None
 
             self._is_running = False
+            self._queue.put(_STOP)
 
-            # 保存剩余数据
-            remaining_data = self._buffer.read()
-            if remaining_data:
-                # 加上重叠数据
-                if self._overlap_data:
-                    remaining_data = self._overlap_data + remaining_data
-
-                start_time = self._chunk_index * self.chunk_duration
-                if self._chunk_index > 0:
-                    start_time -= self.overlap_duration
-
-                end_time = start_time + len(remaining_data) / self.bytes_per_second
-
-                file_path = self.output_dir / f"chunk_{self._chunk_index:04d}.wav"
-                self._save_wav(file_path, remaining_data)
-
-                chunk_info = ChunkInfo(
-                    index=self._chunk_index,
-                    file_path=file_path,
-                    start_time=max(0, start_time),
-                    end_time=end_time,
-                    start_datetime=self._start_datetime,
-                )
-
-                logger.info(f"保存最后切片 {self._chunk_index}: {file_path.name}, "
-                           f"时长: {chunk_info.duration:.1f}s")
+        # 等待写入线程处理完队列中的数据
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
-                if self.on_chunk_ready:
-                    try:
-                        self.on_chunk_ready(chunk_info)
-                    except Exception as e:
-                        logger.error(f"切片回调执行失败: {e}")
+        # 保存剩余数据
+        chunk_info = None
+        if self._chunk_open:
+            chunk_info = self._close_chunk()
+        self._overlap_data = bytearray()
 
-                return chunk_info
+        if chunk_info:
+            logger.info(f"最后切片 {chunk_info.index} 已保存")
+            self._notify_chunk_ready(chunk_info)
+            return chunk_info
 
-            logger.info("切片写入器已停止")
-            return None
+        logger.info("切片写入器已停止")
+        return None
 
     def get_chunk_count(self) -> int:
         """获取已生成的切片数"""
@@ -245,7 +441,7 @@ class ChunkWriter:
 
     def get_total_duration(self) -> float:
         """获取已录制的总时长（秒）"""
-        return self._buffer.total_received_seconds()
+        return self._total_received_bytes / self.bytes_per_second
 
     def get_output_dir(self) -> Path:
         """获取输出目录"""
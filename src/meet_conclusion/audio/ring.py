@@ -0,0 +1,86 @@
+"""单生产者单消费者环形队列模块
+
+用于在实时音频线程和消费线程之间传递数据块，写满时丢弃最旧的数据，
+保证生产者永远不会阻塞
+"""
+
+import threading
+from collections import deque
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SPSCRing(Generic[T]):
+    """单生产者单消费者的有界环形队列
+
+    生产者只调用 push，消费者只调用 pop。deque 的 append/popleft 本身是原子的，
+    热路径上不加锁，Event 仅用于唤醒等待中的消费者
+    """
+
+    def __init__(self, capacity: int):
+        """初始化
+
+        Args:
+            capacity: 最大容纳的数据块数，写满时丢弃最旧的数据块
+        """
+        self.capacity = capacity
+        self._items: deque[T] = deque(maxlen=capacity)
+        self._event = threading.Event()
+        self._closed = False
+        self._dropped = 0
+
+    def push(self, item: T) -> None:
+        """放入数据块（生产者调用，不会阻塞）
+
+        Args:
+            item: 数据块
+        """
+        if len(self._items) >= self.capacity:
+            # deque 达到 maxlen 后 append 会自动丢弃最旧的元素
+            self._dropped += 1
+        self._items.append(item)
+        self._event.set()
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[T]:
+        """取出数据块（消费者调用）
+
+        Args:
+            timeout: 等待超时（秒），None 表示一直等待
+
+        Returns:
+            数据块，超时或队列已关闭且为空时返回 None
+        """
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+
+            if self._closed:
+                return None
+
+            # 先清除再复查，避免错过清除前刚放入的数据
+            self._event.clear()
+            if self._items or self._closed:
+                continue
+            if not self._event.wait(timeout):
+                return None
+
+    def close(self) -> None:
+        """关闭队列，唤醒消费者；剩余数据仍可取出"""
+        self._closed = True
+        self._event.set()
+
+    @property
+    def closed(self) -> bool:
+        """是否已关闭"""
+        return self._closed
+
+    @property
+    def dropped(self) -> int:
+        """因写满而丢弃的数据块数"""
+        return self._dropped
+
+    def __len__(self) -> int:
+        return len(self._items)
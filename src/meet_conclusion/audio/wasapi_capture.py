@@ -3,17 +3,77 @@
 使用 PyAudio 通过 WASAPI loopback 模式采集系统输出音频
 """
 
+import re
 import threading
 import time
 from typing import Callable, Optional
 
 import pyaudio
 
+from meet_conclusion.audio.ring import SPSCRing
 from meet_conclusion.config import get_config
+from meet_conclusion.utils import logger as logger_module
 from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 采集线程与消费线程之间最多缓存的数据块数，写满时丢弃最旧的数据
+_RING_CAPACITY = 256
+
+# Loopback 设备名称特征（不区分大小写）
+_LOOPBACK_RE = re.compile(r"loopback|stereo mix|立体声混音", re.IGNORECASE)
+
+# WASAPI 共享模式的默认设备周期（秒）
+_WASAPI_PERIOD = 0.01
+
+# 进程内共享的 PyAudio 实例（Windows 下初始化涉及 COM，开销较大）
+_pyaudio_instance: Optional[pyaudio.PyAudio] = None
+_pyaudio_lock = threading.Lock()
+
+# 设备信息缓存，PortAudio 的设备列表在初始化后不会变化
+_device_info_cache: dict[int, dict] = {}
+
+
+def _get_pyaudio() -> pyaudio.PyAudio:
+    """获取共享的 PyAudio 实例"""
+    global _pyaudio_instance
+    if _pyaudio_instance is None:
+        with _pyaudio_lock:
+            if _pyaudio_instance is None:
+                _pyaudio_instance = pyaudio.PyAudio()
+    return _pyaudio_instance
+
+
+def _get_device_info(index: int) -> dict:
+    """获取设备信息（带缓存）
+
+    Args:
+        index: 设备索引
+
+    Returns:
+        设备信息
+    """
+    info = _device_info_cache.get(index)
+    if info is None:
+        info = _get_pyaudio().get_device_info_by_index(index)
+        _device_info_cache[index] = info
+    return info
+
+
+def _enumerate_devices() -> list[tuple[int, dict]]:
+    """一次性枚举所有设备信息
+
+    Returns:
+        (设备索引, 设备信息) 列表，获取失败的设备会被跳过
+    """
+    devices = []
+    for i in range(_get_pyaudio().get_device_count()):
+        try:
+            devices.append((i, _get_device_info(i)))
+        except Exception as e:
+            logger.debug(f"获取设备 {i} 信息失败: {e}")
+    return devices
+
 
 class WASAPICapture:
     """WASAPI Loopback 音频采集器"""
@@ -30,20 +90,22 @@ class WASAPICapture:
         Args:
             sample_rate: 采样率，默认从配置读取
             channels: 声道数，默认从配置读取
-            chunk_size: 每次读取的帧数
+            chunk_size: 每次回调的帧数，默认从配置读取，为 0 时按设备周期对齐
             on_data: 数据回调函数
         """
-        config = get_config()
-        self.sample_rate = sample_rate or config.audio.sample_rate
-        self.channels = channels or config.audio.channels
-        self.chunk_size = chunk_size or config.audio.buffer_size
+        audio_config = get_config().audio
+        self.sample_rate = sample_rate or audio_config.sample_rate
+        self.channels = channels or audio_config.channels
+        self.chunk_size = chunk_size or audio_config.buffer_size
+        self.buffer_periods = max(1, audio_config.buffer_periods)
 
         self.on_data = on_data
 
-        self._pyaudio: Optional[pyaudio.PyAudio] = None
+        self._pyaudio = _get_pyaudio()
         self._stream: Optional[pyaudio.Stream] = None
         self._is_running = False
-        self._capture_thread: Optional[threading.Thread] = None
+        self._ring: Optional[SPSCRing[bytes]] = None
+        self._consumer_thread: Optional[threading.Thread] = None
         self._device_index: Optional[int] = None
 
     def _find_loopback_device(self) -> Optional[int]:
@@ -52,50 +114,46 @@ class WASAPICapture:
         Returns:
             设备索引，如果未找到返回 None
         """
-        if self._pyaudio is None:
-            self._pyaudio = pyaudio.PyAudio()
-
         # 获取主机 API 信息
-        wasapi_index = None
+        api_info = None
         for i in range(self._pyaudio.get_host_api_count()):
-            api_info = self._pyaudio.get_host_api_info_by_index(i)
-            if "WASAPI" in api_info.get("name", ""):
+            info = self._pyaudio.get_host_api_info_by_index(i)
+            if "WASAPI" in info.get("name", ""):
+                api_info = info
                 wasapi_index = i
-                logger.info(f"找到 WASAPI Host API: index={i}, name={api_info['name']}")
+                logger.info(f"找到 WASAPI Host API: index={i}, name={info['name']}")
                 break
 
-        if wasapi_index is None:
+        if api_info is None:
             logger.error("未找到 WASAPI Host API")
             return None
 
-        # 查找默认输出设备的 loopback
-        api_info = self._pyaudio.get_host_api_info_by_index(wasapi_index)
-
-        # 尝试获取默认输出设备
+        # 尝试获取默认输出设备；名称本身就是 loopback 时直接使用，无需遍历
         default_output = api_info.get("defaultOutputDevice", -1)
         if default_output >= 0:
-            device_info = self._pyaudio.get_device_info_by_index(default_output)
-            logger.info(f"默认输出设备: {device_info['name']}")
-
-        # 遍历所有设备，查找 loopback 设备
-        for i in range(self._pyaudio.get_device_count()):
             try:
-                device_info = self._pyaudio.get_device_info_by_index(i)
-
-                # 检查是否为 WASAPI 设备
-                if device_info.get("hostApi") != wasapi_index:
-                    continue
-
-                # 检查是否支持输入（loopback 设备显示为输入设备）
-                if device_info.get("maxInputChannels", 0) > 0:
-                    name = device_info.get("name", "")
-                    # WASAPI loopback 设备通常名称中包含 "Loopback" 或与输出设备同名
-                    if "loopback" in name.lower() or "立体声混音" in name or "Stereo Mix" in name.lower():
-                        logger.info(f"找到 Loopback 设备: index={i}, name={name}")
-                        return i
-
+                device_info = _get_device_info(default_output)
+                name = device_info.get("name", "")
+                logger.info(f"默认输出设备: {name}")
+                if device_info.get("maxInputChannels", 0) > 0 and _LOOPBACK_RE.search(name):
+                    logger.info(f"找到 Loopback 设备: index={default_output}, name={name}")
+                    return default_output
             except Exception as e:
-                logger.debug(f"获取设备 {i} 信息失败: {e}")
+                logger.debug(f"获取设备 {default_output} 信息失败: {e}")
+
+        # 一次性枚举所有设备，查找 loopback 设备
+        for i, device_info in _enumerate_devices():
+            # 检查是否为 WASAPI 设备
+            if device_info.get("hostApi") != wasapi_index:
+                continue
+
+            # 检查是否支持输入（loopback 设备显示为输入设备）
+            if device_info.get("maxInputChannels", 0) > 0:
+                name = device_info.get("name", "")
+                # WASAPI loopback 设备通常名称中包含 "Loopback" 或与输出设备同名
+                if _LOOPBACK_RE.search(name):
+                    logger.info(f"找到 Loopback 设备: index={i}, name={name}")
+                    return i
 
         # 如果没找到明确的 loopback，尝试使用默认输出设备（PyAudio WASAPI 可能支持）
         logger.warning("未找到明确的 Loopback 设备，尝试使用默认输出设备")
@@ -107,23 +165,16 @@ class WASAPICapture:
         Returns:
             设备信息列表
         """
-        if self._pyaudio is None:
-            self._pyaudio = pyaudio.PyAudio()
-
         devices = []
-        for i in range(self._pyaudio.get_device_count()):
-            try:
-                info = self._pyaudio.get_device_info_by_index(i)
-                devices.append({
-                    "index": i,
-                    "name": info.get("name", "Unknown"),
-                    "maxInputChannels": info.get("maxInputChannels", 0),
-                    "maxOutputChannels": info.get("maxOutputChannels", 0),
-                    "defaultSampleRate": info.get("defaultSampleRate", 0),
-                    "hostApi": info.get("hostApi", -1),
-                })
-            except Exception as e:
-                logger.debug(f"获取设备 {i} 信息失败: {e}")
+        for i, info in _enumerate_devices():
+            devices.append({
+                "index": i,
+                "name": info.get("name", "Unknown"),
+                "maxInputChannels": info.get("maxInputChannels", 0),
+                "maxOutputChannels": info.get("maxOutputChannels", 0),
+                "defaultSampleRate": info.get("defaultSampleRate", 0),
+                "hostApi": info.get("hostApi", -1),
+            })
 
         return devices
 
@@ -140,9 +191,6 @@ class WASAPICapture:
             logger.warning("采集器已在运行中")
             return True
 
-        if self._pyaudio is None:
-            self._pyaudio = pyaudio.PyAudio()
-
         # 查找设备
         if device_index is None:
             device_index = self._find_loopback_device()
@@ -155,7 +203,7 @@ class WASAPICapture:
 
         try:
             # 获取设备信息
-            device_info = self._pyaudio.get_device_info_by_index(device_index)
+            device_info = _get_device_info(device_index)
             logger.info(f"使用设备: {device_info['name']}")
 
             # 确定实际的声道数和采样率
@@ -164,58 +212,95 @@ class WASAPICapture:
 
             default_rate = int(device_info.get("defaultSampleRate", self.sample_rate))
 
-            # 打开流
+            # 回调帧数与 WASAPI 设备周期对齐，避免 PortAudio 重新分帧
+            frames_per_buffer = self.chunk_size or (
+                int(default_rate * _WASAPI_PERIOD) * self.buffer_periods
+            )
+
+            self._is_running = True
+
+            # 由消费线程调用 on_data，避免下游处理阻塞实时音频线程
+            self._ring = SPSCRing(_RING_CAPACITY)
+            self._consumer_thread = threading.Thread(
+                target=self._consume_loop,
+                args=(self._ring,),
+                name="AudioConsumer",
+                daemon=True,
+            )
+            self._consumer_thread.start()
+
+            # 以回调模式打开流，由 PortAudio 线程直接投递音频数据
             self._stream = self._pyaudio.open(
                 format=pyaudio.paInt16,
                 channels=actual_channels,
                 rate=default_rate,
                 input=True,
                 input_device_index=device_index,
-                frames_per_buffer=self.chunk_size,
+                frames_per_buffer=frames_per_buffer,
+                stream_callback=self._pa_callback,
                 as_loopback=True,  # WASAPI loopback 模式
             )
 
-            self._is_running = True
-
-            # 启动采集线程
-            self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
-            self._capture_thread.start()
-
-            logger.info(f"音频采集已启动: rate={default_rate}, channels={actual_channels}")
+            logger.info(f"音频采集已启动: rate={default_rate}, channels={actual_channels}, "
+                        f"frames_per_buffer={frames_per_buffer}")
             return True
 
         except Exception as e:
             logger.error(f"启动音频采集失败: {e}")
+            self._is_running = False
             self._cleanup()
+            self._stop_consumer()
             return False
 
-    def _capture_loop(self):
-        """采集循环"""
-        while self._is_running and self._stream:
-            try:
-                # 读取音频数据
-                data = self._stream.read(self.chunk_size, exception_on_overflow=False)
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio 数据回调（在 PortAudio 线程中执行）
 
-                # 调用回调
-                if self.on_data and data:
+        in_data 是 PyAudio 每次新分配的 bytes 对象，下游直接持有它而不再复制，
+        因此无需缓冲池回收
+        """
+        if status & pyaudio.paInputOverflow and logger_module.DEBUG:
+            logger.debug("音频输入溢出")
+
+        ring = self._ring
+        if self._is_running and ring is not None and in_data:
+            ring.push(in_data)
+
+        return None, pyaudio.paContinue
+
+    def _consume_loop(self, ring: SPSCRing[bytes]) -> None:
+        """消费线程循环：取出采集到的数据并调用 on_data"""
+        while True:
+            data = ring.pop(timeout=0.5)
+            if data is None:
+                if ring.closed:
+                    break
+                continue
+
+            if self.on_data:
+                try:
                     self.on_data(data)
-
-            except Exception as e:
-                if self._is_running:
+                except Exception as e:
                     logger.error(f"采集数据时出错: {e}")
-                    time.sleep(0.1)
+
+        if ring.dropped:
+            logger.warning(f"消费过慢，丢弃了 {ring.dropped} 个音频数据块")
 
     def stop(self):
         """停止采集"""
         self._is_running = False
-
-        if self._capture_thread:
-            self._capture_thread.join(timeout=2.0)
-            self._capture_thread = None
-
         self._cleanup()
+        self._stop_consumer()
         logger.info("音频采集已停止")
 
+    def _stop_consumer(self) -> None:
+        """关闭队列并等待消费线程处理完剩余数据"""
+        if self._ring is not None:
+            self._ring.close()
+        if self._consumer_thread is not None:
+            self._consumer_thread.join(timeout=2.0)
+            self._consumer_thread = None
+        self._ring = None
+
     def _cleanup(self):
         """清理资源"""
         if self._stream:
@@ -226,12 +311,7 @@ class WASAPICapture:
                 logger.debug(f"关闭流时出错: {e}")
             self._stream = None
 
-        if self._pyaudio:
-            try:
-                self._pyaudio.terminate()
-            except Exception as e:
-                logger.debug(f"终止 PyAudio 时出错: {e}")
-            self._pyaudio = None
+        # 共享的 PyAudio 实例在进程内复用，不在这里 terminate
 
     def is_running(self) -> bool:
         """检查是否正在运行"""
@@ -251,12 +331,7 @@ def test_capture():
     config = get_config()
     output_file = config.audio_dir / "test_capture.wav"
 
-    frames = []
-
-    def on_data(data: bytes):
-        frames.append(data)
-
-    capture = WASAPICapture(on_data=on_data)
+    capture = WASAPICapture()
 
     # 列出设备
     print("可用设备:")
@@ -264,25 +339,31 @@ def test_capture():
         print(f"  [{device['index']}] {device['name']} "
               f"(in={device['maxInputChannels']}, out={device['maxOutputChannels']})")
 
-    # 开始采集
+    # 开始采集；启动成功后才创建 WAV 文件，失败时不留下空文件
     print("\n开始采集音频（5秒）...")
-    if capture.start():
-        time.sleep(5)
-        capture.stop()
-
-        # 保存为 WAV 文件
-        if frames:
-            with wave.open(str(output_file), "wb") as wf:
-                wf.setnchannels(capture.channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(capture.sample_rate)
-                wf.writeframes(b"".join(frames))
-
-            print(f"音频已保存到: {output_file}")
-        else:
-            print("未采集到数据")
-    else:
+    if not capture.start():
         print("启动采集失败")
+        return
+
+    # 采集数据直接写入 WAV 文件，不在内存中累积
+    try:
+        with wave.open(str(output_file), "wb") as wf:
+            wf.setnchannels(capture.channels)
+            wf.setsampwidth(2)  # 16-bit
+            wf.setframerate(capture.sample_rate)
+            capture.on_data = wf.writeframes
+
+            time.sleep(5)
+            capture.stop()
+            frames_written = wf.tell()
+    finally:
+        if capture.is_running():
+            capture.stop()
+
+    if frames_written:
+        print(f"音频已保存到: {output_file}")
+    else:
+        print("未采集到数据")
 
 
 if __name__ == "__main__":
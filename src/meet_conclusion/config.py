@@ -4,6 +4,7 @@
 """
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -39,6 +40,9 @@ class DoubaoASRConfig(BaseSettings):
         default="https://openspeech-direct.zijieapi.com/api/v3/auc/bigmodel/query",
         description="查询任务URL"
     )
+    cache_enabled: bool = Field(default=True, description="是否缓存识别结果")
+    cache_max_entries: int = Field(default=2048, description="识别结果缓存最大条目数")
+    max_concurrency: int = Field(default=8, description="批量转写时的最大并发任务数")
 
 
 class DoubaoLLMConfig(BaseSettings):
@@ -54,6 +58,23 @@ class DoubaoLLMConfig(BaseSettings):
     model: str = Field(default="doubao-pro-32k", description="模型名称")
     max_tokens: int = Field(default=4096, description="最大输出token数")
     temperature: float = Field(default=0.7, description="生成温度")
+    cache_enabled: bool = Field(default=True, description="是否缓存纪要生成结果")
+    cache_max_entries: int = Field(default=256, description="纪要缓存最大条目数")
+    chunk_max_tokens: int = Field(
+        default=6000,
+        description="转写超出上下文时分段摘要的每段最大token数"
+    )
+    chunk_workers: int = Field(default=4, description="分段摘要的最大并发数")
+
+
+class ProcessorConfig(BaseSettings):
+    """批量处理配置"""
+
+    model_config = SettingsConfigDict(env_prefix="PROCESSOR_")
+
+    max_workers: int = Field(default=8, description="批量生成纪要时的最大并发数")
+    max_retries: int = Field(default=3, description="LLM 请求失败时的最大重试次数")
+    retry_base_delay: float = Field(default=1.0, description="重试的初始等待时间(秒)，每次翻倍")
 
 
 class AudioConfig(BaseSettings):
@@ -65,7 +86,22 @@ class AudioConfig(BaseSettings):
     channels: int = Field(default=1, description="声道数")
     chunk_duration: int = Field(default=60, description="切片时长(秒)")
     overlap_duration: float = Field(default=0.5, description="切片重叠时长(秒)")
-    buffer_size: int = Field(default=1024, description="缓冲区大小")
+    buffer_size: int = Field(
+        default=0,
+        description="每次回调的帧数，0 表示按 WASAPI 设备周期自动计算"
+    )
+    buffer_periods: int = Field(
+        default=2,
+        description="自动计算时每次回调包含的设备周期数（每周期 10ms），越大越不易断音但延迟越高"
+    )
+    silence_rms_threshold: float = Field(
+        default=200.0,
+        description="静音判定的 RMS 阈值，低于该值的切片不送 ASR，0 表示不检测"
+    )
+    chunk_format: Literal["wav", "flac"] = Field(
+        default="wav",
+        description="切片文件格式，flac 为无损压缩，可减少约一半的上传体积"
+    )
 
 
 class AppConfig(BaseSettings):
@@ -90,29 +126,37 @@ class AppConfig(BaseSettings):
     doubao_asr: DoubaoASRConfig = Field(default_factory=DoubaoASRConfig)
     doubao_llm: DoubaoLLMConfig = Field(default_factory=DoubaoLLMConfig)
     audio: AudioConfig = Field(default_factory=AudioConfig)
+    processor: ProcessorConfig = Field(default_factory=ProcessorConfig)
 
-    @property
+    @cached_property
     def db_path(self) -> Path:
         """数据库文件路径"""
         db_dir = self.data_dir / "db"
         db_dir.mkdir(parents=True, exist_ok=True)
         return db_dir / "meet_conclusion.db"
 
-    @property
+    @cached_property
     def audio_dir(self) -> Path:
         """音频文件目录"""
         audio_dir = self.data_dir / "audio"
         audio_dir.mkdir(parents=True, exist_ok=True)
         return audio_dir
 
-    @property
+    @cached_property
     def chunks_dir(self) -> Path:
         """音频切片目录"""
         chunks_dir = self.audio_dir / "chunks"
         chunks_dir.mkdir(parents=True, exist_ok=True)
         return chunks_dir
 
-    @property
+    @cached_property
+    def cache_dir(self) -> Path:
+        """缓存目录"""
+        cache_dir = self.data_dir / "cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+
+    @cached_property
     def logs_dir(self) -> Path:
         """日志目录"""
         logs_dir = self.data_dir / "logs"
@@ -133,20 +177,13 @@ MeetingStatus = Literal["draft", "recording", "processing", "done", "failed"]
 NoteTag = Literal["todo", "risk", "question", "general"]
 
 
-# 全局配置实例
-_config: AppConfig | None = None
-
-
+@lru_cache(maxsize=None)
 def get_config() -> AppConfig:
     """获取全局配置实例"""
-    global _config
-    if _config is None:
-        _config = AppConfig()
-    return _config
+    return AppConfig()
 
 
 def reload_config() -> AppConfig:
     """重新加载配置"""
-    global _config
-    _config = AppConfig()
-    return _config
+    get_config.cache_clear()
+    return get_config()
@@ -0,0 +1,180 @@
+"""批量纪要处理模块
+
+对多个已转写的会议并发重新生成纪要，LLM 请求是 IO 密集型的，
+并发数越高总耗时越短。每个会议完成后立即写入数据库，中途中断后重新运行即可继续
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional, TypeVar
+
+import httpx
+import orjson
+
+from meet_conclusion.asr.base import TranscriptResult, TranscriptSegment
+from meet_conclusion.config import get_config
+from meet_conclusion.db.repositories import (
+    MeetingRepository,
+    NoteRepository,
+    TranscriptRepository,
+)
+from meet_conclusion.llm.minutes_generator import MinutesGenerator, MinutesResult
+from meet_conclusion.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """判断 LLM 请求错误是否值得重试（限流、服务端错误和网络错误）"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class BatchProcessor:
+    """批量纪要处理器
+
+    所有任务共享同一个 MinutesGenerator（及其 LLM 连接池和结果缓存）
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ):
+        """初始化
+
+        Args:
+            max_workers: 最大并发数，默认从配置读取
+            max_retries: 最大重试次数，默认从配置读取
+        """
+        config = get_config().processor
+        self.max_workers = max(1, max_workers or config.max_workers)
+        self.max_retries = config.max_retries if max_retries is None else max_retries
+        self.retry_base_delay = config.retry_base_delay
+
+    def process(
+        self,
+        meeting_ids: list[int],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> dict[int, bool]:
+        """并发为多个会议生成纪要
+
+        Args:
+            meeting_ids: 会议ID列表
+            on_progress: 进度回调 (已完成数, 总数)
+
+        Returns:
+            会议ID到是否成功的映射
+        """
+        total = len(meeting_ids)
+        results: dict[int, bool] = {}
+        if not total:
+            return results
+
+        logger.info(f"开始批量生成纪要: {total} 个会议，并发数 {self.max_workers}")
+
+        with MinutesGenerator() as generator:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, total),
+                thread_name_prefix="minutes",
+            ) as executor:
+                futures = {
+                    executor.submit(self._process_one, generator, meeting_id): meeting_id
+                    for meeting_id in meeting_ids
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    if on_progress:
+                        on_progress(len(results), total)
+
+        succeeded = sum(results.values())
+        logger.info(f"批量生成纪要完成: 成功 {succeeded}/{total}")
+        return results
+
+    def _process_one(self, generator: MinutesGenerator, meeting_id: int) -> bool:
+        """为单个会议生成并保存纪要
+
+        Args:
+            generator: 共享的纪要生成器
+            meeting_id: 会议ID
+
+        Returns:
+            是否成功
+        """
+        try:
+            meeting = MeetingRepository.get_by_id(meeting_id)
+            if not meeting:
+                logger.warning(f"会议不存在: {meeting_id}")
+                return False
+
+            transcript = self._load_transcript(meeting_id)
+            if not transcript.segments:
+                logger.warning(f"会议 {meeting_id} 没有转写内容，跳过")
+                return False
+
+            notes = NoteRepository.get_by_meeting(meeting_id)
+            MeetingRepository.update_status(meeting_id, "processing")
+
+            result = self._with_retry(
+                lambda: generator.generate(meeting, transcript, notes)
+            )
+
+            # 每个会议完成后立即保存，作为检查点
+            self._save(meeting_id, result)
+            return True
+
+        except Exception as e:
+            logger.error(f"会议 {meeting_id} 纪要生成失败: {e}")
+            MeetingRepository.update_status(meeting_id, "failed")
+            return False
+
+    def _with_retry(self, func: Callable[[], T]) -> T:
+        """执行函数，遇到可重试的错误时按指数退避重试
+
+        Args:
+            func: 要执行的函数
+
+        Returns:
+            函数返回值
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func()
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = self.retry_base_delay * (2 ** attempt)
+                logger.warning(
+                    f"LLM 请求失败，{delay:.1f} 秒后重试 "
+                    f"({attempt + 1}/{self.max_retries}): {e}"
+                )
+                time.sleep(delay)
+
+    @staticmethod
+    def _load_transcript(meeting_id: int) -> TranscriptResult:
+        """从数据库还原会议的转写结果"""
+        rows = TranscriptRepository.get_by_meeting(meeting_id)
+        segments = [
+            TranscriptSegment(t.start_time, t.end_time, t.text, t.speaker_id, t.confidence)
+            for t in rows
+        ]
+        return TranscriptResult(
+            segments=segments,
+            full_text=" ".join(seg.text for seg in segments),
+            duration=segments[-1].end_time if segments else 0,
+        )
+
+    @staticmethod
+    def _save(meeting_id: int, result: MinutesResult) -> None:
+        """保存纪要"""
+        MeetingRepository.save_minutes(
+            meeting_id,
+            summary=result.summary,
+            decisions_json=orjson.dumps(result.decisions).decode(),
+            action_items_json=orjson.dumps(result.action_items).decode(),
+            topics_json=orjson.dumps(result.topics).decode(),
+        )
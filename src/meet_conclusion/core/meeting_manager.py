@@ -1,6 +1,5 @@
 """会议生命周期管理"""
 
-import threading
 from typing import Callable, Optional
 
 from meet_conclusion.audio.chunk_writer import ChunkInfo
@@ -16,24 +15,11 @@ logger = get_logger(__name__)
 class MeetingManager:
     """会议管理器
 
-    协调录音引擎和处理流水线，管理会议的完整生命周期
+    协调录音引擎和处理流水线，管理会议的完整生命周期。
+    通过 get_meeting_manager() 获取全局实例
     """
 
-    _instance: Optional["MeetingManager"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        """单例模式"""
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
-
     def __init__(self):
-        if self._initialized:
-            return
-
         self._recording_engine = RecordingEngine()
         self._pipeline = MeetingPipeline()
 
@@ -50,8 +36,6 @@ class MeetingManager:
             on_error=self._handle_error,
         )
 
-        self._initialized = True
-
     def set_callbacks(
         self,
         on_recording_state_changed: Optional[Callable[[RecordingState], None]] = None,
@@ -167,12 +151,29 @@ class MeetingManager:
         """是否正在录制"""
         return self._recording_engine.is_recording
 
+    def close(self) -> None:
+        """释放资源（应用退出时调用）"""
+        self._pipeline.close()
+
     @property
     def current_meeting_id(self) -> Optional[int]:
         """当前会议ID"""
         return self._recording_engine.meeting_id
 
 
+# 全局会议管理器实例
+_manager: Optional[MeetingManager] = None
+
+
 def get_meeting_manager() -> MeetingManager:
     """获取会议管理器实例"""
-    return MeetingManager()
+    global _manager
+    if _manager is None:
+        _manager = MeetingManager()
+    return _manager
+
+
+def close_meeting_manager() -> None:
+    """关闭会议管理器（应用退出时调用，未创建过实例时无需处理）"""
+    if _manager is not None:
+        _manager.close()
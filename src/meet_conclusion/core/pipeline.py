@@ -3,12 +3,17 @@
 完整的会议处理流程：ASR转写 -> 结果合并 -> 纪要生成
 """
 
-import json
+import itertools
+import queue
 import threading
+import time
+from concurrent.futures import Future
 from enum import Enum, auto
 from pathlib import Path
 from typing import Callable, Optional
 
+import orjson
+
 from meet_conclusion.asr.base import TranscriptResult
 from meet_conclusion.asr.doubao_asr import DoubaoASRProvider
 from meet_conclusion.asr.transcript_merger import TranscriptMerger
@@ -20,10 +25,50 @@ from meet_conclusion.db.repositories import (
     TranscriptRepository,
 )
 from meet_conclusion.llm.minutes_generator import MinutesGenerator
+from meet_conclusion.utils.async_runner import run_async
 from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 所有流水线实例共享一个后台工作线程，按提交顺序处理。
+# 使用守护线程而不是 ThreadPoolExecutor：后者的工作线程在解释器退出时会被 join，
+# 正在轮询 ASR 或接收 LLM 流式输出时退出应用会一直等到请求超时
+_jobs: queue.SimpleQueue = queue.SimpleQueue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _submit(fn: Callable, *args) -> Future:
+    """提交任务到共享的后台工作线程
+
+    Args:
+        fn: 任务函数
+        *args: 任务参数
+
+    Returns:
+        任务的 Future
+    """
+    global _worker
+    future: Future = Future()
+    _jobs.put((future, fn, args))
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_work_loop, name="pipeline", daemon=True)
+            _worker.start()
+    return future
+
+
+def _work_loop() -> None:
+    """后台工作线程循环"""
+    while True:
+        future, fn, args = _jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
 
 class PipelineState(Enum):
     """流水线状态"""
@@ -59,6 +104,9 @@ class MeetingPipeline:
         self._lock = threading.Lock()
         self._current_meeting_id: Optional[int] = None
 
+        # 跨会议复用 ASR 客户端，保留连接池和识别结果缓存
+        self._asr = DoubaoASRProvider()
+
     @property
     def state(self) -> PipelineState:
         """获取当前状态"""
@@ -67,12 +115,12 @@ class MeetingPipeline:
     def _set_state(self, state: PipelineState, message: str = "") -> None:
         """设置状态"""
         self._state = state
-        logger.info(f"流水线状态: {state.name} - {message}")
+        logger.info("流水线状态: {} - {}", state.name, message)
         if self._on_state_changed:
             try:
                 self._on_state_changed(state, message)
             except Exception as e:
-                logger.error(f"状态回调执行失败: {e}")
+                logger.error("状态回调执行失败: {}", e)
 
     def _report_progress(self, progress: float, message: str) -> None:
         """报告进度"""
@@ -80,16 +128,16 @@ class MeetingPipeline:
             try:
                 self._on_progress(progress, message)
             except Exception as e:
-                logger.error(f"进度回调执行失败: {e}")
+                logger.error("进度回调执行失败: {}", e)
 
     def _report_error(self, error: str) -> None:
         """报告错误"""
-        logger.error(f"流水线错误: {error}")
+        logger.error("流水线错误: {}", error)
         if self._on_error:
             try:
                 self._on_error(error)
             except Exception as e:
-                logger.error(f"错误回调执行失败: {e}")
+                logger.error("错误回调执行失败: {}", e)
 
     def process(self, meeting_id: int, audio_urls: Optional[list[str]] = None) -> bool:
         """处理会议
@@ -152,7 +200,7 @@ class MeetingPipeline:
         self,
         meeting_id: int,
         audio_urls: Optional[list[str]] = None
-    ) -> threading.Thread:
+    ) -> Future:
         """异步处理会议
 
         Args:
@@ -160,15 +208,13 @@ class MeetingPipeline:
             audio_urls: 音频URL列表
 
         Returns:
-            处理线程
+            处理任务的 Future，结果为是否成功
         """
-        thread = threading.Thread(
-            target=self.process,
-            args=(meeting_id, audio_urls),
-            daemon=True,
-        )
-        thread.start()
-        return thread
+        return _submit(self.process, meeting_id, audio_urls)
+
+    def close(self) -> None:
+        """释放流水线持有的资源（ASR 连接池和缓存）"""
+        self._asr.close()
 
     def _transcribe(
         self,
@@ -189,14 +235,18 @@ class MeetingPipeline:
         # 如果提供了 URL 列表，直接使用
         if audio_urls:
             total = len(audio_urls)
-            with DoubaoASRProvider() as asr:
-                for i, url in enumerate(audio_urls):
-                    self._report_progress(
-                        (i + 1) / total * 0.6,
-                        f"正在转写音频 {i + 1}/{total}..."
-                    )
-                    result = asr.transcribe_url(url, t_start=0)
-                    merger.add_result(result)
+            completed = itertools.count(1)
+
+            def on_result(index: int, result: TranscriptResult) -> None:
+                done = next(completed)
+                self._report_progress(done / total * 0.6, f"已转写音频 {done}/{total}...")
+
+            # 所有音频并发转写，结果按提交顺序合并
+            self._report_progress(0.0, f"正在转写 {total} 段音频...")
+            results = run_async(self._asr.transcribe_urls(audio_urls, on_result=on_result))
+
+            for result in results:
+                merger.add_result(result)
 
         else:
             # 从数据库获取切片信息
@@ -206,7 +256,8 @@ class MeetingPipeline:
                 return TranscriptResult(segments=[], full_text="", duration=0)
 
             total = len(chunks)
-            logger.info(f"找到 {total} 个音频切片")
+            chunks = [c for c in chunks if c.status != "silent"]
+            logger.info(f"找到 {total} 个音频切片，其中 {total - len(chunks)} 个为静音")
 
             # TODO: 实现本地文件上传到对象存储获取 URL
             # 当前版本需要音频 URL，这里暂时跳过
@@ -228,8 +279,11 @@ class MeetingPipeline:
         # 先删除旧的转写记录
         TranscriptRepository.delete_by_meeting(meeting_id)
 
-        # 批量创建新记录
-        transcripts_data = [
+        if not transcript.segments:
+            return
+
+        # 批量创建新记录（逐条生成，不预先构建完整列表）
+        transcripts_data = (
             {
                 "meeting_id": meeting_id,
                 "start_time": seg.start_time,
@@ -239,11 +293,10 @@ class MeetingPipeline:
                 "confidence": seg.confidence,
             }
             for seg in transcript.segments
-        ]
+        )
 
-        if transcripts_data:
-            TranscriptRepository.create_batch(transcripts_data)
-            logger.info(f"保存了 {len(transcripts_data)} 条转写记录")
+        TranscriptRepository.create_batch(transcripts_data)
+        logger.info(f"保存了 {len(transcript.segments)} 条转写记录")
 
     def _generate_minutes(
         self,
@@ -274,9 +327,21 @@ class MeetingPipeline:
             )
             return
 
+        # 流式接收 LLM 输出，期间定期汇报已接收的字数
+        received = 0
+        last_report = time.monotonic()
+
+        def on_delta(delta: str) -> None:
+            nonlocal received, last_report
+            received += len(delta)
+            now = time.monotonic()
+            if now - last_report >= 0.5:
+                last_report = now
+                self._report_progress(0.8, f"正在生成会议纪要（已接收 {received} 字）...")
+
         # 生成纪要
         with MinutesGenerator() as generator:
-            result = generator.generate(meeting, transcript, notes)
+            result = generator.generate(meeting, transcript, notes, on_delta=on_delta)
 
         self._report_progress(0.9, "正在保存会议纪要...")
 
@@ -284,9 +349,9 @@ class MeetingPipeline:
         MeetingRepository.save_minutes(
             meeting_id,
             summary=result.summary,
-            decisions_json=json.dumps(result.decisions, ensure_ascii=False),
-            action_items_json=json.dumps(result.action_items, ensure_ascii=False),
-            topics_json=json.dumps(result.topics, ensure_ascii=False),
+            decisions_json=orjson.dumps(result.decisions).decode(),
+            action_items_json=orjson.dumps(result.action_items).decode(),
+            topics_json=orjson.dumps(result.topics).decode(),
         )
 
         self._report_progress(1.0, "会议纪要已生成")
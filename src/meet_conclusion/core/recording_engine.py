@@ -3,9 +3,11 @@
 管理录音的完整生命周期：开始 -> 录制中 -> 停止 -> 处理
 """
 
+import gc
+import queue
 import threading
-from datetime import datetime
-from enum import Enum, auto
+import time
+from enum import IntEnum, auto
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -17,8 +19,11 @@ from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 切片记录每批最多写入的条数
+_PERSIST_BATCH_SIZE = 64
 
-class RecordingState(Enum):
+
+class RecordingState(IntEnum):
     """录音状态"""
     IDLE = auto()       # 空闲
     STARTING = auto()   # 正在启动
@@ -27,6 +32,10 @@ class RecordingState(Enum):
     STOPPED = auto()    # 已停止
 
 
+# 可以重置为空闲的状态（录制中必须先停止）
+_RESETTABLE_STATES = tuple(s for s in RecordingState if s != RecordingState.RECORDING)
+
+
 class RecordingEngine:
     """录音引擎
 
@@ -44,13 +53,22 @@ class RecordingEngine:
 
         # 当前会议
         self._meeting_id: Optional[int] = None
-        self._start_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None  # 单调时钟，不受系统时间调整影响
 
         # 回调
         self._on_state_changed: Optional[Callable[[RecordingState], None]] = None
         self._on_chunk_ready: Optional[Callable[[ChunkInfo], None]] = None
         self._on_error: Optional[Callable[[str], None]] = None
 
+        # 切片记录由后台线程批量写入数据库，切片就绪时只做入队
+        self._chunk_records: queue.SimpleQueue = queue.SimpleQueue()
+        self._persist_thread = threading.Thread(
+            target=self._persist_loop,
+            name="ChunkPersister",
+            daemon=True,
+        )
+        self._persist_thread.start()
+
     @property
     def state(self) -> RecordingState:
         """获取当前状态"""
@@ -79,8 +97,37 @@ class RecordingEngine:
 
     def _set_state(self, new_state: RecordingState) -> None:
         """设置状态并触发回调"""
-        old_state = self._state
-        self._state = new_state
+        with self._lock:
+            old_state = self._state
+            self._state = new_state
+        self._notify_state(old_state, new_state)
+
+    def _transition(
+        self,
+        expected: tuple[RecordingState, ...],
+        new_state: RecordingState,
+    ) -> bool:
+        """比较并设置状态：仅当前状态属于 expected 时切换到 new_state
+
+        锁只保护比较和赋值本身，回调在锁外执行
+
+        Args:
+            expected: 允许切换的当前状态
+            new_state: 新状态
+
+        Returns:
+            是否切换成功
+        """
+        with self._lock:
+            old_state = self._state
+            if old_state not in expected:
+                return False
+            self._state = new_state
+        self._notify_state(old_state, new_state)
+        return True
+
+    def _notify_state(self, old_state: RecordingState, new_state: RecordingState) -> None:
+        """记录状态变更并触发回调"""
         logger.info(f"录音状态变更: {old_state.name} -> {new_state.name}")
 
         if self._on_state_changed:
@@ -92,14 +139,15 @@ class RecordingEngine:
     def _handle_chunk_ready(self, chunk_info: ChunkInfo) -> None:
         """处理切片就绪事件"""
         if self._meeting_id:
-            # 保存到数据库
-            AudioChunkRepository.create(
-                meeting_id=self._meeting_id,
-                chunk_index=chunk_info.index,
-                file_path=str(chunk_info.file_path),
-                start_time=chunk_info.start_time,
-                end_time=chunk_info.end_time,
-            )
+            # 交给后台线程保存到数据库
+            self._chunk_records.put({
+                "meeting_id": self._meeting_id,
+                "chunk_index": chunk_info.index,
+                "file_path": str(chunk_info.file_path),
+                "start_time": chunk_info.start_time,
+                "end_time": chunk_info.end_time,
+                "status": "silent" if chunk_info.is_silent else "pending",
+            })
 
         # 触发外部回调
         if self._on_chunk_ready:
@@ -108,6 +156,40 @@ class RecordingEngine:
             except Exception as e:
                 logger.error(f"切片就绪回调执行失败: {e}")
 
+    def _persist_loop(self) -> None:
+        """后台写入切片记录，每次取出队列中已有的记录合并为一个事务"""
+        records = self._chunk_records
+        while True:
+            item = records.get()
+            batch: list[dict] = []
+            waiters: list[threading.Event] = []
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                    if len(batch) >= _PERSIST_BATCH_SIZE:
+                        break
+                try:
+                    item = records.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    AudioChunkRepository.create_batch(batch)
+                except Exception as e:
+                    logger.error(f"保存切片记录失败: {e}")
+
+            for waiter in waiters:
+                waiter.set()
+
+    def _flush_chunk_records(self) -> None:
+        """等待已入队的切片记录全部写入数据库"""
+        done = threading.Event()
+        self._chunk_records.put(done)
+        done.wait()
+
     def _handle_audio_data(self, data: bytes) -> None:
         """处理音频数据"""
         if self._chunk_writer and self._state == RecordingState.RECORDING:
@@ -122,13 +204,11 @@ class RecordingEngine:
         Returns:
             是否成功启动
         """
-        with self._lock:
-            if self._state != RecordingState.IDLE:
-                logger.warning(f"无法启动录音，当前状态: {self._state.name}")
-                return False
+        if not self._transition((RecordingState.IDLE,), RecordingState.STARTING):
+            logger.warning(f"无法启动录音，当前状态: {self._state.name}")
+            return False
 
-            self._set_state(RecordingState.STARTING)
-            self._meeting_id = meeting_id
+        self._meeting_id = meeting_id
 
         try:
             # 创建切片写入器
@@ -145,14 +225,16 @@ class RecordingEngine:
             if not self._capture.start():
                 raise RuntimeError("无法启动音频采集")
 
-            self._start_time = datetime.now()
+            self._start_monotonic = time.monotonic()
 
             # 更新会议状态
             audio_path = str(self._chunk_writer.get_output_dir())
             MeetingRepository.start_recording(meeting_id, audio_path)
 
-            with self._lock:
-                self._set_state(RecordingState.RECORDING)
+            # 把启动前已存在的对象移出分代回收，录制期间的 GC 只扫描新对象，停顿更短
+            gc.freeze()
+
+            self._set_state(RecordingState.RECORDING)
 
             logger.info(f"录音已启动，会议ID: {meeting_id}")
             return True
@@ -161,8 +243,7 @@ class RecordingEngine:
             logger.error(f"启动录音失败: {e}")
             self._cleanup()
 
-            with self._lock:
-                self._set_state(RecordingState.IDLE)
+            self._set_state(RecordingState.IDLE)
 
             if self._on_error:
                 self._on_error(str(e))
@@ -175,12 +256,9 @@ class RecordingEngine:
         Returns:
             录制时长（秒）
         """
-        with self._lock:
-            if self._state != RecordingState.RECORDING:
-                logger.warning(f"无法停止录音，当前状态: {self._state.name}")
-                return 0.0
-
-            self._set_state(RecordingState.STOPPING)
+        if not self._transition((RecordingState.RECORDING,), RecordingState.STOPPING):
+            logger.warning(f"无法停止录音，当前状态: {self._state.name}")
+            return 0.0
 
         duration = 0.0
 
@@ -194,6 +272,9 @@ class RecordingEngine:
                 self._chunk_writer.stop()
                 duration = self._chunk_writer.get_total_duration()
 
+            # 确保所有切片记录已落库，后续处理才能读到
+            self._flush_chunk_records()
+
             # 更新会议状态
             if self._meeting_id:
                 MeetingRepository.stop_recording(self._meeting_id, duration)
@@ -207,8 +288,8 @@ class RecordingEngine:
 
         finally:
             self._cleanup()
-            with self._lock:
-                self._set_state(RecordingState.STOPPED)
+            gc.unfreeze()
+            self._set_state(RecordingState.STOPPED)
 
         return duration
 
@@ -221,24 +302,28 @@ class RecordingEngine:
                 pass
             self._capture = None
 
-        self._chunk_writer = None
+        # 启动失败时写入线程已在运行，需停止（已停止时 stop 直接返回）
+        if self._chunk_writer:
+            try:
+                self._chunk_writer.stop()
+            except Exception as e:
+                logger.debug(f"停止切片写入时出错: {e}")
+            self._chunk_writer = None
 
     def reset(self) -> None:
         """重置状态"""
-        with self._lock:
-            if self._state == RecordingState.RECORDING:
-                logger.warning("录音正在进行中，请先停止")
-                return
+        if not self._transition(_RESETTABLE_STATES, RecordingState.IDLE):
+            logger.warning("录音正在进行中，请先停止")
+            return
 
-            self._cleanup()
-            self._meeting_id = None
-            self._start_time = None
-            self._set_state(RecordingState.IDLE)
+        self._cleanup()
+        self._meeting_id = None
+        self._start_monotonic = None
 
     def get_elapsed_seconds(self) -> float:
         """获取已录制的秒数"""
-        if self._start_time and self._state == RecordingState.RECORDING:
-            return (datetime.now() - self._start_time).total_seconds()
+        if self._start_monotonic is not None and self._state == RecordingState.RECORDING:
+            return time.monotonic() - self._start_monotonic
         elif self._chunk_writer:
             return self._chunk_writer.get_total_duration()
         return 0.0
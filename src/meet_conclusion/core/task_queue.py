@@ -1,11 +1,20 @@
 """任务队列模块"""
 
+import asyncio
+import concurrent.futures
+import itertools
 import queue
 import threading
+from contextlib import ExitStack
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any, Callable, Optional
 
+from meet_conclusion.asr.base import TranscriptResult
+from meet_conclusion.asr.doubao_asr import DoubaoASRProvider
+from meet_conclusion.llm.doubao_llm import DoubaoLLMProvider
+from meet_conclusion.utils import logger as logger_module
+from meet_conclusion.utils.async_runner import submit as submit_coroutine
 from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +26,19 @@ class TaskType(Enum):
     DIARIZE = auto()   # 说话人分离
     LLM = auto()       # LLM 生成
     GENERAL = auto()   # 通用任务
+    BACKGROUND = auto()  # 低优先级后台任务（如数据库批量刷新）
+
+
+# 同时进行中的 ASR 请求上限
+_ASR_CONCURRENCY = 16
+
+# 各类型任务的默认工作线程数（ASR 任务在后台事件循环中执行，不占用工作线程）
+_DEFAULT_WORKERS = {
+    TaskType.DIARIZE: 1,
+    TaskType.LLM: 1,
+    TaskType.GENERAL: 1,
+    TaskType.BACKGROUND: 1,
+}
 
 
 @dataclass
@@ -31,19 +53,48 @@ class Task:
 class TaskQueue:
     """任务队列
 
-    支持多工作线程的任务队列
+    每种任务类型有独立的队列和固定数量的工作线程，
+    长耗时的 LLM 任务不会阻塞其他任务。ASR 任务只是等待远程接口，
+    统一在后台事件循环中以协程并发执行，不占用工作线程
     """
 
-    def __init__(self, num_workers: int = 2):
+    # 需要在工作线程中常驻服务客户端的任务类型
+    _PROVIDERS = {
+        TaskType.LLM: DoubaoLLMProvider,
+    }
+
+    def __init__(self, num_workers: Optional[dict[TaskType, int]] = None):
         """初始化
 
         Args:
-            num_workers: 工作线程数
+            num_workers: 各任务类型的工作线程数，未指定的类型使用默认值
         """
-        self._queue: queue.Queue[Optional[Task]] = queue.Queue()
+        self._num_workers = {**_DEFAULT_WORKERS, **(num_workers or {})}
+        # SimpleQueue 由 C 实现，put/get 比 Queue 少一层锁和条件变量
+        self._queues: dict[TaskType, queue.SimpleQueue[Optional[Task]]] = {
+            task_type: queue.SimpleQueue() for task_type in self._num_workers
+        }
         self._workers: list[threading.Thread] = []
         self._running = False
-        self._num_workers = num_workers
+
+        # 已提交/已处理任务数；itertools.count 的 next() 是原子的，读取无需加锁
+        self._submitted_counter = itertools.count(1)
+        self._processed_counter = itertools.count(1)
+        self._submitted = 0
+        self._processed = 0
+
+        # 异步执行的 ASR 任务
+        self._asr: Optional[DoubaoASRProvider] = None
+        self._asr_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_futures: set[concurrent.futures.Future] = set()
+
+        # 任务类型到处理函数的分发表
+        self._dispatch: dict[TaskType, Callable[[Any, Any], Any]] = {
+            TaskType.DIARIZE: self._execute_diarize_task,
+            TaskType.LLM: self._execute_llm_task,
+            TaskType.GENERAL: self._execute_general_task,
+            TaskType.BACKGROUND: self._execute_general_task,
+        }
 
     def start(self) -> None:
         """启动任务队列"""
@@ -51,16 +102,19 @@ class TaskQueue:
             return
 
         self._running = True
-        for i in range(self._num_workers):
-            worker = threading.Thread(
-                target=self._worker_loop,
-                name=f"TaskWorker-{i}",
-                daemon=True,
-            )
-            worker.start()
-            self._workers.append(worker)
-
-        logger.info(f"任务队列已启动，工作线程数: {self._num_workers}")
+        self._asr = DoubaoASRProvider()
+        for task_type, count in self._num_workers.items():
+            for i in range(count):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(task_type,),
+                    name=f"TaskWorker-{task_type.name}-{i}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+        logger.info(f"任务队列已启动，工作线程数: {len(self._workers)}")
 
     def stop(self, wait: bool = True) -> None:
         """停止任务队列
@@ -70,15 +124,21 @@ class TaskQueue:
         """
         self._running = False
 
-        # 发送停止信号
-        for _ in self._workers:
-            self._queue.put(None)
+        # 发送停止信号，每个工作线程一个
+        for task_type, count in self._num_workers.items():
+            for _ in range(count):
+                self._queues[task_type].put(None)
 
         if wait:
             for worker in self._workers:
                 worker.join(timeout=5.0)
+            if self._async_futures:
+                concurrent.futures.wait(list(self._async_futures), timeout=5.0)
 
         self._workers.clear()
+        if self._asr is not None:
+            self._asr.close()
+            self._asr = None
         logger.info("任务队列已停止")
 
     def submit(self, task: Task) -> None:
@@ -91,99 +151,164 @@ class TaskQueue:
             logger.warning("任务队列未启动，无法提交任务")
             return
 
-        self._queue.put(task)
+        self._submitted = next(self._submitted_counter)
+        if task.task_type == TaskType.ASR:
+            future = submit_coroutine(self._process_task_async(task))
+            self._async_futures.add(future)
+            future.add_done_callback(self._async_futures.discard)
+        else:
+            self._queues[task.task_type].put(task)
         logger.debug(f"提交任务: {task.task_type.name}")
 
-    def _worker_loop(self) -> None:
-        """工作线程循环"""
-        while self._running:
-            try:
-                task = self._queue.get(timeout=1.0)
-                if task is None:
+    def _worker_loop(self, task_type: TaskType) -> None:
+        """工作线程循环
+
+        Args:
+            task_type: 该线程负责的任务类型
+        """
+        task_queue = self._queues[task_type]
+        with ExitStack() as stack:
+            # 服务客户端在工作线程的生命周期内保持打开，复用连接
+            provider = self._open_provider(task_type, stack)
+
+            # 阻塞等待任务，空闲时不唤醒；停止时每个线程都会收到一个 None
+            while True:
+                task = task_queue.get()
+                if task is None or not self._running:
                     break
 
-                self._process_task(task)
-                self._queue.task_done()
+                try:
+                    self._process_task(task, provider)
+                except Exception as e:
+                    logger.error(f"工作线程异常: {e}")
+
+    @classmethod
+    def _open_provider(cls, task_type: TaskType, stack: ExitStack) -> Any:
+        """为工作线程创建服务客户端
 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error(f"工作线程异常: {e}")
+        Args:
+            task_type: 任务类型
+            stack: 工作线程退出时负责关闭客户端
+
+        Returns:
+            服务客户端，无需客户端的任务类型返回 None
+        """
+        provider_cls = cls._PROVIDERS.get(task_type)
+        if provider_cls is None:
+            return None
+        return stack.enter_context(provider_cls())
 
-    def _process_task(self, task: Task) -> None:
+    def _process_task(self, task: Task, provider: Any = None) -> None:
         """处理任务
 
         Args:
             task: 任务对象
+            provider: 工作线程持有的服务客户端
         """
         try:
-            logger.debug(f"开始处理任务: {task.task_type.name}")
+            if logger_module.DEBUG:
+                logger.debug(f"开始处理任务: {task.task_type.name}")
 
             # 根据任务类型处理
-            result = self._execute_task(task)
+            result = self._execute_task(task, provider)
 
             # 执行回调
             if task.callback:
                 task.callback(result)
 
-            logger.debug(f"任务处理完成: {task.task_type.name}")
+            if logger_module.DEBUG:
+                logger.debug(f"任务处理完成: {task.task_type.name}")
+
+        except Exception as e:
+            logger.error(f"任务处理失败: {task.task_type.name} - {e}")
+            if task.error_callback:
+                task.error_callback(e)
+
+        finally:
+            self._processed = next(self._processed_counter)
+
+    async def _process_task_async(self, task: Task) -> None:
+        """在后台事件循环中处理 ASR 任务
+
+        Args:
+            task: 任务对象
+        """
+        # 信号量需在事件循环内创建
+        if self._asr_semaphore is None:
+            self._asr_semaphore = asyncio.Semaphore(_ASR_CONCURRENCY)
+
+        try:
+            async with self._asr_semaphore:
+                if not self._running:
+                    return
+
+                if logger_module.DEBUG:
+                    logger.debug(f"开始处理任务: {task.task_type.name}")
+                result = await self._execute_asr_task_async(task.data)
+
+                # 执行回调
+                if task.callback:
+                    task.callback(result)
+
+                if logger_module.DEBUG:
+                    logger.debug(f"任务处理完成: {task.task_type.name}")
 
         except Exception as e:
             logger.error(f"任务处理失败: {task.task_type.name} - {e}")
             if task.error_callback:
                 task.error_callback(e)
 
-    def _execute_task(self, task: Task) -> Any:
+        finally:
+            self._processed = next(self._processed_counter)
+
+    def _execute_task(self, task: Task, provider: Any = None) -> Any:
         """执行任务
 
         Args:
             task: 任务对象
+            provider: 工作线程持有的服务客户端
 
         Returns:
             任务结果
         """
-        if task.task_type == TaskType.ASR:
-            return self._execute_asr_task(task.data)
-        elif task.task_type == TaskType.DIARIZE:
-            return self._execute_diarize_task(task.data)
-        elif task.task_type == TaskType.LLM:
-            return self._execute_llm_task(task.data)
-        elif task.task_type == TaskType.GENERAL:
-            # 通用任务：data 应该是一个可调用对象
-            if callable(task.data):
-                return task.data()
-            return task.data
-        else:
-            raise ValueError(f"未知的任务类型: {task.task_type}")
+        try:
+            handler = self._dispatch[task.task_type]
+        except KeyError:
+            raise ValueError(f"未知的任务类型: {task.task_type}") from None
+        return handler(task.data, provider)
 
-    def _execute_asr_task(self, data: dict) -> Any:
+    async def _execute_asr_task_async(self, data: dict) -> Any:
         """执行 ASR 任务"""
-        from meet_conclusion.asr.doubao_asr import DoubaoASRProvider
-
         audio_url = data.get("audio_url")
         t_start = data.get("t_start", 0.0)
 
-        with DoubaoASRProvider() as asr:
-            return asr.transcribe_url(audio_url, t_start)
+        # 静音切片无需调用 ASR
+        if data.get("is_silent"):
+            return TranscriptResult(segments=[], full_text="", duration=0)
+
+        return await self._asr.transcribe_url_async(audio_url, t_start)
 
-    def _execute_diarize_task(self, data: dict) -> Any:
+    def _execute_diarize_task(self, data: dict, provider: Any = None) -> Any:
         """执行说话人分离任务"""
         # TODO: 实现说话人分离
         return []
 
-    def _execute_llm_task(self, data: dict) -> Any:
-        """执行 LLM 任务"""
-        from meet_conclusion.llm.doubao_llm import DoubaoLLMProvider
+    def _execute_general_task(self, data: Any, provider: Any = None) -> Any:
+        """执行通用任务：data 应该是一个可调用对象"""
+        if callable(data):
+            return data()
+        return data
 
+    def _execute_llm_task(self, data: dict, llm: Any) -> Any:
+        """执行 LLM 任务"""
         prompt = data.get("prompt")
         system_prompt = data.get("system_prompt")
 
-        with DoubaoLLMProvider() as llm:
-            return llm.complete(prompt, system_prompt)
+        return llm.complete(prompt, system_prompt)
 
     def pending_count(self) -> int:
         """获取待处理任务数"""
-        return self._queue.qsize()
+        return max(self._submitted - self._processed, 0)
 
     def is_running(self) -> bool:
         """是否正在运行"""
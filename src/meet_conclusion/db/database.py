@@ -1,9 +1,11 @@
 """数据库连接管理"""
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
 
-from sqlalchemy import event
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
 
 from meet_conclusion.config import get_config
@@ -11,9 +13,53 @@ from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 每个新连接执行的 PRAGMA
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# 会议标题/参与人全文索引（trigram 分词支持中文子串匹配，需要 SQLite 3.34+）
+_FTS_TABLE_DDL = (
+    "CREATE VIRTUAL TABLE meetings_fts USING fts5("
+    "title, participants, content='meetings', content_rowid='id', tokenize='trigram')"
+)
+_FTS_TRIGGERS_DDL = (
+    "CREATE TRIGGER IF NOT EXISTS meetings_fts_ai AFTER INSERT ON meetings BEGIN "
+    "INSERT INTO meetings_fts (rowid, title, participants) "
+    "VALUES (new.id, new.title, new.participants); END",
+    "CREATE TRIGGER IF NOT EXISTS meetings_fts_ad AFTER DELETE ON meetings BEGIN "
+    "INSERT INTO meetings_fts (meetings_fts, rowid, title, participants) "
+    "VALUES ('delete', old.id, old.title, old.participants); END",
+    "CREATE TRIGGER IF NOT EXISTS meetings_fts_au "
+    "AFTER UPDATE OF title, participants ON meetings BEGIN "
+    "INSERT INTO meetings_fts (meetings_fts, rowid, title, participants) "
+    "VALUES ('delete', old.id, old.title, old.participants); "
+    "INSERT INTO meetings_fts (rowid, title, participants) "
+    "VALUES (new.id, new.title, new.participants); END",
+)
+
+# 后续版本新增的列，create_all 不会为已存在的表补列，启动时按需 ALTER TABLE
+_ADDED_COLUMNS = {
+    "meetings": {
+        "transcript_version": "INTEGER NOT NULL DEFAULT 0",
+        "notes_version": "INTEGER NOT NULL DEFAULT 0",
+    },
+}
+
 # 全局引擎实例
 _engine = None
 
+# 全文索引是否可用
+_fts_enabled = False
+
+# 线程本地的会话注册表
+_scoped_session: Optional[scoped_session] = None
+
 
 def get_engine():
     """获取数据库引擎"""
@@ -27,11 +73,12 @@ def get_engine():
             connect_args={"check_same_thread": False}
         )
 
-        # 启用外键约束
+        # 启用外键约束；WAL 模式下读写互不阻塞，synchronous=NORMAL 省去每次提交的 fsync
         @event.listens_for(_engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
             cursor.close()
 
         logger.info(f"数据库引擎初始化完成: {config.db_path}")
@@ -44,32 +91,100 @@ def init_db() -> None:
 
     engine = get_engine()
     SQLModel.metadata.create_all(engine)
+    _add_missing_columns(engine)
+
+    # create_all 不会为已存在的表补建索引，这里单独补齐
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+    _init_fts(engine)
     logger.info("数据库表创建完成")
 
 
+def _add_missing_columns(engine) -> None:
+    """为旧版本数据库补齐新增的列"""
+    with engine.begin() as conn:
+        for table_name, columns in _ADDED_COLUMNS.items():
+            existing = {
+                row[1] for row in conn.execute(text(f"PRAGMA table_info({table_name})"))
+            }
+            for column_name, ddl in columns.items():
+                if column_name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}"))
+                    logger.info(f"数据库迁移: {table_name} 新增列 {column_name}")
+
+
+def _init_fts(engine) -> None:
+    """创建会议全文索引及同步触发器，SQLite 不支持时退回 LIKE 搜索"""
+    global _fts_enabled
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meetings_fts'")
+            ).first()
+            if not exists:
+                conn.execute(text(_FTS_TABLE_DDL))
+                # 为已有数据建立索引
+                conn.execute(text("INSERT INTO meetings_fts (meetings_fts) VALUES ('rebuild')"))
+            for ddl in _FTS_TRIGGERS_DDL:
+                conn.execute(text(ddl))
+        _fts_enabled = True
+    except OperationalError as e:
+        _fts_enabled = False
+        logger.warning(f"全文索引不可用，搜索将使用 LIKE: {e}")
+
+
+def fts_enabled() -> bool:
+    """会议全文索引是否可用"""
+    return _fts_enabled
+
+
+def _get_scoped_session() -> scoped_session:
+    """获取线程本地的会话注册表"""
+    global _scoped_session
+    if _scoped_session is None:
+        # 提交后不过期对象，返回的对象无需再发 SELECT 刷新
+        factory = sessionmaker(
+            bind=get_engine(),
+            class_=Session,
+            expire_on_commit=False,
+        )
+        _scoped_session = scoped_session(factory)
+    return _scoped_session
+
+
 def get_session() -> Session:
-    """获取数据库会话"""
-    engine = get_engine()
-    return Session(engine)
+    """获取当前线程的数据库会话"""
+    return _get_scoped_session()()
 
 
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """数据库会话上下文管理器
 
+    同一线程内嵌套使用时共享同一个会话，只在最外层提交、回滚和释放
+
     使用示例:
         with session_scope() as session:
             meeting = Meeting(title="test")
             session.add(meeting)
             session.commit()
     """
-    session = get_session()
+    registry = _get_scoped_session()
+    session = registry()
+    depth = session.info.get("scope_depth", 0)
+    session.info["scope_depth"] = depth + 1
     try:
         yield session
-        session.commit()
+        if depth == 0:
+            session.commit()
     except Exception as e:
-        session.rollback()
-        logger.error(f"数据库操作失败: {e}")
+        if depth == 0:
+            session.rollback()
+            logger.error(f"数据库操作失败: {e}")
         raise
     finally:
-        session.close()
+        session.info["scope_depth"] = depth
+        if depth == 0:
+            registry.remove()
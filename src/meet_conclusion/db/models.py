@@ -6,6 +6,7 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -41,6 +42,14 @@ class Meeting(SQLModel, table=True):
     action_items_json: Optional[str] = Field(default=None, description="行动项JSON")
     topics_json: Optional[str] = Field(default=None, description="议题详情JSON")
 
+    # 内容版本号，转写/笔记每次变更时递增，用于判断生成 Prompt 的输入是否变化
+    transcript_version: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"}, description="转写版本号"
+    )
+    notes_version: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"}, description="笔记版本号"
+    )
+
     # 时间戳
     created_at: datetime = Field(default_factory=datetime.now, description="创建时间")
     updated_at: datetime = Field(default_factory=datetime.now, description="更新时间")
@@ -48,14 +57,21 @@ class Meeting(SQLModel, table=True):
     ended_at: Optional[datetime] = Field(default=None, description="结束录制时间")
 
     # 关联
-    transcripts: list["Transcript"] = Relationship(back_populates="meeting")
-    notes: list["Note"] = Relationship(back_populates="meeting")
+    transcripts: list["Transcript"] = Relationship(
+        back_populates="meeting",
+        sa_relationship_kwargs={"order_by": "Transcript.start_time"},
+    )
+    notes: list["Note"] = Relationship(
+        back_populates="meeting",
+        sa_relationship_kwargs={"order_by": "Note.time_offset"},
+    )
 
 
 class Transcript(SQLModel, table=True):
     """转写文本表"""
 
     __tablename__ = "transcripts"
+    __table_args__ = (Index("ix_transcripts_meeting_start", "meeting_id", "start_time"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     meeting_id: int = Field(foreign_key="meetings.id", index=True)
@@ -74,6 +90,7 @@ class Note(SQLModel, table=True):
     """用户笔记表"""
 
     __tablename__ = "notes"
+    __table_args__ = (Index("ix_notes_meeting_time", "meeting_id", "time_offset"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     meeting_id: int = Field(foreign_key="meetings.id", index=True)
@@ -90,6 +107,9 @@ class AudioChunk(SQLModel, table=True):
     """音频切片表"""
 
     __tablename__ = "audio_chunks"
+    __table_args__ = (
+        Index("ix_chunks_meeting_status_idx", "meeting_id", "status", "chunk_index"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     meeting_id: int = Field(foreign_key="meetings.id", index=True)
@@ -99,6 +119,6 @@ class AudioChunk(SQLModel, table=True):
     end_time: float = Field(description="结束时间(秒)")
     status: str = Field(
         default="pending",
-        description="处理状态: pending/transcribing/done/failed"
+        description="处理状态: pending/transcribing/done/failed/silent"
     )
     created_at: datetime = Field(default_factory=datetime.now, description="创建时间")
@@ -1,16 +1,87 @@
 """数据仓库模块 - CRUD操作"""
 
+import itertools
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
-from sqlmodel import Session, select
+from sqlalchemy import column, table, text
+from sqlalchemy.orm import defer, raiseload, selectinload
+from sqlmodel import Session, delete, insert, select, update
 
-from meet_conclusion.db.database import session_scope
+from meet_conclusion.db.database import fts_enabled, session_scope
 from meet_conclusion.db.models import AudioChunk, Meeting, Note, Transcript
 from meet_conclusion.utils.logger import get_logger
+from meet_conclusion.utils.result_cache import MemoryCache
 
 logger = get_logger(__name__)
 
+# 列表查询不加载的纪要大字段，详情页通过 get_by_id 完整加载；
+# 访问未加载的字段或关系时直接报错，避免逐行懒加载
+_DEFER_MINUTES = (
+    defer(Meeting.summary, raiseload=True),
+    defer(Meeting.decisions_json, raiseload=True),
+    defer(Meeting.action_items_json, raiseload=True),
+    defer(Meeting.topics_json, raiseload=True),
+    raiseload("*"),
+)
+
+
+# 按会议ID缓存完整会议对象；会议写入都经过 MeetingRepository，写入时同步更新或失效缓存项
+_meeting_cache: MemoryCache[int, Meeting] = MemoryCache(max_entries=256)
+
+
+@dataclass(slots=True, frozen=True)
+class MeetingSummary:
+    """会议列表展示用的摘要（普通数据对象，与会话无关，可以安全缓存）"""
+
+    id: int
+    title: str
+    status: str
+    created_at: datetime
+    duration: Optional[float]
+    participants: Optional[str]
+
+
+# 会议列表摘要缓存，键为 (状态, limit, offset, 列表版本号)；
+# 任何会议写入都会递增版本号，旧版本的缓存项自然不再命中
+_summary_cache: MemoryCache[tuple, tuple[MeetingSummary, ...]] = MemoryCache(max_entries=16)
+_list_epoch_counter = itertools.count(1)
+_list_epoch = 0
+
+
+def _bump_list_epoch() -> None:
+    """会议增删改后递增列表版本号"""
+    global _list_epoch
+    _list_epoch = next(_list_epoch_counter)
+
+
+def _bump_version(session: Session, column, meeting_ids: Iterable[int]) -> set[int]:
+    """在当前事务中递增会议的内容版本号
+
+    调用方提交后需要调用 _invalidate_meetings 使会议缓存失效
+
+    Args:
+        session: 数据库会话
+        column: 版本号列（Meeting.transcript_version / Meeting.notes_version）
+        meeting_ids: 内容发生变更的会议ID
+
+    Returns:
+        涉及的会议ID集合
+    """
+    ids = set(meeting_ids)
+    if ids:
+        session.execute(
+            update(Meeting).where(Meeting.id.in_(ids)).values({column: column + 1})
+        )
+    return ids
+
+
+def _invalidate_meetings(meeting_ids: Iterable[int]) -> None:
+    """使会议缓存失效"""
+    for meeting_id in meeting_ids:
+        _meeting_cache.invalidate(meeting_id)
+
 
 class MeetingRepository:
     """会议数据仓库"""
@@ -34,46 +105,140 @@ class MeetingRepository:
             )
             session.add(meeting)
             session.commit()
-            session.refresh(meeting)
+            _bump_list_epoch()
             logger.info(f"创建会议: {meeting.id} - {title}")
             return meeting
 
     @staticmethod
     def get_by_id(meeting_id: int) -> Optional[Meeting]:
-        """根据ID获取会议"""
+        """根据ID获取会议（优先读取缓存）"""
+        meeting = _meeting_cache.get(meeting_id)
+        if meeting is not None:
+            return meeting
+
         with session_scope() as session:
-            meeting = session.get(Meeting, meeting_id)
+            # 不加载转写和笔记，需要时使用 get_with_details
+            meeting = session.get(Meeting, meeting_id, options=[raiseload("*")])
+            if meeting:
+                _meeting_cache.put(meeting_id, meeting)
             return meeting
 
+    @staticmethod
+    def get_with_details(meeting_id: int, with_transcripts: bool = True) -> Optional[Meeting]:
+        """获取会议及其全部转写和笔记
+
+        转写和笔记通过 selectin 预加载，在会话关闭后可以直接访问
+        meeting.transcripts / meeting.notes，不会再触发查询
+
+        Args:
+            meeting_id: 会议ID
+            with_transcripts: 是否预加载转写，为 False 时只预加载笔记
+
+        Returns:
+            会议对象，不存在时返回 None
+        """
+        options = [selectinload(Meeting.notes).raiseload("*"), raiseload("*")]
+        if with_transcripts:
+            options.insert(0, selectinload(Meeting.transcripts).raiseload("*"))
+
+        with session_scope() as session:
+            query = (
+                select(Meeting)
+                .where(Meeting.id == meeting_id)
+                .options(*options)
+            )
+            return session.exec(query).first()
+
+    @staticmethod
+    def invalidate_cache(meeting_id: Optional[int] = None) -> None:
+        """使会议缓存失效
+
+        Args:
+            meeting_id: 会议ID，None 表示清空全部缓存
+        """
+        _meeting_cache.invalidate(meeting_id)
+
     @staticmethod
     def get_all(
         status: Optional[str] = None,
         limit: int = 100,
         offset: int = 0
     ) -> list[Meeting]:
-        """获取会议列表"""
+        """获取会议列表（不加载纪要内容）"""
         with session_scope() as session:
-            query = select(Meeting).order_by(Meeting.created_at.desc())
+            query = (
+                select(Meeting)
+                .options(*_DEFER_MINUTES)
+                .order_by(Meeting.created_at.desc())
+            )
             if status:
                 query = query.where(Meeting.status == status)
             query = query.offset(offset).limit(limit)
             meetings = session.exec(query).all()
             return list(meetings)
 
+    @staticmethod
+    def list_summaries(
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> list[MeetingSummary]:
+        """获取会议列表的摘要字段
+
+        只查询列表展示需要的列，结果按列表版本号缓存，会议没有变更时不再查询数据库
+
+        Returns:
+            会议摘要列表
+        """
+        key = (status, limit, offset, _list_epoch)
+        cached = _summary_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        with session_scope() as session:
+            query = (
+                select(
+                    Meeting.id,
+                    Meeting.title,
+                    Meeting.status,
+                    Meeting.created_at,
+                    Meeting.duration,
+                    Meeting.participants,
+                )
+                .order_by(Meeting.created_at.desc())
+            )
+            if status:
+                query = query.where(Meeting.status == status)
+            query = query.offset(offset).limit(limit)
+            summaries = tuple(MeetingSummary(*row) for row in session.exec(query))
+
+        _summary_cache.put(key, summaries)
+        return list(summaries)
+
     @staticmethod
     def update(meeting_id: int, **kwargs) -> Optional[Meeting]:
         """更新会议"""
+        columns = Meeting.__table__.c
+        values = {key: value for key, value in kwargs.items() if key in columns}
+        values["updated_at"] = datetime.now()
+
         with session_scope() as session:
-            meeting = session.get(Meeting, meeting_id)
+            # 单条 UPDATE ... RETURNING，无需先查询再刷新
+            stmt = (
+                update(Meeting)
+                .where(Meeting.id == meeting_id)
+                .values(**values)
+                .returning(Meeting)
+            )
+            meeting = session.execute(stmt).scalars().one_or_none()
+            session.commit()
+            _bump_list_epoch()
             if meeting:
-                for key, value in kwargs.items():
-                    if hasattr(meeting, key):
-                        setattr(meeting, key, value)
-                meeting.updated_at = datetime.now()
-                session.add(meeting)
-                session.commit()
-                session.refresh(meeting)
+                # RETURNING 返回的是完整的最新行，直接替换缓存
+                _meeting_cache.put(meeting_id, meeting)
                 logger.info(f"更新会议: {meeting_id}")
+            else:
+                _meeting_cache.invalidate(meeting_id)
             return meeting
 
     @staticmethod
@@ -123,26 +288,41 @@ class MeetingRepository:
     def delete(meeting_id: int) -> bool:
         """删除会议"""
         with session_scope() as session:
+            _meeting_cache.invalidate(meeting_id)
             meeting = session.get(Meeting, meeting_id)
             if meeting:
                 session.delete(meeting)
                 session.commit()
+                _bump_list_epoch()
                 logger.info(f"删除会议: {meeting_id}")
                 return True
             return False
 
     @staticmethod
     def search(keyword: str, limit: int = 50) -> list[Meeting]:
-        """搜索会议"""
+        """搜索会议（不加载纪要内容）"""
         with session_scope() as session:
-            query = (
-                select(Meeting)
-                .where(
+            # trigram 索引只能匹配至少 3 个字符的关键词，更短的仍用 LIKE
+            if fts_enabled() and len(keyword) >= 3:
+                matched_ids = (
+                    select(column("rowid"))
+                    .select_from(table("meetings_fts"))
+                    .where(text("meetings_fts MATCH :q"))
+                )
+                condition = Meeting.id.in_(matched_ids)
+            else:
+                condition = (
                     Meeting.title.contains(keyword)
                     | Meeting.participants.contains(keyword)
                 )
+
+            query = (
+                select(Meeting)
+                .options(*_DEFER_MINUTES)
+                .where(condition)
                 .order_by(Meeting.created_at.desc())
                 .limit(limit)
+                .params(q='"' + keyword.replace('"', '""') + '"')
             )
             meetings = session.exec(query).all()
             return list(meetings)
@@ -173,24 +353,36 @@ class TranscriptRepository:
                 chunk_index=chunk_index,
             )
             session.add(transcript)
+            ids = _bump_version(session, Meeting.transcript_version, (meeting_id,))
             session.commit()
-            session.refresh(transcript)
-            return transcript
+        _invalidate_meetings(ids)
+        return transcript
 
     @staticmethod
-    def create_batch(transcripts: list[dict]) -> list[Transcript]:
-        """批量创建转写记录"""
+    def create_batch(transcripts: Iterable[dict]) -> int:
+        """批量创建转写记录
+
+        以单条 executemany INSERT 写入，不经过 ORM 对象
+
+        Args:
+            transcripts: 转写记录数据，可以是生成器
+
+        Returns:
+            创建的记录数
+        """
+        rows = list(transcripts)
+        if not rows:
+            return 0
+
         with session_scope() as session:
-            result = []
-            for data in transcripts:
-                transcript = Transcript(**data)
-                session.add(transcript)
-                result.append(transcript)
+            session.execute(insert(Transcript), rows)
+            ids = _bump_version(
+                session, Meeting.transcript_version, (row["meeting_id"] for row in rows)
+            )
             session.commit()
-            for t in result:
-                session.refresh(t)
-            logger.info(f"批量创建转写记录: {len(result)} 条")
-            return result
+        _invalidate_meetings(ids)
+        logger.info(f"批量创建转写记录: {len(rows)} 条")
+        return len(rows)
 
     @staticmethod
     def get_by_meeting(
@@ -213,14 +405,17 @@ class TranscriptRepository:
     def delete_by_meeting(meeting_id: int) -> int:
         """删除会议的所有转写记录"""
         with session_scope() as session:
-            query = select(Transcript).where(Transcript.meeting_id == meeting_id)
-            transcripts = session.exec(query).all()
-            count = len(transcripts)
-            for t in transcripts:
-                session.delete(t)
+            # 单条 DELETE 语句，不加载对象
+            result = session.execute(
+                delete(Transcript).where(Transcript.meeting_id == meeting_id)
+            )
+            count = result.rowcount
+            changed = (meeting_id,) if count else ()
+            ids = _bump_version(session, Meeting.transcript_version, changed)
             session.commit()
-            logger.info(f"删除会议 {meeting_id} 的转写记录: {count} 条")
-            return count
+        _invalidate_meetings(ids)
+        logger.info(f"删除会议 {meeting_id} 的转写记录: {count} 条")
+        return count
 
 
 class NoteRepository:
@@ -242,10 +437,40 @@ class NoteRepository:
                 tag=tag,
             )
             session.add(note)
+            ids = _bump_version(session, Meeting.notes_version, (meeting_id,))
+            session.commit()
+        _invalidate_meetings(ids)
+        logger.info(f"创建笔记: 会议{meeting_id}, 时间{time_offset}s")
+        return note
+
+    @staticmethod
+    def bulk_create(notes: Iterable[dict]) -> list[int]:
+        """批量创建笔记
+
+        以单条 executemany INSERT 写入并一次提交，不经过 ORM 对象
+
+        Args:
+            notes: 笔记数据（meeting_id、time_offset、content、tag、created_at）
+
+        Returns:
+            新笔记的ID，顺序与传入的数据一致
+        """
+        rows = list(notes)
+        if not rows:
+            return []
+
+        with session_scope() as session:
+            result = session.execute(
+                insert(Note).returning(Note.id, sort_by_parameter_order=True), rows
+            )
+            note_ids = list(result.scalars())
+            ids = _bump_version(
+                session, Meeting.notes_version, (row["meeting_id"] for row in rows)
+            )
             session.commit()
-            session.refresh(note)
-            logger.info(f"创建笔记: 会议{meeting_id}, 时间{time_offset}s")
-            return note
+        _invalidate_meetings(ids)
+        logger.info(f"批量创建笔记: {len(rows)} 条")
+        return note_ids
 
     @staticmethod
     def get_by_meeting(meeting_id: int, tag: Optional[str] = None) -> list[Note]:
@@ -266,38 +491,44 @@ class NoteRepository:
         """更新笔记"""
         with session_scope() as session:
             note = session.get(Note, note_id)
-            if note:
-                note.content = content
-                if tag:
-                    note.tag = tag
-                session.add(note)
-                session.commit()
-                session.refresh(note)
-            return note
+            if not note:
+                return None
+            note.content = content
+            if tag:
+                note.tag = tag
+            session.add(note)
+            ids = _bump_version(session, Meeting.notes_version, (note.meeting_id,))
+            session.commit()
+        _invalidate_meetings(ids)
+        return note
 
     @staticmethod
     def delete(note_id: int) -> bool:
         """删除笔记"""
         with session_scope() as session:
             note = session.get(Note, note_id)
-            if note:
-                session.delete(note)
-                session.commit()
-                return True
-            return False
+            if not note:
+                return False
+            session.delete(note)
+            ids = _bump_version(session, Meeting.notes_version, (note.meeting_id,))
+            session.commit()
+        _invalidate_meetings(ids)
+        return True
 
     @staticmethod
     def delete_by_meeting(meeting_id: int) -> int:
         """删除会议的所有笔记"""
         with session_scope() as session:
-            query = select(Note).where(Note.meeting_id == meeting_id)
-            notes = session.exec(query).all()
-            count = len(notes)
-            for n in notes:
-                session.delete(n)
+            # 单条 DELETE 语句，不加载对象
+            result = session.execute(
+                delete(Note).where(Note.meeting_id == meeting_id)
+            )
+            count = result.rowcount
+            ids = _bump_version(session, Meeting.notes_version, (meeting_id,) if count else ())
             session.commit()
-            logger.info(f"删除会议 {meeting_id} 的笔记: {count} 条")
-            return count
+        _invalidate_meetings(ids)
+        logger.info(f"删除会议 {meeting_id} 的笔记: {count} 条")
+        return count
 
 
 class AudioChunkRepository:
@@ -310,6 +541,7 @@ class AudioChunkRepository:
         file_path: str,
         start_time: float,
         end_time: float,
+        status: str = "pending",
     ) -> AudioChunk:
         """创建音频切片记录"""
         with session_scope() as session:
@@ -319,12 +551,28 @@ class AudioChunkRepository:
                 file_path=file_path,
                 start_time=start_time,
                 end_time=end_time,
+                status=status,
             )
             session.add(chunk)
             session.commit()
-            session.refresh(chunk)
             return chunk
 
+    @staticmethod
+    def create_batch(chunks: Iterable[dict]) -> int:
+        """批量创建音频切片记录
+
+        Args:
+            chunks: 切片记录数据
+
+        Returns:
+            创建的记录数
+        """
+        with session_scope() as session:
+            records = [AudioChunk(**data) for data in chunks]
+            session.add_all(records)
+            session.commit()
+            return len(records)
+
     @staticmethod
     def get_by_meeting(meeting_id: int) -> list[AudioChunk]:
         """获取会议的所有音频切片"""
@@ -361,18 +609,17 @@ class AudioChunkRepository:
                 chunk.status = status
                 session.add(chunk)
                 session.commit()
-                session.refresh(chunk)
             return chunk
 
     @staticmethod
     def delete_by_meeting(meeting_id: int) -> int:
         """删除会议的所有音频切片记录"""
         with session_scope() as session:
-            query = select(AudioChunk).where(AudioChunk.meeting_id == meeting_id)
-            chunks = session.exec(query).all()
-            count = len(chunks)
-            for c in chunks:
-                session.delete(c)
+            # 单条 DELETE 语句，不加载对象
+            result = session.execute(
+                delete(AudioChunk).where(AudioChunk.meeting_id == meeting_id)
+            )
+            count = result.rowcount
             session.commit()
             logger.info(f"删除会议 {meeting_id} 的音频切片记录: {count} 条")
             return count
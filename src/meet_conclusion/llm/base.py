@@ -1,18 +1,32 @@
 """LLM Provider 抽象接口"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
 
-@dataclass
+class ContextOverflowError(ValueError):
+    """请求的 Prompt 加上输出预留超出模型上下文长度"""
+
+    def __init__(self, prompt_tokens: int, max_tokens: int, context_length: int):
+        self.prompt_tokens = prompt_tokens
+        self.max_tokens = max_tokens
+        self.context_length = context_length
+        super().__init__(
+            f"Prompt 约 {prompt_tokens} tokens，加上最大输出 {max_tokens} tokens "
+            f"超出模型上下文 {context_length} tokens"
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class LLMMessage:
     """LLM 消息"""
     role: str  # system, user, assistant
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
     """LLM 响应"""
     content: str
@@ -63,6 +77,49 @@ class LLMProvider(ABC):
         """
         pass
 
+    def complete_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """流式补全接口
+
+        默认实现退化为一次性补全，支持流式输出的提供者应覆盖此方法
+
+        Args:
+            prompt: 用户提示
+            system_prompt: 系统提示
+            temperature: 生成温度
+            max_tokens: 最大输出 token 数
+
+        Yields:
+            增量生成的文本片段
+        """
+        yield self.complete(prompt, system_prompt, temperature, max_tokens)
+
+    async def achat_stream(
+        self,
+        messages: list[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """异步流式聊天接口
+
+        默认实现在线程中执行一次性聊天，支持异步流式输出的提供者应覆盖此方法
+
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大输出 token 数
+
+        Yields:
+            增量生成的文本片段
+        """
+        response = await asyncio.to_thread(self.chat, messages, temperature, max_tokens)
+        yield response.content
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -3,17 +3,69 @@
 基于豆包大模型 API (兼容 OpenAI 格式) 的实现
 """
 
-import json
-from typing import Optional
+import asyncio
+import atexit
+import hashlib
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import AsyncIterator, Iterator, Optional
 
 import httpx
+import orjson
 
 from meet_conclusion.config import get_config
-from meet_conclusion.llm.base import LLMMessage, LLMProvider, LLMResponse
+from meet_conclusion.llm.base import ContextOverflowError, LLMMessage, LLMProvider, LLMResponse
+from meet_conclusion.llm.tokenizer import estimate_tokens
 from meet_conclusion.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 进程内共享的同步客户端，所有 DoubaoLLMProvider 实例复用同一个连接池
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """获取共享的同步客户端（首次使用时创建，进程退出时关闭）"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(http2=True, limits=_LIMITS, timeout=120.0)
+                atexit.register(_client.close)
+    return _client
+
+
+# 进程内共享的异步客户端（HTTP/2 多路复用 + keep-alive），在后台事件循环中首次使用时创建
+_ASYNC_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+_async_client: Optional[httpx.AsyncClient] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """获取共享的异步客户端
+
+    连接池绑定在创建它的事件循环上，换了事件循环时重新创建
+    """
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            limits=_ASYNC_LIMITS,
+            timeout=120.0,
+        )
+        _async_loop = loop
+    return _async_client
+
+
+@lru_cache(maxsize=256)
+def _message_tokens(message: LLMMessage) -> int:
+    """估算单条消息的 token 数（按消息缓存，重试时无需重新计算）"""
+    return estimate_tokens(message.content)
+
 
 class DoubaoLLMProvider(LLMProvider):
     """豆包 LLM 提供者"""
@@ -38,7 +90,11 @@ class DoubaoLLMProvider(LLMProvider):
         self.default_max_tokens = config.doubao_llm.max_tokens
         self.default_temperature = config.doubao_llm.temperature
 
-        self._client = httpx.Client(timeout=120.0)
+        self._client = _get_client()
+
+        # 进行中的补全请求，相同请求并发到达时共享同一次调用的结果
+        self._inflight: dict[bytes, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -60,40 +116,90 @@ class DoubaoLLMProvider(LLMProvider):
             "Content-Type": "application/json",
         }
 
-    def chat(
+    def _build_request_body(
         self,
         messages: list[LLMMessage],
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-    ) -> LLMResponse:
-        """聊天接口"""
-        url = f"{self.api_base}/chat/completions"
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> dict:
+        """构建请求体
 
-        request_body = {
+        system 消息固定放在最前面，保证不变的前缀逐字节一致，便于服务端复用 Prompt 缓存
+        """
+        ordered = sorted(messages, key=lambda msg: msg.role != "system")
+        return {
             "model": self.model,
             "messages": [
                 {"role": msg.role, "content": msg.content}
-                for msg in messages
+                for msg in ordered
             ],
             "temperature": temperature or self.default_temperature,
             "max_tokens": max_tokens or self.default_max_tokens,
         }
 
+    def _check_context(self, messages: list[LLMMessage], max_tokens: Optional[int]) -> None:
+        """发送前检查 Prompt 是否超出上下文，避免上传完整请求后才被服务端拒绝
+
+        Raises:
+            ContextOverflowError: Prompt 加上输出预留超出模型上下文
+        """
+        prompt_tokens = sum(map(_message_tokens, messages))
+        output_tokens = max_tokens or self.default_max_tokens
+        if prompt_tokens + output_tokens > self.max_context_length:
+            raise ContextOverflowError(prompt_tokens, output_tokens, self.max_context_length)
+
+    @staticmethod
+    def _log_cache_usage(usage: Optional[dict]) -> None:
+        """记录服务端 Prompt 缓存命中情况"""
+        if not usage:
+            return
+        prompt_tokens = usage.get("prompt_tokens") or 0
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        if prompt_tokens:
+            logger.debug(
+                f"Prompt 缓存命中: {cached_tokens}/{prompt_tokens} tokens "
+                f"({cached_tokens / prompt_tokens:.0%})"
+            )
+
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str]) -> list[LLMMessage]:
+        """构建补全接口的消息列表"""
+        messages = []
+
+        if system_prompt:
+            messages.append(LLMMessage(role="system", content=system_prompt))
+
+        messages.append(LLMMessage(role="user", content=prompt))
+        return messages
+
+    def chat(
+        self,
+        messages: list[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> LLMResponse:
+        """聊天接口"""
+        self._check_context(messages, max_tokens)
+        url = f"{self.api_base}/chat/completions"
+
+        request_body = self._build_request_body(messages, temperature, max_tokens)
+
         logger.debug(f"发送 LLM 请求: model={self.model}")
 
         try:
             response = self._client.post(
                 url,
                 headers=self._build_headers(),
-                content=json.dumps(request_body),
+                content=orjson.dumps(request_body),
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             content = data["choices"][0]["message"]["content"]
             usage = data.get("usage")
 
             logger.debug(f"LLM 响应成功: {len(content)} 字符")
+            self._log_cache_usage(usage)
 
             return LLMResponse(
                 content=content,
@@ -116,19 +222,200 @@ class DoubaoLLMProvider(LLMProvider):
         max_tokens: Optional[int] = None,
     ) -> str:
         """简单补全接口"""
-        messages = []
+        key = self._request_key(prompt, system_prompt, temperature, max_tokens)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
 
-        if system_prompt:
-            messages.append(LLMMessage(role="system", content=system_prompt))
+        if not owner:
+            logger.debug("合并相同的进行中 LLM 请求")
+            return future.result()
 
-        messages.append(LLMMessage(role="user", content=prompt))
+        try:
+            messages = self._build_messages(prompt, system_prompt)
+            content = self.chat(messages, temperature, max_tokens).content
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(content)
+            return content
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _request_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> bytes:
+        """计算请求内容的摘要，用于合并相同的并发请求"""
+        h = hashlib.blake2b(digest_size=16)
+        for part in (
+            self.model,
+            str(temperature or self.default_temperature),
+            str(max_tokens or self.default_max_tokens),
+            system_prompt or "",
+            prompt,
+        ):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.digest()
+
+    def chat_stream(
+        self,
+        messages: list[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """流式聊天接口（SSE）
+
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大输出 token 数
 
-        response = self.chat(messages, temperature, max_tokens)
-        return response.content
+        Yields:
+            增量生成的文本片段
+        """
+        self._check_context(messages, max_tokens)
+        url = f"{self.api_base}/chat/completions"
+
+        request_body = self._build_request_body(messages, temperature, max_tokens)
+        request_body["stream"] = True
+        request_body["stream_options"] = {"include_usage": True}
+
+        logger.debug(f"发送 LLM 流式请求: model={self.model}")
+
+        total = 0
+        try:
+            with self._client.stream(
+                "POST",
+                url,
+                headers=self._build_headers(),
+                content=orjson.dumps(request_body),
+            ) as response:
+                if response.is_error:
+                    response.read()
+                response.raise_for_status()
+
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+
+                    delta = self._parse_stream_data(payload)
+                    if delta:
+                        total += len(delta)
+                        yield delta
+
+            logger.debug(f"LLM 流式响应完成: {total} 字符")
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"LLM 请求失败: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"LLM 请求异常: {e}")
+            raise
+
+    async def achat_stream(
+        self,
+        messages: list[LLMMessage],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """异步流式聊天接口（SSE over HTTP/2）
+
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大输出 token 数
+
+        Yields:
+            增量生成的文本片段
+        """
+        self._check_context(messages, max_tokens)
+        url = f"{self.api_base}/chat/completions"
+
+        request_body = self._build_request_body(messages, temperature, max_tokens)
+        request_body["stream"] = True
+        request_body["stream_options"] = {"include_usage": True}
+
+        logger.debug(f"发送 LLM 异步流式请求: model={self.model}")
+
+        total = 0
+        try:
+            async with _get_async_client().stream(
+                "POST",
+                url,
+                headers=self._build_headers(),
+                content=orjson.dumps(request_body),
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if payload == "[DONE]":
+                        break
+
+                    delta = self._parse_stream_data(payload)
+                    if delta:
+                        total += len(delta)
+                        yield delta
+
+            logger.debug(f"LLM 异步流式响应完成: {total} 字符")
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"LLM 请求失败: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"LLM 请求异常: {e}")
+            raise
+
+    def _parse_stream_data(self, payload: str) -> Optional[str]:
+        """解析一条 SSE data 负载
+
+        Args:
+            payload: data: 之后的 JSON 文本
+
+        Returns:
+            增量文本，没有内容时返回 None
+        """
+        data = orjson.loads(payload)
+        if data.get("usage"):
+            self._log_cache_usage(data["usage"])
+        choices = data.get("choices")
+        if not choices:
+            return None
+        return choices[0].get("delta", {}).get("content")
+
+    def complete_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """流式补全接口"""
+        messages = self._build_messages(prompt, system_prompt)
+        return self.chat_stream(messages, temperature, max_tokens)
 
     def close(self):
-        """关闭客户端"""
-        self._client.close()
+        """释放资源
+
+        HTTP 客户端在进程内共享，由进程退出时统一关闭，这里无需处理
+        """
 
     def __enter__(self):
         return self
@@ -1,22 +1,78 @@
 """会议纪要生成器"""
 
-import json
-import re
-from dataclasses import dataclass
-from typing import Optional
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+import orjson
 
 from meet_conclusion.asr.base import TranscriptResult, TranscriptSegment
+from meet_conclusion.config import get_config
 from meet_conclusion.db.models import Meeting, Note
 from meet_conclusion.llm.base import LLMProvider
 from meet_conclusion.llm.doubao_llm import DoubaoLLMProvider
-from meet_conclusion.llm.prompt_templates import build_system_prompt, build_user_prompt
+from meet_conclusion.llm.prompt_templates import (
+    CHUNK_SYSTEM_PROMPT,
+    build_cache_key_prefix,
+    build_chunk_prompt,
+    build_system_prompt,
+    build_user_prompt,
+)
+from meet_conclusion.llm.tokenizer import estimate_tokens
 from meet_conclusion.utils.logger import get_logger
+from meet_conclusion.utils.result_cache import MemoryCache, ResultCache
 from meet_conclusion.utils.time_utils import format_duration
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# 转写时间戳只精确到秒，按整数秒缓存格式化结果
+_format_seconds = lru_cache(maxsize=8192)(format_duration)
+
+# 最近构建的用户 Prompt，键为 (会议ID, 转写版本号, 笔记版本号, 标题, 参与人)
+_user_prompt_cache: MemoryCache[tuple, str] = MemoryCache(max_entries=64)
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """单遍扫描提取第一个完整的 JSON 对象
+
+    跟踪括号深度和字符串/转义状态，字符串中的花括号不会干扰匹配
+
+    Args:
+        text: LLM 响应文本
+
+    Returns:
+        JSON 对象文本，未找到完整对象时返回 None
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class MinutesResult:
     """纪要生成结果"""
 
@@ -38,11 +94,23 @@ class MinutesGenerator:
         """
         self._llm = llm_provider or DoubaoLLMProvider()
 
+        # 纪要结果缓存（相同 Prompt 重复生成时直接返回）
+        config = get_config()
+        self._chunk_max_tokens = config.doubao_llm.chunk_max_tokens
+        self._chunk_workers = config.doubao_llm.chunk_workers
+        self._cache: Optional[ResultCache] = None
+        if config.doubao_llm.cache_enabled:
+            self._cache = ResultCache(
+                config.cache_dir / "minutes_cache.sqlite",
+                max_entries=config.doubao_llm.cache_max_entries,
+            )
+
     def generate(
         self,
         meeting: Meeting,
         transcript: TranscriptResult,
         notes: list[Note],
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> MinutesResult:
         """生成会议纪要
 
@@ -50,17 +118,127 @@ class MinutesGenerator:
             meeting: 会议对象
             transcript: 转写结果
             notes: 用户笔记列表
+            on_delta: 流式输出回调，提供时按增量接收 LLM 输出
 
         Returns:
             纪要生成结果
         """
         logger.info(f"开始生成会议纪要: {meeting.id} - {meeting.title}")
 
-        # 构建转写文本
-        transcript_text = self._format_transcript(transcript)
+        # 构建 Prompt
+        system_prompt = build_system_prompt(
+            perspective=meeting.user_perspective,
+            style=meeting.output_style,
+            custom_perspective=meeting.custom_perspective,
+        )
+        user_prompt = self._get_user_prompt(meeting, transcript, notes)
+
+        # 完全相同的 Prompt 和模型已生成过时直接使用缓存
+        cache_key = self._cache_key(system_prompt, user_prompt)
+        if self._cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"命中纪要缓存: {meeting.id}")
+                return MinutesResult(**cached)
+
+        # 转写超出上下文时先分段摘要，再基于各段要点生成纪要；
+        # 拼接后的要点仍然超出时，把各段要点再分段压缩一轮
+        if self._exceeds_context(system_prompt, user_prompt):
+            lines = [self._format_segment(segment) for segment in transcript.segments]
+            while True:
+                sections = self._summarize_chunks(lines)
+                user_prompt = build_user_prompt(
+                    transcript_text="\n\n".join(sections),
+                    notes=self._notes_data(notes),
+                    meeting_info=self._meeting_info(meeting),
+                    summarized=True,
+                )
+                if not self._exceeds_context(system_prompt, user_prompt):
+                    break
+                if len(sections) <= 1 or len(sections) >= len(lines):
+                    # 无法继续压缩，交给 LLM 调用时的上下文检查报错
+                    break
+                logger.info(f"分段要点仍超出上下文，继续压缩 {len(sections)} 段要点")
+                lines = sections
+
+        # 调用 LLM
+        cache_prefix = build_cache_key_prefix(
+            meeting.user_perspective, meeting.output_style, meeting.custom_perspective
+        )
+        logger.info(f"调用 LLM 生成纪要... (系统 Prompt 前缀: {cache_prefix})")
+        if on_delta is None:
+            response = self._llm.complete(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+            )
+        else:
+            parts = []
+            for delta in self._llm.complete_stream(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+            ):
+                parts.append(delta)
+                on_delta(delta)
+            response = "".join(parts)
+
+        # 解析结果，只缓存成功解析为 JSON 的结果，解析失败时下次重新生成
+        result = self._parse_json(response)
+        if result is not None:
+            if self._cache:
+                self._cache.put(cache_key, asdict(result))
+        else:
+            result = self._plain_text_result(response)
+        logger.info(f"会议纪要生成完成: {len(result.summary)} 字摘要, "
+                   f"{len(result.decisions)} 项决策, {len(result.action_items)} 项行动项")
+
+        return result
+
+    def _get_user_prompt(
+        self,
+        meeting: Meeting,
+        transcript: TranscriptResult,
+        notes: list[Note],
+    ) -> str:
+        """构建用户 Prompt（按会议内容版本号缓存）
+
+        转写和笔记未变更时（版本号不变）直接复用上次构建的 Prompt，
+        不再遍历全部转写片段。调用方传入的转写和笔记应与数据库中的一致
 
-        # 构建笔记列表
-        notes_data = [
+        Args:
+            meeting: 会议对象
+            transcript: 转写结果
+            notes: 用户笔记列表
+
+        Returns:
+            用户 Prompt
+        """
+        key = None
+        if meeting.id is not None:
+            key = (
+                meeting.id,
+                meeting.transcript_version,
+                meeting.notes_version,
+                meeting.title,
+                meeting.participants,
+            )
+            user_prompt = _user_prompt_cache.get(key)
+            if user_prompt is not None:
+                logger.debug(f"复用会议 {meeting.id} 的用户 Prompt")
+                return user_prompt
+
+        user_prompt = build_user_prompt(
+            transcript_text=self._format_transcript(transcript),
+            notes=self._notes_data(notes),
+            meeting_info=self._meeting_info(meeting),
+        )
+        if key is not None:
+            _user_prompt_cache.put(key, user_prompt)
+        return user_prompt
+
+    @staticmethod
+    def _notes_data(notes: list[Note]) -> list[dict]:
+        """构建笔记列表"""
+        return [
             {
                 "time_offset": note.time_offset,
                 "content": note.content,
@@ -69,38 +247,30 @@ class MinutesGenerator:
             for note in notes
         ]
 
-        # 构建会议信息
-        meeting_info = {
+    @staticmethod
+    def _meeting_info(meeting: Meeting) -> dict:
+        """构建会议信息"""
+        return {
             "title": meeting.title,
             "participants": meeting.participants,
         }
 
-        # 构建 Prompt
-        system_prompt = build_system_prompt(
-            perspective=meeting.user_perspective,
-            style=meeting.output_style,
-            custom_perspective=meeting.custom_perspective,
-        )
+    def _cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        """计算纪要缓存键
 
-        user_prompt = build_user_prompt(
-            transcript_text=transcript_text,
-            notes=notes_data,
-            meeting_info=meeting_info,
-        )
-
-        # 调用 LLM
-        logger.info("调用 LLM 生成纪要...")
-        response = self._llm.complete(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-        )
-
-        # 解析结果
-        result = self._parse_response(response)
-        logger.info(f"会议纪要生成完成: {len(result.summary)} 字摘要, "
-                   f"{len(result.decisions)} 项决策, {len(result.action_items)} 项行动项")
+        Args:
+            system_prompt: 系统 Prompt
+            user_prompt: 用户 Prompt
 
-        return result
+        Returns:
+            缓存键
+        """
+        model = getattr(self._llm, "model", "")
+        h = hashlib.blake2b(digest_size=20)
+        for part in (self._llm.name, model, system_prompt, user_prompt):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return f"minutes:{h.hexdigest()}"
 
     def _format_transcript(self, transcript: TranscriptResult) -> str:
         """格式化转写文本
@@ -111,13 +281,137 @@ class MinutesGenerator:
         Returns:
             格式化的转写文本
         """
-        lines = []
-        for segment in transcript.segments:
-            time_str = format_duration(segment.start_time)
-            speaker = segment.speaker_id or "未知"
-            lines.append(f"[{time_str}] {speaker}: {segment.text}")
+        return "\n".join(map(self._format_segment, transcript.segments))
+
+    @staticmethod
+    def _format_segment(segment: TranscriptSegment) -> str:
+        """格式化单条转写片段"""
+        time_str = _format_seconds(int(segment.start_time))
+        return f"[{time_str}] {segment.speaker_id or '未知'}: {segment.text}"
+
+    def _exceeds_context(self, system_prompt: str, user_prompt: str) -> bool:
+        """判断 Prompt 加上输出预留是否超出模型上下文
+
+        Args:
+            system_prompt: 系统 Prompt
+            user_prompt: 用户 Prompt
+
+        Returns:
+            是否超出上下文
+        """
+        reserved = getattr(self._llm, "default_max_tokens", 0)
+        total = estimate_tokens(system_prompt) + estimate_tokens(user_prompt) + reserved
+        return total > self._llm.max_context_length
 
-        return "\n".join(lines)
+    def _chunk_budget(self) -> int:
+        """每段转写的最大 token 数
+
+        不超过 chunk_max_tokens，且分段摘要的请求（系统 Prompt + 段落 + 输出预留）
+        不超出模型上下文
+
+        Returns:
+            每段最大 token 数
+        """
+        reserved = getattr(self._llm, "default_max_tokens", 0)
+        overhead = estimate_tokens(CHUNK_SYSTEM_PROMPT) + estimate_tokens(
+            build_chunk_prompt("", 9999, 9999)
+        )
+        budget = self._llm.max_context_length - reserved - overhead
+        return max(1, min(self._chunk_max_tokens, budget))
+
+    def _chunk_lines(self, lines: list[str]) -> list[list[str]]:
+        """按行边界把文本切分为不超过 _chunk_budget() 的若干段
+
+        Args:
+            lines: 格式化的转写行（或上一轮的各段要点）
+
+        Returns:
+            每段的行列表
+        """
+        budget = self._chunk_budget()
+        chunks: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for line in lines:
+            # 加 1 计入拼接时的换行符
+            tokens = estimate_tokens(line) + 1
+            if current and current_tokens + tokens > budget:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(line)
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _summarize_chunks(self, lines: list[str]) -> list[str]:
+        """分段并发摘要长转写
+
+        Args:
+            lines: 格式化的转写行（或上一轮的各段要点）
+
+        Returns:
+            按时间顺序排列的各段要点
+        """
+        chunks = self._chunk_lines(lines)
+        total = len(chunks)
+        logger.info(f"转写文本超出上下文，分 {total} 段摘要后再生成纪要")
+
+        def summarize(index: int) -> str:
+            prompt = build_chunk_prompt("\n".join(chunks[index]), index + 1, total)
+            return self._llm.complete(prompt=prompt, system_prompt=CHUNK_SYSTEM_PROMPT)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self._chunk_workers, total)),
+            thread_name_prefix="minutes-chunk",
+        ) as executor:
+            summaries = list(executor.map(summarize, range(total)))
+
+        return [
+            f"### 第 {i}/{total} 段\n{summary.strip()}"
+            for i, summary in enumerate(summaries, 1)
+        ]
+
+    def _parse_json(self, response: str) -> Optional[MinutesResult]:
+        """从 LLM 响应中提取 JSON 格式的纪要
+
+        Args:
+            response: LLM 响应文本
+
+        Returns:
+            解析后的纪要结果，未找到有效 JSON 时返回 None
+        """
+        # 按要求模型只输出 JSON 对象，此时整段响应即可直接解析
+        stripped = response.strip()
+        candidates = [stripped] if stripped.startswith("{") else []
+        json_text = _extract_json(response)
+        if json_text is not None:
+            candidates.append(json_text)
+        # 退回到旧的首个 "{" 到最后一个 "}" 的范围
+        start, end = response.find("{"), response.rfind("}")
+        if 0 <= start < end:
+            candidates.append(response[start:end + 1])
+
+        error = None
+        for candidate in dict.fromkeys(candidates):
+            try:
+                data = orjson.loads(candidate)
+            except orjson.JSONDecodeError as e:
+                error = e
+                continue
+            if not isinstance(data, dict):
+                continue
+            return MinutesResult(
+                summary=data.get("summary", ""),
+                decisions=data.get("decisions", []),
+                action_items=data.get("action_items", []),
+                topics=data.get("topics", []),
+                raw_response=response,
+            )
+
+        if error is not None:
+            logger.warning(f"JSON 解析失败: {error}")
+        return None
 
     def _parse_response(self, response: str) -> MinutesResult:
         """解析 LLM 响应
@@ -129,21 +423,21 @@ class MinutesGenerator:
             解析后的纪要结果
         """
         # 尝试提取 JSON
-        json_match = re.search(r'\{[\s\S]*\}', response)
-        if json_match:
-            try:
-                data = json.loads(json_match.group())
-                return MinutesResult(
-                    summary=data.get("summary", ""),
-                    decisions=data.get("decisions", []),
-                    action_items=data.get("action_items", []),
-                    topics=data.get("topics", []),
-                    raw_response=response,
-                )
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON 解析失败: {e}")
+        result = self._parse_json(response)
+        if result is not None:
+            return result
+        return self._plain_text_result(response)
+
+    @staticmethod
+    def _plain_text_result(response: str) -> MinutesResult:
+        """JSON 解析失败时，将整个响应作为摘要
 
-        # 如果 JSON 解析失败，将整个响应作为摘要
+        Args:
+            response: LLM 响应文本
+
+        Returns:
+            纯文本摘要的纪要结果
+        """
         logger.warning("未能解析 JSON 格式，将响应作为纯文本摘要")
         return MinutesResult(
             summary=response,
@@ -157,6 +451,8 @@ class MinutesGenerator:
         """关闭资源"""
         if hasattr(self._llm, 'close'):
             self._llm.close()
+        if self._cache:
+            self._cache.close()
 
     def __enter__(self):
         return self
@@ -3,6 +3,7 @@
 定义不同视角和风格的 Prompt 模板
 """
 
+import hashlib
 from typing import Optional
 
 # 系统基础 Prompt
@@ -15,7 +16,7 @@ SYSTEM_BASE = """你是一位专业的会议纪要助手。你需要根据会议
 4. 议题详情：按主题分块的详细纪要
 
 输出格式要求：
-- 使用 JSON 格式输出
+- 只输出一个 JSON 对象，不要附加任何说明文字，也不要使用 Markdown 代码块
 - 结构如下：
 {
   "summary": "会议摘要文本",
@@ -108,6 +109,23 @@ STYLE_PROMPTS = {
 }
 
 
+def _join_system_prompt(perspective_prompt: str, style_prompt: str) -> str:
+    """按 基础 -> 视角 -> 风格 的固定顺序拼接系统 Prompt
+
+    各段去掉首尾空白后以空行分隔，相同参数得到逐字节一致的结果，
+    服务端才能命中 Prompt 前缀缓存
+    """
+    return "\n\n".join((SYSTEM_BASE.strip(), perspective_prompt.strip(), style_prompt.strip()))
+
+
+# 预先拼接好所有固定的 视角 x 风格 组合（未填写内容的自定义视角也按模板原文预拼接）
+_PRECOMPUTED_SYSTEM_PROMPTS: dict[tuple[str, str], str] = {
+    (perspective, style): _join_system_prompt(perspective_prompt, style_prompt)
+    for perspective, perspective_prompt in PERSPECTIVE_PROMPTS.items()
+    for style, style_prompt in STYLE_PROMPTS.items()
+}
+
+
 def build_system_prompt(
     perspective: str = "worker",
     style: str = "neutral",
@@ -123,25 +141,92 @@ def build_system_prompt(
     Returns:
         完整的系统 Prompt
     """
-    parts = [SYSTEM_BASE]
+    if perspective not in PERSPECTIVE_PROMPTS:
+        perspective = "worker"
+    if style not in STYLE_PROMPTS:
+        style = "neutral"
 
-    # 添加视角 Prompt
-    perspective_prompt = PERSPECTIVE_PROMPTS.get(perspective, PERSPECTIVE_PROMPTS["worker"])
+    # 只有填写了内容的自定义视角需要现场拼接
     if perspective == "custom" and custom_perspective:
-        perspective_prompt = perspective_prompt.format(custom_perspective=custom_perspective)
-    parts.append(perspective_prompt)
+        perspective_prompt = PERSPECTIVE_PROMPTS["custom"].format(
+            custom_perspective=custom_perspective.strip()
+        )
+        return _join_system_prompt(perspective_prompt, STYLE_PROMPTS[style])
 
-    # 添加风格 Prompt
-    style_prompt = STYLE_PROMPTS.get(style, STYLE_PROMPTS["neutral"])
-    parts.append(style_prompt)
+    return _PRECOMPUTED_SYSTEM_PROMPTS[(perspective, style)]
 
-    return "\n".join(parts)
+
+def build_cache_key_prefix(
+    perspective: str = "worker",
+    style: str = "neutral",
+    custom_perspective: Optional[str] = None,
+) -> str:
+    """计算系统 Prompt 的缓存前缀标识
+
+    相同的视角、风格和自定义视角对应同一个系统 Prompt，可用于观察前缀缓存复用
+
+    Args:
+        perspective: 视角
+        style: 风格
+        custom_perspective: 自定义视角描述
+
+    Returns:
+        16 位十六进制标识
+    """
+    system_prompt = build_system_prompt(perspective, style, custom_perspective)
+    return hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# 长会议分段摘要使用的系统 Prompt
+CHUNK_SYSTEM_PROMPT = """你是一位专业的会议纪要助手。你会收到一场长会议中的一段转写文本，\
+请提炼这一段的要点，之后会与其他段落的要点一起汇总成完整的会议纪要。
+
+输出要求：
+- 按时间顺序列出本段讨论的议题及主要观点
+- 保留明确做出的决策、行动项（负责人、截止时间）和关键数据
+- 尽量保留发言人信息
+- 直接输出要点列表，不要输出 JSON，不要编造转写中没有的内容"""
+
+
+def build_chunk_prompt(transcript_text: str, index: int, total: int) -> str:
+    """构建分段摘要的用户 Prompt
+
+    Args:
+        transcript_text: 本段转写文本
+        index: 段落序号（从 1 开始）
+        total: 总段数
+
+    Returns:
+        用户 Prompt
+    """
+    return (
+        f"## 会议转写文本（第 {index}/{total} 段）\n"
+        f"{transcript_text}\n\n"
+        "请提炼本段的要点。"
+    )
+
+
+# 笔记标签在 Prompt 中的显示名称
+_NOTE_TAG_NAMES = {
+    "todo": "TODO",
+    "risk": "风险",
+    "question": "问题",
+    "general": "笔记",
+}
+
+
+def _format_note(note: dict) -> str:
+    """格式化单条笔记，形如 - [01:23] [风险] 内容"""
+    minutes, seconds = divmod(int(note.get("time_offset", 0)), 60)
+    tag = _NOTE_TAG_NAMES.get(note.get("tag", "general"), "笔记")
+    return f"- [{minutes:02d}:{seconds:02d}] [{tag}] {note.get('content', '')}"
 
 
 def build_user_prompt(
     transcript_text: str,
     notes: list[dict],
     meeting_info: Optional[dict] = None,
+    summarized: bool = False,
 ) -> str:
     """构建用户 Prompt
 
@@ -149,6 +234,7 @@ def build_user_prompt(
         transcript_text: 转写文本
         notes: 用户笔记列表，每项包含 time_offset, content, tag
         meeting_info: 会议信息，包含 title, participants 等
+        summarized: transcript_text 是否为长会议的分段摘要而不是原始转写
 
     Returns:
         用户 Prompt
@@ -165,7 +251,11 @@ def build_user_prompt(
         parts.append("")
 
     # 转写文本
-    parts.append("## 会议转写文本")
+    if summarized:
+        parts.append("## 会议分段摘要")
+        parts.append("（会议较长，以下是按时间顺序逐段提炼的要点）")
+    else:
+        parts.append("## 会议转写文本")
     parts.append(transcript_text)
     parts.append("")
 
@@ -175,24 +265,10 @@ def build_user_prompt(
         parts.append("（以下是用户在会议中标记的重要内容，请在纪要中重点体现）")
         parts.append("")
 
-        tag_names = {
-            "todo": "TODO",
-            "risk": "风险",
-            "question": "问题",
-            "general": "笔记",
-        }
-
-        for note in notes:
-            time_offset = note.get("time_offset", 0)
-            minutes = int(time_offset // 60)
-            seconds = int(time_offset % 60)
-            tag = tag_names.get(note.get("tag", "general"), "笔记")
-            content = note.get("content", "")
-            parts.append(f"- [{minutes:02d}:{seconds:02d}] [{tag}] {content}")
-
+        parts.extend(map(_format_note, notes))
         parts.append("")
 
     # 请求
-    parts.append("请根据以上内容生成会议纪要，以 JSON 格式输出。")
+    parts.append("请根据以上内容生成会议纪要，直接输出 JSON 对象。")
 
     return "\n".join(parts)
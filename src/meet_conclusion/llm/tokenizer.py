@@ -0,0 +1,24 @@
+"""Token 数估算模块
+
+不依赖具体模型的分词器，按字符类别粗略估算 token 数，用于判断 Prompt 是否超出上下文
+"""
+
+import re
+
+# 中日韩文字及全角标点，大致每个字符对应一个 token
+_CJK_RE = re.compile(r"[\u3000-\u303f\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]")
+
+
+def estimate_tokens(text: str) -> int:
+    """估算文本的 token 数
+
+    中日韩字符按 1 个 token 计，其余字符按 4 个字符 1 个 token 计
+
+    Args:
+        text: 文本
+
+    Returns:
+        估算的 token 数
+    """
+    cjk = _CJK_RE.subn("", text)[1]
+    return cjk + (len(text) - cjk + 3) // 4
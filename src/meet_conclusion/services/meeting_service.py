@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from meet_conclusion.core.batch_processor import BatchProcessor
 from meet_conclusion.core.meeting_manager import MeetingManager, get_meeting_manager
 from meet_conclusion.core.recording_engine import RecordingState
 from meet_conclusion.db.models import Meeting
@@ -81,6 +82,22 @@ class MeetingService:
         """处理会议"""
         return self._manager.process_meeting(meeting_id, audio_urls)
 
+    def process_meetings(
+        self,
+        meeting_ids: list[int],
+        max_workers: Optional[int] = None,
+    ) -> dict[int, bool]:
+        """为多个已转写的会议并发重新生成纪要
+
+        Args:
+            meeting_ids: 会议ID列表
+            max_workers: 最大并发数，默认从配置读取
+
+        Returns:
+            会议ID到是否成功的映射
+        """
+        return BatchProcessor(max_workers=max_workers).process(meeting_ids)
+
     def get_recording_state(self) -> RecordingState:
         """获取录音状态"""
         return self._manager.get_recording_state()
@@ -1,5 +1,7 @@
 """主窗口"""
 
+from typing import TYPE_CHECKING, Optional
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -12,11 +14,13 @@ from PySide6.QtWidgets import (
 from meet_conclusion.config import get_config
 from meet_conclusion.ui.widgets.meeting_list import MeetingListWidget
 from meet_conclusion.ui.widgets.meeting_form import MeetingFormWidget
-from meet_conclusion.ui.widgets.recording_panel import RecordingPanelWidget
-from meet_conclusion.ui.widgets.note_editor import NoteEditorWidget
-from meet_conclusion.ui.widgets.minutes_viewer import MinutesViewerWidget
 from meet_conclusion.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from meet_conclusion.ui.widgets.minutes_viewer import MinutesViewerWidget
+    from meet_conclusion.ui.widgets.note_editor import NoteEditorWidget
+    from meet_conclusion.ui.widgets.recording_panel import RecordingPanelWidget
+
 logger = get_logger(__name__)
 
 
@@ -26,6 +30,12 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config = get_config()
+
+        # 录制面板、笔记编辑和纪要查看在首次使用时才创建
+        self._recording_panel: Optional["RecordingPanelWidget"] = None
+        self._note_editor: Optional["NoteEditorWidget"] = None
+        self._minutes_viewer: Optional["MinutesViewerWidget"] = None
+
         self._init_ui()
         self._connect_signals()
 
@@ -57,26 +67,14 @@ class MainWindow(QMainWindow):
         right_layout = QVBoxLayout(right_widget)
         right_layout.setContentsMargins(10, 10, 10, 10)
 
-        # 会议表单/录制控制区
+        # 会议表单/录制控制区（录制面板首次使用时插入到表单下方）
         self.meeting_form = MeetingFormWidget()
-        self.recording_panel = RecordingPanelWidget()
-        self.recording_panel.hide()
-
         right_layout.addWidget(self.meeting_form)
-        right_layout.addWidget(self.recording_panel)
+        self._right_layout = right_layout
 
         # 下方分割区：笔记编辑 + 纪要查看
-        bottom_splitter = QSplitter(Qt.Orientation.Horizontal)
-
-        self.note_editor = NoteEditorWidget()
-        self.note_editor.hide()
-        bottom_splitter.addWidget(self.note_editor)
-
-        self.minutes_viewer = MinutesViewerWidget()
-        self.minutes_viewer.hide()
-        bottom_splitter.addWidget(self.minutes_viewer)
-
-        right_layout.addWidget(bottom_splitter, stretch=1)
+        self._bottom_splitter = QSplitter(Qt.Orientation.Horizontal)
+        right_layout.addWidget(self._bottom_splitter, stretch=1)
 
         splitter.addWidget(right_widget)
 
@@ -94,8 +92,43 @@ class MainWindow(QMainWindow):
         # 会议表单信号
         self.meeting_form.start_recording.connect(self._on_start_recording)
 
-        # 录制面板信号
-        self.recording_panel.stop_recording.connect(self._on_stop_recording)
+    @property
+    def recording_panel(self) -> "RecordingPanelWidget":
+        """录制面板（首次访问时创建）"""
+        if self._recording_panel is None:
+            from meet_conclusion.ui.widgets.recording_panel import RecordingPanelWidget
+            self._recording_panel = RecordingPanelWidget()
+            self._recording_panel.hide()
+            self._right_layout.insertWidget(1, self._recording_panel)
+            self._recording_panel.stop_recording.connect(self._on_stop_recording)
+        return self._recording_panel
+
+    @property
+    def note_editor(self) -> "NoteEditorWidget":
+        """笔记编辑器（首次访问时创建）"""
+        if self._note_editor is None:
+            from meet_conclusion.ui.widgets.note_editor import NoteEditorWidget
+            self._note_editor = NoteEditorWidget()
+            self._note_editor.hide()
+            self._bottom_splitter.insertWidget(0, self._note_editor)
+        return self._note_editor
+
+    @property
+    def minutes_viewer(self) -> "MinutesViewerWidget":
+        """纪要查看器（首次访问时创建）"""
+        if self._minutes_viewer is None:
+            from meet_conclusion.ui.widgets.minutes_viewer import MinutesViewerWidget
+            self._minutes_viewer = MinutesViewerWidget()
+            self._minutes_viewer.hide()
+            self._bottom_splitter.addWidget(self._minutes_viewer)
+        return self._minutes_viewer
+
+    @staticmethod
+    def _hide_if_created(*widgets: Optional[QWidget]) -> None:
+        """隐藏已创建的部件，尚未创建的部件无需处理"""
+        for widget in widgets:
+            if widget is not None:
+                widget.hide()
 
     def _on_meeting_selected(self, meeting_id: int):
         """处理会议选中事件"""
@@ -105,32 +138,34 @@ class MainWindow(QMainWindow):
         if meeting:
             if meeting.status == "done":
                 self.meeting_form.hide()
-                self.recording_panel.hide()
-                self.note_editor.hide()
+                self._hide_if_created(self._recording_panel, self._note_editor)
                 self.minutes_viewer.show()
-                self.minutes_viewer.load_meeting(meeting)
+                # 笔记随会议预加载；转写数据量大，打开转写页时才查询
+                details = MeetingRepository.get_with_details(meeting_id, with_transcripts=False)
+                if details:
+                    self.minutes_viewer.load_meeting(details)
             elif meeting.status == "recording":
                 self.meeting_form.hide()
                 self.recording_panel.show()
                 self.recording_panel.set_meeting(meeting)
                 self.note_editor.show()
-                self.note_editor.set_meeting(meeting)
-                self.minutes_viewer.hide()
+                # 笔记随会议一起预加载，编辑器无需再单独查询
+                details = MeetingRepository.get_with_details(meeting_id, with_transcripts=False)
+                self.note_editor.set_meeting(details or meeting)
+                self._hide_if_created(self._minutes_viewer)
             else:
                 self.meeting_form.show()
                 self.meeting_form.load_meeting(meeting)
-                self.recording_panel.hide()
-                self.note_editor.hide()
-                self.minutes_viewer.hide()
+                self._hide_if_created(
+                    self._recording_panel, self._note_editor, self._minutes_viewer
+                )
 
     def _on_new_meeting(self):
         """处理新建会议事件"""
         logger.info("新建会议")
         self.meeting_form.show()
         self.meeting_form.reset()
-        self.recording_panel.hide()
-        self.note_editor.hide()
-        self.minutes_viewer.hide()
+        self._hide_if_created(self._recording_panel, self._note_editor, self._minutes_viewer)
 
     def _on_start_recording(self, meeting_id: int):
         """处理开始录制事件"""
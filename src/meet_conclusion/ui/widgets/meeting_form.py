@@ -1,5 +1,7 @@
 """会议创建表单组件"""
 
+from typing import Optional
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QComboBox,
@@ -28,6 +30,8 @@ class MeetingFormWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_meeting_id = None
+        # 最近一次保存（或加载）时的表单内容，内容未变化时不再写数据库
+        self._saved_fields: Optional[dict] = None
         self._init_ui()
 
     def _init_ui(self):
@@ -135,77 +139,111 @@ class MeetingFormWidget(QWidget):
         else:
             self.custom_perspective_input.hide()
 
-    def _on_save(self):
-        """保存会议"""
+    def _on_save(self) -> Optional[int]:
+        """保存会议
+
+        Returns:
+            会议ID，标题为空未保存时返回 None
+        """
         title = self.title_input.text().strip()
         if not title:
             # TODO: 显示错误提示
-            return
+            return None
 
-        participants = self.participants_input.text().strip() or None
         perspective = self.perspective_combo.currentData()
         custom_perspective = None
         if perspective == "custom":
             custom_perspective = self.custom_perspective_input.toPlainText().strip() or None
-        style = self.style_combo.currentData()
+        fields = {
+            "title": title,
+            "participants": self.participants_input.text().strip() or None,
+            "user_perspective": perspective,
+            "custom_perspective": custom_perspective,
+            "output_style": self.style_combo.currentData(),
+        }
 
         if self.current_meeting_id:
-            # 更新
-            MeetingRepository.update(
-                self.current_meeting_id,
-                title=title,
-                participants=participants,
-                user_perspective=perspective,
-                custom_perspective=custom_perspective,
-                output_style=style,
-            )
+            if fields == self._saved_fields:
+                # 内容与上次保存的一致（如先保存再开始纪要），无需再次写入
+                return self.current_meeting_id
+            # 更新（单条 UPDATE，一次提交）
+            MeetingRepository.update(self.current_meeting_id, **fields)
         else:
             # 创建
-            meeting = MeetingRepository.create(
-                title=title,
-                participants=participants,
-                user_perspective=perspective,
-                custom_perspective=custom_perspective,
-                output_style=style,
-            )
+            meeting = MeetingRepository.create(**fields)
             self.current_meeting_id = meeting.id
 
+        self._saved_fields = fields
         logger.info(f"保存会议: {self.current_meeting_id}")
+        return self.current_meeting_id
 
     def _on_start(self):
         """开始录制"""
-        # 先保存
-        self._on_save()
-        if self.current_meeting_id:
-            self.start_recording.emit(self.current_meeting_id)
+        # 先保存，直接使用保存返回的会议ID
+        meeting_id = self._on_save()
+        if meeting_id:
+            self.start_recording.emit(meeting_id)
+
+    def _set_inputs_blocked(self, blocked: bool) -> None:
+        """批量屏蔽/恢复输入控件的信号，程序化填充表单时不触发变更处理"""
+        for widget in (
+            self.title_input,
+            self.participants_input,
+            self.custom_perspective_input,
+            self.perspective_combo,
+            self.style_combo,
+        ):
+            widget.blockSignals(blocked)
 
     def reset(self):
         """重置表单"""
         self.current_meeting_id = None
+        self._saved_fields = None
         self.title_label.setText("新建会议")
-        self.title_input.clear()
-        self.participants_input.clear()
-        self.perspective_combo.setCurrentIndex(0)
-        self.custom_perspective_input.clear()
-        self.custom_perspective_input.hide()
-        self.style_combo.setCurrentIndex(0)
+
+        self._set_inputs_blocked(True)
+        try:
+            self.title_input.clear()
+            self.participants_input.clear()
+            self.perspective_combo.setCurrentIndex(0)
+            self.custom_perspective_input.clear()
+            self.style_combo.setCurrentIndex(0)
+        finally:
+            self._set_inputs_blocked(False)
+
+        # 按最终选中的视角统一更新一次自定义输入框的显示状态
+        self._on_perspective_changed(self.perspective_combo.currentIndex())
 
     def load_meeting(self, meeting: Meeting):
         """加载会议数据"""
         self.current_meeting_id = meeting.id
+        self._saved_fields = {
+            "title": meeting.title,
+            "participants": meeting.participants,
+            "user_perspective": meeting.user_perspective,
+            "custom_perspective": meeting.custom_perspective,
+            "output_style": meeting.output_style,
+        }
         self.title_label.setText("编辑会议")
-        self.title_input.setText(meeting.title)
-        self.participants_input.setText(meeting.participants or "")
-
-        # 设置视角
-        index = self.perspective_combo.findData(meeting.user_perspective)
-        if index >= 0:
-            self.perspective_combo.setCurrentIndex(index)
-        if meeting.user_perspective == "custom" and meeting.custom_perspective:
-            self.custom_perspective_input.setPlainText(meeting.custom_perspective)
-            self.custom_perspective_input.show()
 
-        # 设置风格
-        index = self.style_combo.findData(meeting.output_style)
-        if index >= 0:
-            self.style_combo.setCurrentIndex(index)
+        self._set_inputs_blocked(True)
+        try:
+            self.title_input.setText(meeting.title)
+            self.participants_input.setText(meeting.participants or "")
+
+            # 设置视角
+            index = self.perspective_combo.findData(meeting.user_perspective)
+            if index >= 0:
+                self.perspective_combo.setCurrentIndex(index)
+            if meeting.user_perspective == "custom" and meeting.custom_perspective:
+                self.custom_perspective_input.setPlainText(meeting.custom_perspective)
+
+            # 设置风格
+            index = self.style_combo.findData(meeting.output_style)
+            if index >= 0:
+                self.style_combo.setCurrentIndex(index)
+        finally:
+            self._set_inputs_blocked(False)
+
+        # 按最终选中的视角统一更新一次自定义输入框的显示状态
+        self._on_perspective_changed(self.perspective_combo.currentIndex())
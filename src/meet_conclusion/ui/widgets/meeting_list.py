@@ -1,24 +1,139 @@
 """会议列表组件"""
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
 from meet_conclusion.db.models import Meeting
-from meet_conclusion.db.repositories import MeetingRepository
+from meet_conclusion.db.repositories import MeetingRepository, MeetingSummary
 from meet_conclusion.utils.logger import get_logger
 from meet_conclusion.utils.time_utils import format_timestamp, format_duration
 
 logger = get_logger(__name__)
 
+# 搜索输入的防抖间隔（毫秒），连续输入时只在停顿后查询一次
+_SEARCH_DEBOUNCE_MS = 200
+
+# 列表最多展示的会议数；摘要不足该数量时说明已包含全部会议，搜索可直接在内存中过滤
+_LIST_LIMIT = 100
+
+# 与 MeetingRepository.search 的默认返回数量一致
+_SEARCH_LIMIT = 50
+
+# 会议状态图标
+_STATUS_ICONS = {
+    "draft": "📝",
+    "recording": "🔴",
+    "processing": "⏳",
+    "done": "✅",
+    "failed": "❌",
+}
+
+
+def _format_meeting(meeting: Meeting | MeetingSummary) -> str:
+    """生成会议项的显示文本（纯 Python，可在后台线程执行）
+
+    Args:
+        meeting: 会议对象，或 list_summaries 返回的会议摘要
+
+    Returns:
+        显示文本
+    """
+    # 状态图标
+    status_icon = _STATUS_ICONS.get(meeting.status, "❓")
+
+    # 时长
+    duration_str = ""
+    if meeting.duration:
+        duration_str = f" ({format_duration(meeting.duration)})"
+
+    return (
+        f"{status_icon} {meeting.title}{duration_str}\n"
+        f"   {format_timestamp(meeting.created_at)}"
+    )
+
+
+class _FormatSignals(QObject):
+    """后台格式化任务的信号（QRunnable 本身不是 QObject）"""
+
+    finished = Signal(int, list)  # 批次号, [(显示文本, 会议ID)]
+
+
+class _FormatMeetingsRunnable(QRunnable):
+    """在线程池中格式化会议列表的显示文本"""
+
+    def __init__(self, meetings: list, generation: int, signals: _FormatSignals):
+        """初始化
+
+        Args:
+            meetings: 会议对象或会议摘要列表
+            generation: 批次号，用于丢弃过期的结果
+            signals: 结果回传用的信号对象（属于 GUI 线程）
+        """
+        super().__init__()
+        self._meetings = meetings
+        self._generation = generation
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            rows = [(_format_meeting(meeting), meeting.id) for meeting in self._meetings]
+        except Exception as e:
+            logger.error(f"格式化会议列表失败: {e}")
+            rows = []
+        self._signals.finished.emit(self._generation, rows)
+
+
+class _MeetingListModel(QAbstractListModel):
+    """会议列表模型
+
+    按列分别保存显示文本和会议ID，视图只为可见行调用 data()
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._texts: list[str] = []
+        self._ids: list[int] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._ids[index.row()]
+        return None
+
+    def set_rows(self, rows: list[tuple[str, int]]) -> None:
+        """整体替换列表内容
+
+        Args:
+            rows: (显示文本, 会议ID) 列表
+        """
+        self.beginResetModel()
+        self._texts = [text for text, _ in rows]
+        self._ids = [meeting_id for _, meeting_id in rows]
+        self.endResetModel()
+
 
 class MeetingListWidget(QWidget):
     """会议列表组件"""
@@ -28,6 +143,12 @@ class MeetingListWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+
+        # 格式化在线程池中进行，结果通过信号排队回到 GUI 线程
+        self._format_generation = 0
+        self._format_signals = _FormatSignals(self)
+        self._format_signals.finished.connect(self._on_formatted)
+
         self._init_ui()
         self.refresh()
 
@@ -64,77 +185,114 @@ class MeetingListWidget(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("搜索会议...")
         self.search_input.textChanged.connect(self._on_search)
+
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
         search_layout.addWidget(self.search_input)
         layout.addLayout(search_layout)
 
-        # 会议列表
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("""
-            QListWidget {
+        # 会议列表（模型/视图，每行都是两行文本，行高一致）
+        self.list_model = _MeetingListModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.list_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setStyleSheet("""
+            QListView {
                 border: 1px solid #ddd;
                 border-radius: 4px;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 10px;
                 border-bottom: 1px solid #eee;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e3f2fd;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f5f5f5;
             }
         """)
-        self.list_widget.itemClicked.connect(self._on_item_clicked)
-        layout.addWidget(self.list_widget)
+        self.list_view.clicked.connect(self._on_item_clicked)
+        layout.addWidget(self.list_view)
 
     def refresh(self):
         """刷新会议列表"""
-        self.list_widget.clear()
-        meetings = MeetingRepository.get_all(limit=100)
-        for meeting in meetings:
-            self._add_meeting_item(meeting)
+        meetings = MeetingRepository.list_summaries(limit=_LIST_LIMIT)
+        self._populate(meetings)
         logger.debug(f"刷新会议列表，共 {len(meetings)} 条")
 
-    def _add_meeting_item(self, meeting: Meeting):
-        """添加会议项"""
-        item = QListWidgetItem()
-        item.setData(Qt.ItemDataRole.UserRole, meeting.id)
-
-        # 状态图标
-        status_icons = {
-            "draft": "📝",
-            "recording": "🔴",
-            "processing": "⏳",
-            "done": "✅",
-            "failed": "❌",
-        }
-        status_icon = status_icons.get(meeting.status, "❓")
-
-        # 时长
-        duration_str = ""
-        if meeting.duration:
-            duration_str = f" ({format_duration(meeting.duration)})"
-
-        # 显示文本
-        text = f"{status_icon} {meeting.title}{duration_str}\n"
-        text += f"   {format_timestamp(meeting.created_at)}"
-
-        item.setText(text)
-        self.list_widget.addItem(item)
-
-    def _on_item_clicked(self, item: QListWidgetItem):
+    def _populate(self, meetings: list) -> None:
+        """用给定的会议重建列表
+
+        显示文本的格式化交给线程池，完成后由 _on_formatted 在 GUI 线程更新模型
+
+        Args:
+            meetings: 会议对象或 list_summaries 返回的会议摘要
+        """
+        self._format_generation += 1
+        QThreadPool.globalInstance().start(
+            _FormatMeetingsRunnable(meetings, self._format_generation, self._format_signals)
+        )
+
+    def _on_formatted(self, generation: int, rows: list) -> None:
+        """用后台格式化好的会议项重置模型
+
+        模型整体重置只触发一次视图刷新
+
+        Args:
+            generation: 格式化任务的批次号，不是最新批次的结果直接丢弃
+            rows: (显示文本, 会议ID) 列表
+        """
+        if generation != self._format_generation:
+            return
+
+        self.list_model.set_rows(rows)
+
+    def _on_item_clicked(self, index: QModelIndex):
         """处理项目点击"""
-        meeting_id = item.data(Qt.ItemDataRole.UserRole)
+        meeting_id = index.data(Qt.ItemDataRole.UserRole)
         self.meeting_selected.emit(meeting_id)
 
     def _on_search(self, text: str):
-        """处理搜索"""
-        if text:
-            meetings = MeetingRepository.search(text)
+        """处理搜索输入（防抖，停止输入后才执行查询）"""
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _run_search(self):
+        """执行搜索
+
+        会议摘要按列表版本号缓存，没有写入时获取摘要不会查询数据库；
+        摘要已包含全部会议时直接在内存中过滤，否则交给数据库搜索
+        """
+        text = self._pending_search
+        summaries = MeetingRepository.list_summaries(limit=_LIST_LIMIT)
+        if not text:
+            meetings = summaries
+        elif len(summaries) < _LIST_LIMIT:
+            meetings = self._filter_local(summaries, text)
         else:
-            meetings = MeetingRepository.get_all(limit=100)
+            meetings = MeetingRepository.search(text, limit=_SEARCH_LIMIT)
+
+        self._populate(meetings)
+
+    @staticmethod
+    def _filter_local(summaries: list[MeetingSummary], keyword: str) -> list[MeetingSummary]:
+        """在内存中按标题和参与人过滤会议（与数据库搜索一样不区分大小写）
+
+        Args:
+            summaries: 全部会议的摘要，按创建时间倒序
+            keyword: 搜索关键词
 
-        self.list_widget.clear()
-        for meeting in meetings:
-            self._add_meeting_item(meeting)
+        Returns:
+            匹配的会议摘要
+        """
+        needle = keyword.casefold()
+        hits = [
+            summary for summary in summaries
+            if needle in summary.title.casefold()
+            or (summary.participants and needle in summary.participants.casefold())
+        ]
+        return hits[:_SEARCH_LIMIT]
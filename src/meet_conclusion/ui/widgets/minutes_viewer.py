@@ -1,8 +1,9 @@
 """会议纪要查看组件"""
 
-import json
-from typing import Optional
+from html import escape
+from typing import Any, Optional
 
+import orjson
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -13,6 +14,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy import inspect
 
 from meet_conclusion.db.models import Meeting
 from meet_conclusion.db.repositories import NoteRepository, TranscriptRepository
@@ -21,6 +23,61 @@ from meet_conclusion.utils.time_utils import format_duration, format_timestamp
 
 logger = get_logger(__name__)
 
+# 视角、风格的显示名称和笔记标签图标
+_PERSPECTIVE_NAMES = {
+    "worker": "打工人",
+    "manager": "管理者",
+    "boss": "老板",
+    "custom": "自定义",
+}
+_STYLE_NAMES = {
+    "neutral": "中立客观",
+    "sarcastic": "尖酸刻薄",
+    "comforting": "安慰体贴",
+}
+_TAG_ICONS = {
+    "general": "📝",
+    "todo": "✅",
+    "risk": "⚠️",
+    "question": "❓",
+}
+
+# 纪要各页的 HTML 模板，导入时构建一次，渲染时只做 str.format
+_EMPTY_TMPL = "<p style='color: #999;'>{}</p>"
+_RAW_TMPL = "<p>{}</p>"
+_DIV_TMPL = "<div style='font-size: 14px; line-height: 1.8;'>{}</div>"
+_UL_TMPL = "<ul style='font-size: 14px; line-height: 1.8;'>{}</ul>"
+_LI_TMPL = "<li>{}</li>"
+_DETAIL_TMPL = "<br><small style='color: #666;'>{}: {}</small>"
+_DICT_ITEM_TMPL = "<li><b>{}</b>{}</li>"
+_TOPIC_TMPL = "<h3>{}</h3><p>{}</p>"
+_PARAGRAPH_TMPL = "<p>{}</p>"
+
+# 转写和笔记的行模板：位置参数依次为时间、说话人、文本 / 图标、时间、内容
+_T_ROW = (
+    "<p><span style='color: #666;'>[{0}]</span> "
+    "<span style='color: #2196F3;'>{1}:</span> {2}</p>"
+)
+_N_ROW = "<p>{0} <span style='color: #666;'>[{1}]</span> {2}</p>"
+
+
+def _decode_json(raw: Optional[str]) -> Optional[Any]:
+    """解码纪要中的 JSON 字段
+
+    Args:
+        raw: 数据库中保存的 JSON 字符串
+
+    Returns:
+        解码后的对象，字段为空或解码失败时返回 None
+    """
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"纪要 JSON 字段解码失败: {e}")
+        return None
+
 
 class MinutesViewerWidget(QWidget):
     """会议纪要查看器"""
@@ -28,6 +85,15 @@ class MinutesViewerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_meeting: Optional[Meeting] = None
+
+        # 绑定会议时解码一次的纪要字段，渲染时直接使用
+        self._decisions: Optional[Any] = None
+        self._actions: Optional[Any] = None
+        self._topics: Optional[Any] = None
+
+        # 各标签页在首次显示时才渲染，记录当前会议已渲染的页
+        self._loaded_tabs: set[int] = set()
+
         self._init_ui()
 
     def _init_ui(self):
@@ -97,9 +163,33 @@ class MinutesViewerWidget(QWidget):
         notes_layout.addWidget(self.notes_browser)
         self.tab_widget.addTab(self.notes_tab, "笔记")
 
+        # 标签页索引 -> 渲染函数
+        self._tab_loaders = {
+            self.tab_widget.indexOf(self.summary_tab): self._load_summary,
+            self.tab_widget.indexOf(self.decisions_tab): self._load_decisions,
+            self.tab_widget.indexOf(self.actions_tab): self._load_actions,
+            self.tab_widget.indexOf(self.topics_tab): self._load_topics,
+            self.tab_widget.indexOf(self.transcript_tab): self._load_transcript,
+            self.tab_widget.indexOf(self.notes_tab): self._load_notes,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab_loaded)
+
     def load_meeting(self, meeting: Meeting):
-        """加载会议数据"""
+        """加载会议数据
+
+        只渲染当前标签页，其余标签页在切换到时再渲染
+
+        Args:
+            meeting: 会议对象，通过 MeetingRepository.get_with_details 获取时
+                直接使用预加载的转写和笔记，未预加载的在对应标签页首次显示时查询
+        """
         self.current_meeting = meeting
+        self._loaded_tabs.clear()
+
+        # 纪要 JSON 字段只在绑定会议时解码一次
+        self._decisions = _decode_json(meeting.decisions_json)
+        self._actions = _decode_json(meeting.action_items_json)
+        self._topics = _decode_json(meeting.topics_json)
 
         # 更新头部信息
         self.title_label.setText(meeting.title)
@@ -111,142 +201,136 @@ class MinutesViewerWidget(QWidget):
         if meeting.participants:
             info_parts.append(f"参与人: {meeting.participants}")
 
-        perspective_names = {
-            "worker": "打工人",
-            "manager": "管理者",
-            "boss": "老板",
-            "custom": "自定义",
-        }
-        info_parts.append(f"视角: {perspective_names.get(meeting.user_perspective, meeting.user_perspective)}")
-
-        style_names = {
-            "neutral": "中立客观",
-            "sarcastic": "尖酸刻薄",
-            "comforting": "安慰体贴",
-        }
-        info_parts.append(f"风格: {style_names.get(meeting.output_style, meeting.output_style)}")
+        perspective = _PERSPECTIVE_NAMES.get(meeting.user_perspective, meeting.user_perspective)
+        style = _STYLE_NAMES.get(meeting.output_style, meeting.output_style)
+        info_parts.append(f"视角: {perspective}")
+        info_parts.append(f"风格: {style}")
 
         self.info_label.setText(" | ".join(info_parts))
 
-        # 加载摘要
-        self._load_summary(meeting)
+        # 只渲染当前标签页
+        self._ensure_tab_loaded(self.tab_widget.currentIndex())
 
-        # 加载决策
-        self._load_decisions(meeting)
+    def _ensure_tab_loaded(self, index: int):
+        """渲染尚未渲染的标签页
 
-        # 加载行动项
-        self._load_actions(meeting)
-
-        # 加载议题
-        self._load_topics(meeting)
-
-        # 加载转写
-        self._load_transcript(meeting)
-
-        # 加载笔记
-        self._load_notes(meeting)
+        Args:
+            index: 标签页索引
+        """
+        if self.current_meeting is None or index in self._loaded_tabs:
+            return
+        loader = self._tab_loaders.get(index)
+        if loader is None:
+            return
+        self._loaded_tabs.add(index)
+        loader(self.current_meeting)
 
     def _load_summary(self, meeting: Meeting):
         """加载摘要"""
         if meeting.summary:
-            self.summary_browser.setHtml(f"<div style='font-size: 14px; line-height: 1.8;'>{meeting.summary}</div>")
+            self.summary_browser.setHtml(_DIV_TMPL.format(meeting.summary))
         else:
-            self.summary_browser.setHtml("<p style='color: #999;'>暂无摘要</p>")
+            self.summary_browser.setHtml(_EMPTY_TMPL.format("暂无摘要"))
 
     def _load_decisions(self, meeting: Meeting):
         """加载决策"""
         if meeting.decisions_json:
-            try:
-                decisions = json.loads(meeting.decisions_json)
-                html = "<ul style='font-size: 14px; line-height: 1.8;'>"
+            decisions = self._decisions
+            if decisions is None:
+                self.decisions_browser.setHtml(_RAW_TMPL.format(meeting.decisions_json))
+            else:
+                parts = []
                 for decision in decisions:
                     if isinstance(decision, dict):
-                        html += f"<li><b>{decision.get('content', '')}</b>"
-                        if decision.get('participants'):
-                            html += f"<br><small style='color: #666;'>相关人员: {decision.get('participants')}</small>"
-                        html += "</li>"
+                        content = decision.get('content', '')
+                        participants = decision.get('participants')
+                        detail = ""
+                        if participants:
+                            detail = _DETAIL_TMPL.format("相关人员", participants)
+                        parts.append(_DICT_ITEM_TMPL.format(content, detail))
                     else:
-                        html += f"<li>{decision}</li>"
-                html += "</ul>"
-                self.decisions_browser.setHtml(html)
-            except json.JSONDecodeError:
-                self.decisions_browser.setHtml(f"<p>{meeting.decisions_json}</p>")
+                        parts.append(_LI_TMPL.format(decision))
+                self.decisions_browser.setHtml(_UL_TMPL.format("".join(parts)))
         else:
-            self.decisions_browser.setHtml("<p style='color: #999;'>暂无决策</p>")
+            self.decisions_browser.setHtml(_EMPTY_TMPL.format("暂无决策"))
 
     def _load_actions(self, meeting: Meeting):
         """加载行动项"""
         if meeting.action_items_json:
-            try:
-                actions = json.loads(meeting.action_items_json)
-                html = "<ul style='font-size: 14px; line-height: 1.8;'>"
+            actions = self._actions
+            if actions is None:
+                self.actions_browser.setHtml(_RAW_TMPL.format(meeting.action_items_json))
+            else:
+                parts = []
                 for action in actions:
                     if isinstance(action, dict):
-                        html += f"<li><b>{action.get('task', '')}</b>"
-                        if action.get('assignee'):
-                            html += f"<br><small style='color: #666;'>负责人: {action.get('assignee')}</small>"
-                        if action.get('deadline'):
-                            html += f"<br><small style='color: #666;'>截止时间: {action.get('deadline')}</small>"
-                        html += "</li>"
+                        assignee = action.get('assignee')
+                        deadline = action.get('deadline')
+                        detail = (
+                            (_DETAIL_TMPL.format("负责人", assignee) if assignee else "")
+                            + (_DETAIL_TMPL.format("截止时间", deadline) if deadline else "")
+                        )
+                        parts.append(_DICT_ITEM_TMPL.format(action.get('task', ''), detail))
                     else:
-                        html += f"<li>{action}</li>"
-                html += "</ul>"
-                self.actions_browser.setHtml(html)
-            except json.JSONDecodeError:
-                self.actions_browser.setHtml(f"<p>{meeting.action_items_json}</p>")
+                        parts.append(_LI_TMPL.format(action))
+                self.actions_browser.setHtml(_UL_TMPL.format("".join(parts)))
         else:
-            self.actions_browser.setHtml("<p style='color: #999;'>暂无行动项</p>")
+            self.actions_browser.setHtml(_EMPTY_TMPL.format("暂无行动项"))
 
     def _load_topics(self, meeting: Meeting):
         """加载议题"""
         if meeting.topics_json:
-            try:
-                topics = json.loads(meeting.topics_json)
-                html = "<div style='font-size: 14px; line-height: 1.8;'>"
+            topics = self._topics
+            if topics is None:
+                self.topics_browser.setHtml(_RAW_TMPL.format(meeting.topics_json))
+            else:
+                parts = []
                 for topic in topics:
                     if isinstance(topic, dict):
-                        html += f"<h3>{topic.get('title', '议题')}</h3>"
-                        html += f"<p>{topic.get('content', '')}</p>"
+                        parts.append(
+                            _TOPIC_TMPL.format(topic.get('title', '议题'), topic.get('content', ''))
+                        )
                     else:
-                        html += f"<p>{topic}</p>"
-                html += "</div>"
-                self.topics_browser.setHtml(html)
-            except json.JSONDecodeError:
-                self.topics_browser.setHtml(f"<p>{meeting.topics_json}</p>")
+                        parts.append(_PARAGRAPH_TMPL.format(topic))
+                self.topics_browser.setHtml(_DIV_TMPL.format("".join(parts)))
         else:
-            self.topics_browser.setHtml("<p style='color: #999;'>暂无议题</p>")
+            self.topics_browser.setHtml(_EMPTY_TMPL.format("暂无议题"))
 
     def _load_transcript(self, meeting: Meeting):
         """加载转写文本"""
-        transcripts = TranscriptRepository.get_by_meeting(meeting.id)
+        if "transcripts" in inspect(meeting).unloaded:
+            transcripts = TranscriptRepository.get_by_meeting(meeting.id)
+        else:
+            transcripts = meeting.transcripts
         if transcripts:
-            html = "<div style='font-size: 14px; line-height: 1.8;'>"
-            for t in transcripts:
-                time_str = format_duration(t.start_time)
-                speaker = t.speaker_id or "未知"
-                html += f"<p><span style='color: #666;'>[{time_str}]</span> "
-                html += f"<span style='color: #2196F3;'>{speaker}:</span> {t.text}</p>"
-            html += "</div>"
-            self.transcript_browser.setHtml(html)
+            # 用户文本转义后再放入固定的 HTML 结构
+            rows = "".join(
+                _T_ROW.format(
+                    format_duration(t.start_time),
+                    escape(t.speaker_id or "未知", quote=False),
+                    escape(t.text, quote=False),
+                )
+                for t in transcripts
+            )
+            self.transcript_browser.setHtml(_DIV_TMPL.format(rows))
         else:
-            self.transcript_browser.setHtml("<p style='color: #999;'>暂无转写文本</p>")
+            self.transcript_browser.setHtml(_EMPTY_TMPL.format("暂无转写文本"))
 
     def _load_notes(self, meeting: Meeting):
         """加载笔记"""
-        notes = NoteRepository.get_by_meeting(meeting.id)
+        if "notes" in inspect(meeting).unloaded:
+            notes = NoteRepository.get_by_meeting(meeting.id)
+        else:
+            notes = meeting.notes
         if notes:
-            tag_icons = {
-                "general": "📝",
-                "todo": "✅",
-                "risk": "⚠️",
-                "question": "❓",
-            }
-            html = "<div style='font-size: 14px; line-height: 1.8;'>"
-            for note in notes:
-                time_str = format_duration(note.time_offset)
-                icon = tag_icons.get(note.tag, "📝")
-                html += f"<p>{icon} <span style='color: #666;'>[{time_str}]</span> {note.content}</p>"
-            html += "</div>"
-            self.notes_browser.setHtml(html)
+            rows = "".join(
+                _N_ROW.format(
+                    _TAG_ICONS.get(note.tag, "📝"),
+                    format_duration(note.time_offset),
+                    escape(note.content, quote=False),
+                )
+                for note in notes
+            )
+            self.notes_browser.setHtml(_DIV_TMPL.format(rows))
         else:
-            self.notes_browser.setHtml("<p style='color: #999;'>暂无笔记</p>")
+            self.notes_browser.setHtml(_EMPTY_TMPL.format("暂无笔记"))
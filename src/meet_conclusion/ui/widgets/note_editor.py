@@ -1,6 +1,8 @@
 """笔记编辑器组件"""
 
-from PySide6.QtCore import Qt, Signal
+from datetime import datetime
+
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -12,6 +14,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy import inspect
 
 from meet_conclusion.db.models import Meeting, Note
 from meet_conclusion.db.repositories import NoteRepository
@@ -20,6 +23,18 @@ from meet_conclusion.utils.time_utils import format_duration
 
 logger = get_logger(__name__)
 
+# 新笔记先在内存中排队，停顿一段时间或积累到一定数量后一次写入数据库
+_NOTE_FLUSH_MS = 500
+_NOTE_FLUSH_MAX = 20
+
+# 笔记标签图标
+_TAG_ICONS = {
+    "general": "📝",
+    "todo": "✅",
+    "risk": "⚠️",
+    "question": "❓",
+}
+
 
 class NoteEditorWidget(QWidget):
     """笔记编辑器"""
@@ -30,6 +45,14 @@ class NoteEditorWidget(QWidget):
         super().__init__(parent)
         self.current_meeting: Meeting | None = None
         self.get_elapsed_time = None  # 获取已录制时间的回调
+
+        # 尚未写入数据库的笔记及其在列表中的占位项
+        self._pending_notes: list[tuple[dict, QListWidgetItem]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_NOTE_FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush_notes)
+
         self._init_ui()
 
     def _init_ui(self):
@@ -119,7 +142,13 @@ class NoteEditorWidget(QWidget):
         return super().eventFilter(obj, event)
 
     def set_meeting(self, meeting: Meeting):
-        """设置当前会议"""
+        """设置当前会议
+
+        Args:
+            meeting: 会议对象，通过 MeetingRepository.get_with_details 获取时
+                直接使用预加载的笔记
+        """
+        self.flush_notes()
         self.current_meeting = meeting
         self._refresh_notes()
 
@@ -133,22 +162,32 @@ class NoteEditorWidget(QWidget):
         if not self.current_meeting:
             return
 
-        notes = NoteRepository.get_by_meeting(self.current_meeting.id)
+        if "notes" in inspect(self.current_meeting).unloaded:
+            notes = NoteRepository.get_by_meeting(self.current_meeting.id)
+        else:
+            notes = self.current_meeting.notes
         for note in notes:
             self._add_note_item(note)
 
-    def _add_note_item(self, note: Note):
-        """添加笔记项到列表"""
+    def hideEvent(self, event):
+        """隐藏（如结束录制）时写入排队中的笔记，保证后续处理能读到"""
+        self.flush_notes()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        self.flush_notes()
+        super().closeEvent(event)
+
+    def _add_note_item(self, note: Note) -> QListWidgetItem:
+        """添加笔记项到列表
+
+        Returns:
+            新加入的列表项
+        """
         item = QListWidgetItem()
 
         # 标签图标
-        tag_icons = {
-            "general": "📝",
-            "todo": "✅",
-            "risk": "⚠️",
-            "question": "❓",
-        }
-        tag_icon = tag_icons.get(note.tag, "📝")
+        tag_icon = _TAG_ICONS.get(note.tag, "📝")
 
         # 时间
         time_str = format_duration(note.time_offset)
@@ -159,6 +198,7 @@ class NoteEditorWidget(QWidget):
         item.setData(Qt.ItemDataRole.UserRole, note.id)
 
         self.note_list.addItem(item)
+        return item
 
     def _add_note(self):
         """添加笔记"""
@@ -177,19 +217,42 @@ class NoteEditorWidget(QWidget):
         # 获取标签
         tag = self.tag_combo.currentData()
 
-        # 保存笔记
-        note = NoteRepository.create(
-            meeting_id=self.current_meeting.id,
-            time_offset=time_offset,
-            content=content,
-            tag=tag,
-        )
-
-        # 添加到列表
-        self._add_note_item(note)
+        # 先加入列表，ID 在写入数据库后回填
+        row = {
+            "meeting_id": self.current_meeting.id,
+            "time_offset": time_offset,
+            "content": content,
+            "tag": tag,
+            "created_at": datetime.now(),
+        }
+        item = self._add_note_item(Note(**row))
+        self._pending_notes.append((row, item))
 
         # 清空输入
         self.note_input.clear()
 
-        logger.info(f"添加笔记: {note.id}, 时间: {time_offset}s")
-        self.note_added.emit(note.id)
+        logger.info(f"添加笔记, 时间: {time_offset}s")
+        if len(self._pending_notes) >= _NOTE_FLUSH_MAX:
+            self.flush_notes()
+        else:
+            self._flush_timer.start()
+
+    def flush_notes(self) -> None:
+        """将排队中的笔记一次写入数据库"""
+        self._flush_timer.stop()
+        if not self._pending_notes:
+            return
+
+        pending, self._pending_notes = self._pending_notes, []
+        try:
+            note_ids = NoteRepository.bulk_create(row for row, _ in pending)
+        except Exception as e:
+            logger.error(f"保存笔记失败: {e}")
+            # 移除未能保存的占位项
+            for _, item in pending:
+                self.note_list.takeItem(self.note_list.row(item))
+            return
+
+        for (_, item), note_id in zip(pending, note_ids):
+            item.setData(Qt.ItemDataRole.UserRole, note_id)
+            self.note_added.emit(note_id)
@@ -1,6 +1,8 @@
 """录制控制面板组件"""
 
+import time
 from datetime import datetime
+from typing import Optional
 
 from PySide6.QtCore import QTimer, Signal
 from PySide6.QtWidgets import (
@@ -28,6 +30,10 @@ class RecordingPanelWidget(QWidget):
         self.current_meeting: Meeting | None = None
         self.start_time: datetime | None = None
         self.elapsed_seconds = 0
+
+        # 时长按单调时钟计算，只在定时器触发时取一次快照
+        self._start_mono: Optional[float] = None
+        self._duration_text = "00:00"
         self._init_ui()
         self._setup_timer()
 
@@ -102,9 +108,27 @@ class RecordingPanelWidget(QWidget):
 
     def _update_duration(self):
         """更新录制时长显示"""
-        if self.start_time:
-            self.elapsed_seconds = (datetime.now() - self.start_time).total_seconds()
-            self.duration_label.setText(format_duration(self.elapsed_seconds))
+        if self._start_mono is None:
+            return
+
+        self.elapsed_seconds = time.monotonic() - self._start_mono
+        text = format_duration(self.elapsed_seconds)
+        # 文本未变化时跳过 setText，避免多余的文本布局
+        if text != self._duration_text:
+            self._duration_text = text
+            self.duration_label.setText(text)
+
+    def showEvent(self, event):
+        """面板显示时恢复计时刷新"""
+        super().showEvent(event)
+        if self._start_mono is not None and not self.timer.isActive():
+            self._update_duration()
+            self.timer.start(1000)
+
+    def hideEvent(self, event):
+        """面板隐藏时暂停计时刷新（时长基于单调时钟，不会因此失准）"""
+        super().hideEvent(event)
+        self.timer.stop()
 
     def set_meeting(self, meeting: Meeting):
         """设置当前会议"""
@@ -116,8 +140,10 @@ class RecordingPanelWidget(QWidget):
         self.current_meeting = meeting
         self.title_label.setText(f"会议：{meeting.title}")
         self.start_time = datetime.now()
+        self._start_mono = time.monotonic()
         self.elapsed_seconds = 0
-        self.duration_label.setText("00:00")
+        self._duration_text = "00:00"
+        self.duration_label.setText(self._duration_text)
         self.timer.start(1000)  # 每秒更新
 
         # TODO: 启动实际的音频录制
@@ -125,7 +151,9 @@ class RecordingPanelWidget(QWidget):
 
     def stop(self):
         """停止录制"""
+        self._update_duration()
         self.timer.stop()
+        self._start_mono = None
         # TODO: 停止实际的音频录制
         logger.info(f"停止录制，时长: {self.elapsed_seconds}秒")
 
@@ -0,0 +1,69 @@
+"""后台事件循环模块
+
+在单个后台线程中运行全局 asyncio 事件循环，供同步代码提交协程，
+使大量等待网络的任务可以共享一个线程
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional, TypeVar
+
+from meet_conclusion.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """获取后台事件循环（首次调用时启动后台线程）"""
+    global _loop, _loop_thread
+    if _loop is not None:
+        return _loop
+
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="AsyncRunner",
+                daemon=True,
+            )
+            thread.start()
+            _loop_thread = thread
+            _loop = loop
+            logger.debug("后台事件循环已启动")
+    return _loop
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> Future:
+    """提交协程到后台事件循环
+
+    Args:
+        coro: 协程对象
+
+    Returns:
+        concurrent.futures.Future
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """在后台事件循环中执行协程并阻塞等待结果
+
+    Args:
+        coro: 协程对象
+        timeout: 等待超时（秒），None 表示一直等待
+
+    Returns:
+        协程的返回值
+    """
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("不能在后台事件循环线程中同步等待协程")
+    return submit(coro).result(timeout)
@@ -0,0 +1,445 @@
+"""日志文件写入模块
+
+loguru 的文件输出由调用线程直接写盘，或者在 enqueue=True 时经 multiprocessing
+队列转发（需要序列化，且队列无上限）。这里提供一个进程内的有界队列加后台写入线程，
+写满时丢弃最旧的记录，日志调用方永远不会因磁盘变慢而阻塞。
+写入线程把记录累积在缓冲区中，攒够一定字节数或间隔一段时间，
+用一次 writev 把多条记录写入文件。
+另有供标准库 logging 使用的 DailyFileHandler，文件切换和缓冲逻辑与之相同
+"""
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+# 队列中的结束标记
+_STOP = object()
+
+# 缓冲区达到该字节数时立即写入文件
+_FLUSH_BYTES = 64 * 1024
+
+# 缓冲区中的数据最多停留的时间（秒）
+_FLUSH_INTERVAL = 0.2
+
+# 单次 writev 最多提交的记录数（远低于各平台的 IOV_MAX）
+_WRITEV_MAX = 256
+
+# Windows 没有 os.writev，退化为拼接后单次 write。
+# 不使用 io_uring：应用主要运行在 Windows（WASAPI 采集），且日志已攒批写出，
+# 每 0.2 秒或 64 KiB 才一次系统调用，换成异步提交收益很小却要引入原生依赖
+_writev = getattr(os, "writev", None)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """写入全部数据（处理部分写入）"""
+    with memoryview(data) as view:
+        offset = 0
+        while offset < len(view):
+            offset += os.write(fd, view[offset:])
+
+
+class _DailyLogFile:
+    """按天切换的单个日志文件及其写缓冲（只在写入线程中使用）"""
+
+    def __init__(self, directory: Path, prefix: str, retention_days: int):
+        """初始化
+
+        Args:
+            directory: 日志目录
+            prefix: 文件名前缀，文件名形如 {prefix}_YYYY-MM-DD.log
+            retention_days: 日志文件保留天数
+        """
+        # 只在切换文件时拼接路径，直接用 str 和 os.path，不构造 Path 对象
+        self.directory = os.fspath(directory)
+        self.prefix = prefix
+        self.retention_days = retention_days
+
+        # 待写出的记录（各自独立的 bytes，写出时作为 writev 的分散缓冲区）
+        self.chunks: list[bytes] = []
+        self.size = 0
+        self._fd: Optional[int] = None
+        self._day = ""
+
+    def append(self, data: bytes, day: str) -> None:
+        """将一条记录放入缓冲区，日期变化时先写出旧数据并切换到当天的文件
+
+        Args:
+            data: 已编码的记录
+            day: 记录的日期字符串 YYYY-MM-DD
+        """
+        if day != self._day:
+            self.flush()
+            self._rotate(day)
+        self.chunks.append(data)
+        self.size += len(data)
+
+    def flush(self) -> None:
+        """将缓冲的记录写入文件，每批记录只用一次 writev"""
+        if not self.chunks or self._fd is None:
+            return
+        chunks = self.chunks
+        self.chunks = []
+        self.size = 0
+
+        for start in range(0, len(chunks), _WRITEV_MAX):
+            batch = chunks[start:start + _WRITEV_MAX]
+            if _writev is None:
+                _write_all(self._fd, b"".join(batch))
+                continue
+            written = _writev(self._fd, batch)
+            total = sum(map(len, batch))
+            if written < total:
+                # 部分写入时把剩余部分拼接后补写
+                _write_all(self._fd, b"".join(batch)[written:])
+
+    def discard(self) -> None:
+        """丢弃缓冲的记录"""
+        self.chunks = []
+        self.size = 0
+
+    def close(self) -> None:
+        """写出剩余数据并关闭文件"""
+        try:
+            self.flush()
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _rotate(self, day: str) -> None:
+        """切换到指定日期的日志文件并清理过期文件
+
+        Args:
+            day: 日期字符串 YYYY-MM-DD
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{self.prefix}_{day}.log")
+        # 不经过 Python 的文件缓冲，何时写出由 flush 控制
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._day = day
+
+        self._remove_expired()
+
+    def _remove_expired(self) -> None:
+        """删除超过保留天数的日志文件"""
+        cutoff = time.time() - self.retention_days * 86400
+        name_prefix = f"{self.prefix}_"
+        # scandir 一次列出目录（Windows 下同时带回文件属性），不再逐个 glob 匹配后 stat
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(name_prefix) and entry.name.endswith(".log")):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+
+
+class QueuedFileSink:
+    """按天轮转的日志文件输出
+
+    作为 loguru 的 sink 使用（可调用对象），文件名形如 {prefix}_YYYY-MM-DD.log，
+    每天第一条记录到来时切换到新文件并清理过期文件。
+    指定 error_prefix 时，达到 error_level 的记录同时写入错误日志文件，
+    两个文件共用同一份格式化和编码结果
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str,
+        retention_days: int = 30,
+        max_queue: int = 10000,
+        error_prefix: Optional[str] = None,
+        error_level: int = 40,
+    ):
+        """初始化并启动写入线程
+
+        Args:
+            directory: 日志目录
+            prefix: 文件名前缀
+            retention_days: 日志文件保留天数
+            max_queue: 队列最多缓存的记录数，写满时丢弃最旧的记录
+            error_prefix: 错误日志文件名前缀，None 表示不单独输出错误日志
+            error_level: 写入错误日志的最低级别（默认 ERROR）
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.retention_days = retention_days
+        self.error_level = error_level
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._dropped = 0
+
+        # 当天的日期字符串及其时间范围，记录落在范围内时无需重新格式化
+        self._day = ""
+        self._day_start: Optional[datetime] = None
+        self._day_end: Optional[datetime] = None
+
+        self._file = _DailyLogFile(directory, prefix, retention_days)
+        self._error_file = (
+            _DailyLogFile(directory, error_prefix, retention_days) if error_prefix else None
+        )
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"log-writer-{prefix}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __call__(self, message) -> None:
+        """接收 loguru 格式化好的记录（在日志调用线程中执行，不会阻塞）
+
+        Args:
+            message: loguru 的 Message 对象（str 子类，带 record 属性）
+        """
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            # 写满时丢弃最旧的记录，为新记录腾出位置
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._dropped += 1
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                self._dropped += 1
+
+    @property
+    def dropped(self) -> int:
+        """因队列写满而丢弃的记录数"""
+        return self._dropped
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """等待队列中已有的记录全部写入文件
+
+        Args:
+            timeout: 最长等待时间（秒）
+        """
+        if not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """写完剩余记录后停止写入线程并关闭文件
+
+        Args:
+            timeout: 等待写入线程退出的最长时间（秒）
+        """
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _files(self) -> tuple[_DailyLogFile, ...]:
+        """所有输出文件"""
+        if self._error_file is None:
+            return (self._file,)
+        return (self._file, self._error_file)
+
+    def _buffered_bytes(self) -> int:
+        """所有文件缓冲区中尚未写出的字节数"""
+        return sum(f.size for f in self._files())
+
+    def _should_flush(self) -> bool:
+        """缓冲的字节数或记录数达到上限"""
+        return any(
+            f.size >= _FLUSH_BYTES or len(f.chunks) >= _WRITEV_MAX for f in self._files()
+        )
+
+    def _flush_all(self) -> None:
+        """写出所有文件的缓冲区"""
+        for f in self._files():
+            f.flush()
+
+    def _run(self) -> None:
+        """写入线程循环"""
+        deadline = None  # 缓冲区中最早一条数据的最晚写出时间
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    message = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    message = None
+
+                try:
+                    if message is _STOP:
+                        break
+                    if isinstance(message, threading.Event):
+                        self._flush_all()
+                        message.set()
+                    elif message is not None:
+                        self._append(message)
+                        if deadline is None:
+                            deadline = time.monotonic() + _FLUSH_INTERVAL
+
+                    if self._should_flush() or (
+                        deadline is not None and time.monotonic() >= deadline
+                    ):
+                        self._flush_all()
+                except Exception as e:
+                    print(f"写入日志文件失败: {e}", file=sys.stderr)
+                    for f in self._files():
+                        f.discard()
+
+                if not self._buffered_bytes():
+                    deadline = None
+        finally:
+            for f in self._files():
+                try:
+                    f.close()
+                except Exception as e:
+                    print(f"写入日志文件失败: {e}", file=sys.stderr)
+            if self._dropped:
+                print(f"日志队列写满，丢弃了 {self._dropped} 条记录", file=sys.stderr)
+
+    def _append(self, message) -> None:
+        """将一条记录编码一次，放入主日志（以及错误日志）的缓冲区"""
+        record = message.record
+        day = self._day_of(record["time"])
+        data = message.encode("utf-8")
+
+        self._file.append(data, day)
+        if self._error_file is not None and record["level"].no >= self.error_level:
+            self._error_file.append(data, day)
+
+    def _day_of(self, dt: datetime) -> str:
+        """获取记录时间所在日期的字符串，跨过午夜时才重新计算
+
+        Args:
+            dt: 记录时间（带时区）
+
+        Returns:
+            日期字符串 YYYY-MM-DD
+        """
+        if self._day_start is None or not (self._day_start <= dt < self._day_end):
+            self._day_start = datetime(dt.year, dt.month, dt.day, tzinfo=dt.tzinfo)
+            self._day_end = self._day_start + timedelta(days=1)
+            self._day = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        return self._day
+
+
+class DailyFileHandler(logging.Handler):
+    """按天轮转的 logging 文件处理器
+
+    供标准库 logging 后端在 QueueListener 线程中使用，文件名与轮转规则同 QueuedFileSink。
+    is_idle 返回 True（队列中没有待处理的记录）时才写出缓冲区，
+    负载高时多条记录合并为一次 writev。
+    格式化器提供 format_bytes(record) 时直接使用它生成的整行 bytes，不再经过 str
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str,
+        retention_days: int = 30,
+        error_prefix: Optional[str] = None,
+        error_level: int = logging.ERROR,
+        is_idle: Optional[Callable[[], bool]] = None,
+    ):
+        """初始化
+
+        Args:
+            directory: 日志目录
+            prefix: 文件名前缀
+            retention_days: 日志文件保留天数
+            error_prefix: 错误日志文件名前缀，None 表示不单独输出错误日志
+            error_level: 写入错误日志的最低级别（默认 ERROR）
+            is_idle: 判断是否暂无后续记录的回调，None 表示每条记录都立即写出
+        """
+        super().__init__()
+        self.error_level = error_level
+        self._is_idle = is_idle
+
+        self._file = _DailyLogFile(directory, prefix, retention_days)
+        self._error_file = (
+            _DailyLogFile(directory, error_prefix, retention_days) if error_prefix else None
+        )
+
+        # 当天的日期字符串及其时间戳范围
+        self._day = ""
+        self._day_start = 0.0
+        self._day_end = 0.0
+
+        self._format_bytes: Optional[Callable[[logging.LogRecord], bytes]] = None
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        """设置格式化器，并记下其 format_bytes 方法（如果有）"""
+        super().setFormatter(fmt)
+        self._format_bytes = getattr(fmt, "format_bytes", None)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """格式化并缓冲一条记录"""
+        try:
+            if self._format_bytes is not None:
+                data = self._format_bytes(record)
+            else:
+                data = (self.format(record) + "\n").encode("utf-8")
+            day = self._day_of(record.created)
+
+            self._file.append(data, day)
+            if self._error_file is not None and record.levelno >= self.error_level:
+                self._error_file.append(data, day)
+
+            if self._is_idle is None or self._is_idle() or self._should_flush():
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """写出所有文件的缓冲区"""
+        for f in self._files():
+            f.flush()
+
+    def close(self) -> None:
+        """写出剩余数据并关闭文件"""
+        try:
+            for f in self._files():
+                f.close()
+        finally:
+            super().close()
+
+    def _files(self) -> tuple[_DailyLogFile, ...]:
+        """所有输出文件"""
+        if self._error_file is None:
+            return (self._file,)
+        return (self._file, self._error_file)
+
+    def _should_flush(self) -> bool:
+        """缓冲的字节数或记录数达到上限"""
+        return any(
+            f.size >= _FLUSH_BYTES or len(f.chunks) >= _WRITEV_MAX for f in self._files()
+        )
+
+    def _day_of(self, created: float) -> str:
+        """获取时间戳所在日期的字符串，跨过午夜时才重新计算
+
+        Args:
+            created: 记录的时间戳
+
+        Returns:
+            日期字符串 YYYY-MM-DD
+        """
+        if not (self._day_start <= created < self._day_end):
+            dt = datetime.fromtimestamp(created)
+            start = datetime(dt.year, dt.month, dt.day)
+            self._day_start = start.timestamp()
+            self._day_end = (start + timedelta(days=1)).timestamp()
+            self._day = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        return self._day
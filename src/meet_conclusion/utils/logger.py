@@ -1,82 +1,401 @@
 """日志管理模块
 
-使用loguru实现日志记录，支持文件和控制台输出
+调试模式下使用loguru实现日志记录，支持文件和控制台输出；
+非调试模式下换用标准库 logging（QueueHandler -> QueueListener），
+省去 loguru 每条记录的调用栈检查和颜色标记解析
 """
 
+import atexit
+import logging
+import queue
+import re
 import sys
+import weakref
+from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-
-from loguru import logger
+from typing import Optional
 
 from meet_conclusion.config import get_config
+from meet_conclusion.utils.log_writer import DailyFileHandler, QueuedFileSink
+
+# 日志格式模板。时间由 _patch_time 预先格式化后放入 extra，
+# 模板本身不含 {time:...} 记号，loguru 只需解析一次
+_LOG_FORMAT = (
+    "<green>{extra[time_full]}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>\n{exception}"
+)
+
+# 简单格式（用于控制台）
+_SIMPLE_FORMAT = (
+    "<green>{extra[time_short]}</green> | "
+    "<level>{level: <8}</level> | "
+    "<level>{message}</level>\n{exception}"
+)
+
+# 去掉颜色标记的控制台格式，输出不是终端时使用，loguru 无需再处理颜色标记
+_SIMPLE_FORMAT_PLAIN = re.sub(r"</?[a-z]+>", "", _SIMPLE_FORMAT)
+
+# 标准库 logging 后端的格式（时间由 _StdlibFormatter 格式化）
+_STDLIB_LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+_STDLIB_SIMPLE_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
+
+# 文件格式中不变的部分，预先编码为 bytes，写入线程直接拼接（与 _STDLIB_LOG_FORMAT 一致）
+_SEP_BYTES = b" | "
+_LEVEL_BYTES = {
+    level: f"{logging.getLevelName(level): <8}".encode()
+    for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+}
+
+# 标准库 logging 后端的队列上限，写满时丢弃最旧的记录
+_STDLIB_QUEUE_SIZE = 10000
+
+# 是否输出调试日志（由 setup_logger 按配置设置）。
+# 热路径上的调试日志写成 `if logger_module.DEBUG: logger.debug(f"...")`，
+# 关闭时连参数（f-string 插值、属性访问）都不会求值；需读取模块属性，不能 from-import
+DEBUG = False
+
+# loguru 的 logger，首次使用时才导入（loguru 的导入链较长，拖慢启动）
+_logger = None
+
+# 当前使用的文件输出，重新配置时先关闭旧的写入线程
+_file_sinks: list[QueuedFileSink] = []
+
+# 是否使用标准库 logging 后端（由 setup_logger 按配置设置）
+_use_stdlib = False
+
+# 标准库 logging 后端的队列处理器和监听线程
+_queue_handler: Optional["_DroppingQueueHandler"] = None
+_listener: Optional["_FlushingQueueListener"] = None
+
+# 已创建的 logger 代理，切换后端时清除它们缓存的方法
+_proxies: "weakref.WeakSet[_LazyLogger]" = weakref.WeakSet()
+
+# 最近一次格式化的秒级时间：(秒级时间戳, "YYYY-MM-DD HH:mm:ss")，同一秒内的记录直接复用
+_second_cache: tuple[int, str] = (-1, "")
+
+
+def _format_second(timestamp: float) -> str:
+    """格式化到秒的时间字符串（带缓存）"""
+    global _second_cache
+    second = int(timestamp)
+    cached_second, text = _second_cache
+    if second != cached_second:
+        dt = datetime.fromtimestamp(second)
+        text = (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
+        _second_cache = (second, text)
+    return text
+
+
+def _patch_time(record: dict) -> None:
+    """为记录预先生成格式化时间，供各输出的格式模板直接引用"""
+    dt = record["time"]
+    text = _format_second(dt.timestamp())
+    record["extra"]["time_full"] = f"{text}.{dt.microsecond // 1000:03d}"
+    record["extra"]["time_short"] = text[11:]
+
+
+def _get_loguru():
+    """获取 loguru 的 logger（首次调用时导入）"""
+    global _logger
+    if _logger is None:
+        from loguru import logger
+        _logger = logger
+    return _logger
+
+
+class _StdlibLogger:
+    """标准库 logging 后端的 logger 适配器
+
+    提供与 loguru 相同的调用方式（含 "{}" 占位参数），
+    直接构造记录交给 logging，不查找调用位置
+    """
+
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(name)
+
+    def _log(self, level: int, message: str, args: tuple, kwargs: dict, exc_info=None) -> None:
+        logger = self._logger
+        if not logger.isEnabledFor(level):
+            return
+        if args or kwargs:
+            message = message.format(*args, **kwargs)
+        record = logger.makeRecord(logger.name, level, "", 0, message, (), exc_info)
+        logger.handle(record)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.DEBUG, message, args, kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.INFO, message, args, kwargs)
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.WARNING, message, args, kwargs)
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.ERROR, message, args, kwargs)
+
+    def critical(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.CRITICAL, message, args, kwargs)
+
+    def exception(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.ERROR, message, args, kwargs, exc_info=sys.exc_info())
+
+
+class _StdlibFormatter(logging.Formatter):
+    """标准库 logging 后端的格式化器，时间格式与 loguru 输出一致"""
+
+    def __init__(self, fmt: str, short_time: bool = False):
+        super().__init__(fmt)
+        self._short_time = short_time
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        text = _format_second(record.created)
+        if self._short_time:
+            return text[11:]
+        return f"{text}.{int(record.msecs):03d}"
+
+
+class _FileFormatter(_StdlibFormatter):
+    """文件日志格式化器，直接生成编码好的一行（含换行符）
+
+    常见记录（标准级别、异常已由 QueueHandler 并入消息）按预先编码的模板拼接 bytes，
+    不经过格式字符串和整行的 str；其他情况回退到常规格式化
+    """
+
+    def __init__(self):
+        super().__init__(_STDLIB_LOG_FORMAT)
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        level = _LEVEL_BYTES.get(record.levelno)
+        if level is None or record.exc_info or record.stack_info:
+            return (self.format(record) + "\n").encode("utf-8")
+        return b"".join((
+            self.formatTime(record).encode(), _SEP_BYTES,
+            level, _SEP_BYTES,
+            _encode_name(record.name), _SEP_BYTES,
+            record.getMessage().encode("utf-8"), b"\n",
+        ))
+
+
+@lru_cache(maxsize=256)
+def _encode_name(name: str) -> bytes:
+    """编码 logger 名称（带缓存）"""
+    return name.encode("utf-8")
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """写满时丢弃最旧记录的 QueueHandler，日志调用方不会阻塞"""
+
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+
+class _FlushingQueueListener(QueueListener):
+    """处理完队列后写出各处理器缓冲区的 QueueListener
+
+    DailyFileHandler 只在队列为空时写出缓冲区，而 stop() 放入的结束标记会让
+    最后几条记录停留在缓冲区中，因此停止后再统一 flush 一次
+    """
+
+    def stop(self) -> None:
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
+
+class _LazyLogger:
+    """延迟导入 loguru 的 logger 代理
+
+    模块导入时调用 get_logger 只创建代理，第一次访问日志方法时才导入 loguru
+    （或创建标准库 logging 适配器）并绑定名称；取到的方法缓存在实例上，
+    之后的调用直接命中，不再经过代理
+    """
+
+    def __init__(self, name: str = None):
+        self._name = name
+        _proxies.add(self)
+
+    def __getattr__(self, attr: str):
+        if _use_stdlib:
+            target = _StdlibLogger(self._name or "meet_conclusion")
+        else:
+            target = _get_loguru()
+            if self._name:
+                target = target.bind(name=self._name)
+        value = getattr(target, attr)
+        setattr(self, attr, value)
+        return value
+
+    def _reset(self) -> None:
+        """清除缓存的方法，下次访问时按当前后端重新获取"""
+        name = self._name
+        self.__dict__.clear()
+        self._name = name
+
+
+def _log_format(record: dict) -> str:
+    """文件日志格式"""
+    return _LOG_FORMAT
+
+
+def _simple_format(record: dict) -> str:
+    """控制台日志格式"""
+    return _SIMPLE_FORMAT
+
+
+def _simple_format_plain(record: dict) -> str:
+    """控制台日志格式（无颜色）"""
+    return _SIMPLE_FORMAT_PLAIN
 
 
 def setup_logger() -> None:
-    """配置日志系统"""
+    """配置日志系统
+
+    调试模式使用 loguru（输出调用位置，便于排查问题），否则使用标准库 logging
+    """
+    global DEBUG, _use_stdlib
     config = get_config()
+    DEBUG = config.debug
+
+    _close_file_sinks()
+    _use_stdlib = not config.debug
+    for proxy in list(_proxies):
+        proxy._reset()
+
+    if _use_stdlib:
+        _setup_stdlib(config)
+    else:
+        _setup_loguru(config)
+
+    get_logger(__name__).info(f"日志系统初始化完成，日志目录: {config.logs_dir}")
+
+
+def _setup_loguru(config) -> None:
+    """配置 loguru 后端"""
+    logger = _get_loguru()
 
     # 移除默认处理器
     logger.remove()
 
-    # 日志格式
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-        "<level>{message}</level>"
-    )
-
-    # 简单格式（用于控制台）
-    simple_format = (
-        "<green>{time:HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<level>{message}</level>"
-    )
+    # 每条记录只格式化一次时间，所有输出共用
+    logger.configure(patcher=_patch_time)
 
-    # 控制台输出
+    # 控制台输出；重定向到文件或管道时不着色
+    colorize = sys.stderr.isatty()
     logger.add(
         sys.stderr,
-        format=simple_format,
+        format=_simple_format if colorize else _simple_format_plain,
         level="DEBUG" if config.debug else "INFO",
-        colorize=True,
+        colorize=colorize,
     )
 
-    # 文件输出 - 常规日志
-    log_file = config.logs_dir / "app_{time:YYYY-MM-DD}.log"
-    logger.add(
-        str(log_file),
-        format=log_format,
-        level="DEBUG",
-        rotation="00:00",  # 每天轮转
-        retention="30 days",  # 保留30天
-        encoding="utf-8",
-        enqueue=True,  # 异步写入
+    # 文件输出（有界队列 + 后台线程写入，每天轮转，保留30天）；
+    # ERROR 及以上的记录在写入线程中同时写入错误日志，不再单独格式化和排队
+    file_sink = QueuedFileSink(
+        config.logs_dir, "app", retention_days=30, error_prefix="error"
     )
+    logger.add(file_sink, format=_log_format, level="DEBUG")
+    _file_sinks.append(file_sink)
 
-    # 文件输出 - 错误日志
-    error_log_file = config.logs_dir / "error_{time:YYYY-MM-DD}.log"
-    logger.add(
-        str(error_log_file),
-        format=log_format,
-        level="ERROR",
-        rotation="00:00",
-        retention="30 days",
-        encoding="utf-8",
-        enqueue=True,
+
+def _setup_stdlib(config) -> None:
+    """配置标准库 logging 后端
+
+    调用线程只把记录放入有界队列，格式化和写入都在 QueueListener 线程中完成
+    """
+    global _queue_handler, _listener
+
+    # 格式中不含调用位置、线程和进程信息，创建记录时无需收集
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
+    record_queue: queue.Queue = queue.Queue(maxsize=_STDLIB_QUEUE_SIZE)
+
+    # 控制台输出
+    console = logging.StreamHandler(sys.stderr)
+    console.setFormatter(_StdlibFormatter(_STDLIB_SIMPLE_FORMAT, short_time=True))
+
+    # 文件输出（每天轮转，保留30天，ERROR 及以上同时写入错误日志）；
+    # 队列中还有记录时先攒着，空闲时一次写出
+    file_handler = DailyFileHandler(
+        config.logs_dir, "app", retention_days=30, error_prefix="error",
+        is_idle=record_queue.empty,
     )
+    file_handler.setFormatter(_FileFormatter())
+
+    _listener = _FlushingQueueListener(record_queue, console, file_handler)
+    _listener.start()
+
+    _queue_handler = _DroppingQueueHandler(record_queue)
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(logging.INFO)
 
-    logger.info(f"日志系统初始化完成，日志目录: {config.logs_dir}")
 
+def flush_logs() -> None:
+    """等待排队中的日志全部写入文件"""
+    for sink in _file_sinks:
+        sink.flush()
+    if _listener is not None:
+        # QueueListener 没有单独的 flush，停止时会处理完队列中的记录并写出缓冲区
+        _listener.stop()
+        _listener.start()
 
+
+@atexit.register
+def _close_file_sinks() -> None:
+    """写完剩余日志并停止文件写入线程"""
+    global _queue_handler, _listener
+    while _file_sinks:
+        _file_sinks.pop().close()
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        if _queue_handler.dropped:
+            print(f"日志队列写满，丢弃了 {_queue_handler.dropped} 条记录", file=sys.stderr)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+@lru_cache(maxsize=256)
 def get_logger(name: str = None):
     """获取logger实例
 
+    同名的绑定 logger 可以互换使用，按名称缓存，重复获取不再新建；
+    返回的是代理，第一次写日志时才导入 loguru 或创建标准库 logging 适配器
+
     Args:
         name: 模块名称，用于日志上下文
 
     Returns:
         logger实例
     """
-    if name:
-        return logger.bind(name=name)
-    return logger
+    return _LazyLogger(name)
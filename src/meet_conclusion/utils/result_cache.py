@@ -0,0 +1,156 @@
+"""结果缓存模块
+
+基于 SQLite 的持久化 LRU 缓存，用于缓存远程服务（ASR 等）的返回结果；
+以及进程内的内存 LRU 缓存，用于缓存数据库查询等本地结果
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Generic, Hashable, Optional, TypeVar
+
+import orjson
+
+from meet_conclusion.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ResultCache:
+    """持久化 LRU 结果缓存
+
+    以字符串为键、JSON 可序列化对象为值，按最近访问时间淘汰
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 2048):
+        """初始化
+
+        Args:
+            db_path: 缓存数据库文件路径
+            max_entries: 最大缓存条目数，超出后淘汰最久未访问的条目
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, json BLOB NOT NULL, ts INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_ts ON cache (ts)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """读取缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的值，未命中返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # 更新访问时间
+            self._conn.execute(
+                "UPDATE cache SET ts = ? WHERE key = ?", (time.time_ns(), key)
+            )
+            self._conn.commit()
+
+        try:
+            return orjson.loads(row[0])
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"缓存数据损坏，已忽略: {key} - {e}")
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """写入缓存
+
+        Args:
+            key: 缓存键
+            value: JSON 可序列化的值
+        """
+        data = orjson.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, json, ts) VALUES (?, ?, ?)",
+                (key, data, time.time_ns()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """淘汰超出容量的最久未访问条目（调用方需持有锁）"""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY ts LIMIT ?)",
+                (overflow,),
+            )
+            logger.debug(f"缓存淘汰 {overflow} 条")
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """关闭缓存数据库"""
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryCache(Generic[K, V]):
+    """线程安全的进程内 LRU 缓存"""
+
+    def __init__(self, max_entries: int = 256):
+        """初始化
+
+        Args:
+            max_entries: 最大缓存条目数，超出后淘汰最久未访问的条目
+        """
+        self.max_entries = max_entries
+        self._items: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """读取缓存，未命中返回 None"""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """写入缓存"""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key: Optional[K] = None) -> None:
+        """使缓存失效
+
+        Args:
+            key: 缓存键，None 表示清空全部缓存
+        """
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)